@@ -0,0 +1,380 @@
+"""
+api/cache.py
+Begrenzter In-Memory-Cache (LRU + TTL) für API-Antworten.
+Bounded in-memory cache (LRU + TTL) for API responses.
+
+Der Cache begrenzt Anzahl und Gesamtgröße der Einträge, verdrängt den am längsten nicht genutzten Eintrag (LRU),
+verwirft abgelaufene Einträge beim Zugriff sowie periodisch bei Schreibzugriffen und ist threadsicher.
+Einträge können Tags tragen (z.B. 'user:3', 'movie:7'); invalidate_tags() entfernt alle Einträge eines Tags.
+The cache bounds the number and total size of its entries, evicts the least recently used entry (LRU),
+drops expired entries on access as well as periodically on writes, and is thread-safe.
+Entries can carry tags (e.g. 'user:3', 'movie:7'); invalidate_tags() removes all entries of a tag.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional
+from api.compression import precompress
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024 # 32 MB
+DEFAULT_TTL = 300 # 5 minutes; writes only invalidate in the writing process / 5 Minuten; Schreibzugriffe invalidieren nur im schreibenden Prozess
+SHARED_DEFAULT_TTL = 3600 # 1 hour for the sqlite backend, whose tag invalidations reach every worker / 1 Stunde für das sqlite-Backend, dessen Tag-Invalidierungen jeden Worker erreichen
+DEFAULT_SWEEP_INTERVAL = 60 # Seconds between full expiry sweeps / Sekunden zwischen vollständigen Ablauf-Durchläufen
+
+# Backends für API_CACHE_BACKEND / Backends for API_CACHE_BACKEND
+CACHE_BACKEND_MEMORY = 'memory' # Per process / Pro Prozess
+CACHE_BACKEND_SQLITE = 'sqlite' # Shared by all worker processes of a node / Von allen Worker-Prozessen eines Knotens geteilt
+CACHE_BACKENDS = (CACHE_BACKEND_MEMORY, CACHE_BACKEND_SQLITE)
+
+# Pauschaler Aufschlag pro Eintrag (Schlüssel, Verwaltung) / Flat overhead per entry (key, bookkeeping)
+ENTRY_OVERHEAD_BYTES = 200
+
+class CachedResponse:
+    """
+    Eine fertig serialisierte Antwort: Body-Bytes, Status, Content-Type und starkes ETag (Hash des Bodys), dazu die
+    beim Füllen des Caches komprimierten Varianten des Bodys (z.B. {'gzip': ...}), damit Treffer nicht erneut komprimieren.
+    Jeder Treffer baut daraus ein neues Response-Objekt, statt ein geteiltes Objekt erneut auszuliefern.
+    A fully serialized response: body bytes, status, content type and a strong ETag (hash of the body), plus the
+    body's variants compressed when the cache was filled (e.g. {'gzip': ...}), so hits do not compress again.
+    Every hit builds a fresh Response object from it instead of re-sending a shared object.
+    """
+    __slots__ = ('body', 'status', 'content_type', 'etag', 'encodings')
+
+    def __init__(self, body: bytes, status: int, content_type: str, etag: Optional[str] = None,
+                 encodings: Optional[Dict[str, bytes]] = None):
+        self.body = body
+        self.status = status
+        self.content_type = content_type
+        self.etag = etag or hashlib.blake2b(body, digest_size=16).hexdigest() # Given when loaded from a shared backend / Angegeben beim Laden aus einem geteilten Backend
+        self.encodings = encodings or {}
+
+    @classmethod
+    def from_response(cls, response) -> 'CachedResponse':
+        """
+        Erstellt den Eintrag aus einer (nicht gestreamten, unkomprimierten) Flask-Antwort und komprimiert ihn vorab.
+        Creates the entry from a (non-streamed, uncompressed) Flask response and precompresses it.
+        """
+        body = response.get_data()
+        return cls(body, response.status_code, response.content_type, encodings=precompress(body, response.mimetype))
+
+    @property
+    def size(self) -> int:
+        """
+        Bytes von Body, Varianten und Metadaten. / Bytes of body, variants and metadata.
+        """
+        return (len(self.body) + sum(len(variant) for variant in self.encodings.values())
+                + len(self.etag) + len(self.content_type or ''))
+
+    def __repr__(self):
+        return f"<CachedResponse status={self.status} bytes={len(self.body)} encodings={sorted(self.encodings)} etag={self.etag}>"
+
+def estimate_size(value: Any) -> int:
+    """
+    Schätzt die Größe eines gecachten Werts in Bytes. CachedResponse zählt mit Body und komprimierten Varianten,
+    Flask-Antworten mit ihrem Body, Tupel (z.B. (response, status)) mit der Summe ihrer Elemente.
+    Estimates the size of a cached value in bytes. CachedResponse counts with its body and compressed variants,
+    Flask responses with their body, tuples (e.g. (response, status)) with the sum of their items.
+    """
+    if isinstance(value, CachedResponse):
+        return value.size
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    if isinstance(value, (tuple, list)):
+        return sum(estimate_size(item) for item in value)
+    if hasattr(value, 'get_data') and not getattr(value, 'is_streamed', False):
+        return len(value.get_data())
+    return 64 # Small scalars such as status codes / Kleine Skalare wie Statuscodes
+
+class CacheBackend(ABC):
+    """
+    CacheBackend
+    Abstraktes Interface für die Backends des API-Antwort-Caches (siehe cache_response in api/routes.py).
+    Abstract interface for the backends of the API response cache (see cache_response in api/routes.py).
+    """
+
+    @property
+    @abstractmethod
+    def generation(self) -> int:
+        """
+        Zähler, der bei jeder Invalidierung steigt; siehe set(generation=...).
+        Counter that increases on every invalidation; see set(generation=...).
+        """
+        pass
+
+    @abstractmethod
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Liefert den Wert zu `key` oder `default`, wenn er fehlt oder abgelaufen ist.
+        Returns the value for `key`, or `default` if it is missing or expired.
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, tags: Iterable[str] = (),
+            generation: Optional[int] = None) -> bool:
+        """
+        Speichert `value` mit TTL und Tags; nicht, wenn seit `generation` invalidiert wurde. Gibt zurück, ob gespeichert wurde.
+        Stores `value` with TTL and tags; not if an invalidation happened since `generation`. Returns whether it was stored.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> bool:
+        """
+        Entfernt `key`. / Removes `key`.
+        """
+        pass
+
+    @abstractmethod
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """
+        Entfernt alle Einträge mit einem der Tags und gibt ihre Anzahl zurück.
+        Removes all entries carrying any of the tags and returns their number.
+        """
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Leert den Cache. / Empties the cache.
+        """
+        pass
+
+    @abstractmethod
+    def sweep(self) -> int:
+        """
+        Entfernt abgelaufene Einträge und gibt ihre Anzahl zurück.
+        Removes expired entries and returns their number.
+        """
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """
+        Liefert Zähler und Füllstand für das Monitoring.
+        Returns counters and fill level for monitoring.
+        """
+        pass
+
+class LRUTTLCache(CacheBackend):
+    """
+    Threadsicherer LRU-Cache mit TTL pro Eintrag sowie Obergrenzen für Anzahl und Bytes.
+    Thread-safe LRU cache with a TTL per entry and limits on entry count and bytes.
+
+    Args:
+        max_entries (int): Maximale Anzahl Einträge. / Maximum number of entries.
+        max_bytes (int): Maximale geschätzte Gesamtgröße; größere Einzelwerte werden nicht gecacht.
+                         Maximum estimated total size; single values larger than this are not cached.
+        default_ttl (float): Standard-Lebensdauer in Sekunden. / Default time to live in seconds.
+        sweep_interval (float): Mindestabstand zwischen vollständigen Ablauf-Durchläufen in Sekunden.
+                                Minimum time between full expiry sweeps in seconds.
+        sizeof (callable, optional): Größenschätzung pro Wert; Standard ist estimate_size.
+                                     Size estimate per value; defaults to estimate_size.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES,
+                 default_ttl: float = DEFAULT_TTL, sweep_interval: float = DEFAULT_SWEEP_INTERVAL,
+                 sizeof: Optional[Callable[[Any], int]] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.sweep_interval = sweep_interval
+        self._sizeof = sizeof or estimate_size
+        self._entries = OrderedDict() # key -> (expires_at, size, value, tags), least recently used first
+        self._keys_by_tag = {} # tag -> set of keys
+        self._lock = threading.RLock()
+        self._bytes = 0
+        self._last_sweep = time.monotonic()
+        self._generation = 0 # Incremented on every invalidation / Wird bei jeder Invalidierung erhöht
+        self._hits = self._misses = self._evictions = self._expirations = self._invalidations = 0
+
+    @property
+    def generation(self) -> int:
+        """
+        Zähler, der bei jeder Invalidierung steigt; siehe set(generation=...).
+        Counter that increases on every invalidation; see set(generation=...).
+        """
+        return self._generation
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Liefert den Wert zu `key` oder `default`, wenn er fehlt oder abgelaufen ist (abgelaufene Einträge werden entfernt).
+        Returns the value for `key`, or `default` if it is missing or expired (expired entries are removed).
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return default
+            if entry[0] <= time.monotonic():
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[2]
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, tags: Iterable[str] = (),
+            generation: Optional[int] = None) -> bool:
+        """
+        Speichert `value` unter `key` mit den Tags `tags` und verdrängt bei Bedarf die am längsten nicht genutzten Einträge.
+        Ist `generation` angegeben (vor dem Berechnen des Werts gelesen) und wurde seitdem invalidiert,
+        wird der möglicherweise veraltete Wert nicht gespeichert.
+        Stores `value` under `key` with the tags `tags`, evicting the least recently used entries as needed.
+        If `generation` is given (read before computing the value) and an invalidation happened since,
+        the possibly stale value is not stored.
+
+        Returns:
+            bool: False, wenn der Wert nicht gecacht wurde (zu groß oder veraltet).
+                  False if the value was not cached (too large or stale).
+        """
+        size = self._sizeof(value) + ENTRY_OVERHEAD_BYTES
+        tags = frozenset(tags)
+        now = time.monotonic()
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes or (generation is not None and generation != self._generation):
+                return False
+            if now - self._last_sweep >= self.sweep_interval:
+                self._sweep(now)
+            while self._entries and (len(self._entries) >= self.max_entries or self._bytes + size > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+            self._entries[key] = (now + (self.default_ttl if ttl is None else ttl), size, value, tags)
+            for tag in tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+            self._bytes += size
+            return True
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """
+        Entfernt alle Einträge, die einen der Tags tragen, und gibt ihre Anzahl zurück.
+        Removes all entries carrying any of the tags and returns their number.
+        """
+        with self._lock:
+            self._generation += 1
+            keys = set()
+            for tag in tags:
+                keys.update(self._keys_by_tag.get(tag, ()))
+            for key in keys:
+                self._remove(key)
+            self._invalidations += len(keys)
+            return len(keys)
+
+    def delete(self, key: str) -> bool:
+        """
+        Entfernt `key`; gibt True zurück, wenn er vorhanden war.
+        Removes `key`; returns True if it was present.
+        """
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            return True
+
+    def clear(self) -> None:
+        """
+        Leert den Cache; die Zähler bleiben erhalten.
+        Empties the cache; the counters are kept.
+        """
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._keys_by_tag.clear()
+            self._bytes = 0
+
+    def sweep(self) -> int:
+        """
+        Entfernt alle abgelaufenen Einträge und gibt ihre Anzahl zurück.
+        Removes all expired entries and returns their number.
+        """
+        with self._lock:
+            return self._sweep(time.monotonic())
+
+    def stats(self) -> dict:
+        """
+        Liefert Zähler und Füllstand für das Monitoring.
+        Returns counters and fill level for monitoring.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'backend': CACHE_BACKEND_MEMORY,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'tags': len(self._keys_by_tag),
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_ratio': round(self._hits / lookups, 4) if lookups else None,
+                'evictions': self._evictions,
+                'expirations': self._expirations,
+                'invalidations': self._invalidations,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[0] > time.monotonic()
+
+    def _remove(self, key: str) -> None:
+        # Caller holds the lock / Aufrufer hält die Sperre
+        _, size, _, tags = self._entries.pop(key)
+        self._bytes -= size
+        for tag in tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    def _sweep(self, now: float) -> int:
+        # Caller holds the lock / Aufrufer hält die Sperre
+        expired = [key for key, entry in self._entries.items() if entry[0] <= now]
+        for key in expired:
+            self._remove(key)
+        self._expirations += len(expired)
+        self._last_sweep = now
+        return len(expired)
+
+def create_cache_from_env() -> CacheBackend:
+    """
+    Erstellt das Cache-Backend aus API_CACHE_BACKEND ('memory' oder 'sqlite', Standard 'memory') mit Grenzen aus
+    API_CACHE_MAX_ENTRIES, API_CACHE_MAX_BYTES, API_CACHE_TTL und API_CACHE_SWEEP_INTERVAL (Standardwerte siehe oben).
+    Ohne API_CACHE_TTL lebt ein Eintrag im Memory-Backend DEFAULT_TTL, im SQLite-Backend SHARED_DEFAULT_TTL Sekunden:
+    nur dort erreichen Invalidierungen alle Worker-Prozesse. Das SQLite-Backend legt seine Datei unter API_CACHE_PATH ab.
+    Creates the cache backend from API_CACHE_BACKEND ('memory' or 'sqlite', default 'memory') with limits from
+    API_CACHE_MAX_ENTRIES, API_CACHE_MAX_BYTES, API_CACHE_TTL and API_CACHE_SWEEP_INTERVAL (defaults see above).
+    Without API_CACHE_TTL an entry lives DEFAULT_TTL seconds in the memory backend and SHARED_DEFAULT_TTL seconds in
+    the SQLite backend: only there do invalidations reach every worker process. The SQLite backend keeps its file at
+    API_CACHE_PATH.
+
+    Raises:
+        ValueError: Bei unbekanntem Backend. / For an unknown backend.
+    """
+    backend = os.getenv('API_CACHE_BACKEND', CACHE_BACKEND_MEMORY).strip().lower()
+    default_ttl = SHARED_DEFAULT_TTL if backend == CACHE_BACKEND_SQLITE else DEFAULT_TTL
+    limits = dict(
+        max_entries=int(os.getenv('API_CACHE_MAX_ENTRIES', DEFAULT_MAX_ENTRIES)),
+        max_bytes=int(os.getenv('API_CACHE_MAX_BYTES', DEFAULT_MAX_BYTES)),
+        default_ttl=float(os.getenv('API_CACHE_TTL', default_ttl)),
+        sweep_interval=float(os.getenv('API_CACHE_SWEEP_INTERVAL', DEFAULT_SWEEP_INTERVAL)),
+    )
+    if backend == CACHE_BACKEND_MEMORY:
+        return LRUTTLCache(**limits)
+    if backend == CACHE_BACKEND_SQLITE:
+        from api.sqlite_cache import SQLiteCacheBackend, default_cache_path # Imported lazily, it builds on this module / Verzögert importiert, baut auf diesem Modul auf
+        return SQLiteCacheBackend(os.getenv('API_CACHE_PATH') or default_cache_path(), **limits)
+    raise ValueError(f"Unknown API_CACHE_BACKEND '{backend}'. Valid backends: {', '.join(CACHE_BACKENDS)}.")
@@ -0,0 +1,152 @@
+"""
+api/circuit_breaker.py
+Circuit Breaker für externe Dienste (OMDb): nach zu vielen Fehlschlägen werden Aufrufe für eine Weile sofort
+abgelehnt, statt jeden Worker-Thread bis zum Timeout warten zu lassen.
+Circuit breaker for external services (OMDb): after too many failures calls are rejected immediately for a while,
+instead of letting every worker thread wait for the timeout.
+
+Zustände / States:
+    closed:    Aufrufe laufen durch; die Ergebnisse der letzten `window` Aufrufe werden gezählt. Ab `min_calls`
+               Aufrufen und einer Fehlerquote >= `failure_rate` öffnet der Breaker.
+               Calls pass; the outcomes of the last `window` calls are counted. From `min_calls` calls and a
+               failure rate >= `failure_rate` the breaker opens.
+    open:      Aufrufe scheitern sofort mit CircuitOpenError, bis `open_seconds` vergangen sind.
+               Calls fail at once with CircuitOpenError until `open_seconds` have passed.
+    half_open: Ein einzelner Probeaufruf wird durchgelassen; Erfolg schließt den Breaker, ein Fehler öffnet ihn erneut.
+               A single trial call is let through; success closes the breaker, a failure opens it again.
+
+Der Zustand gilt pro Worker-Prozess. / The state is per worker process.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional, TypeVar
+import requests
+
+T = TypeVar('T')
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """
+    Der Breaker ist offen; der Dienst wurde nicht aufgerufen. Als RequestException behandeln bestehende
+    Fehlerzweige der Aufrufer sie wie einen Verbindungsfehler.
+    The breaker is open; the service was not called. As a RequestException, existing error branches of callers
+    treat it like a connection error.
+    """
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"{name} is temporarily unavailable (circuit open), retry in {retry_after:.0f} s.")
+        self.retry_after = retry_after
+
+def is_service_failure(error: BaseException) -> bool:
+    """
+    Ob eine Ausnahme auf einen gestörten Dienst hinweist: Timeouts, Verbindungsfehler, 429 und 5xx, ungültige
+    Antworten. Andere 4xx beschreiben die Anfrage und zählen nicht.
+    Whether an exception indicates a failing service: timeouts, connection errors, 429 and 5xx, invalid
+    responses. Other 4xx describe the request and do not count.
+    """
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        return error.response.status_code == 429 or error.response.status_code >= 500
+    return isinstance(error, (requests.exceptions.RequestException, ValueError))
+
+class CircuitBreaker:
+    """
+    Threadsicherer Circuit Breaker mit Fehlerquote über ein gleitendes Fenster der letzten Aufrufe.
+    Thread-safe circuit breaker with a failure rate over a sliding window of the last calls.
+    """
+
+    def __init__(self, name: str, window: int = 20, min_calls: int = 5, failure_rate: float = 0.5,
+                 open_seconds: float = 30.0, is_failure: Callable[[BaseException], bool] = is_service_failure):
+        self.name = name
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.open_seconds = open_seconds
+        self.is_failure = is_failure
+        self._lock = threading.Lock()
+        self._outcomes = deque(maxlen=window) # True = failure / True = Fehlschlag
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._trial_running = False
+        self.opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            self._state = HALF_OPEN
+            self._trial_running = False
+        return self._state
+
+    def _acquire(self) -> None:
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return
+            self.rejected += 1
+            retry_after = max(self.open_seconds - (time.monotonic() - self._opened_at), 1.0)
+            raise CircuitOpenError(self.name, retry_after)
+
+    def _record(self, failure: bool) -> None:
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._trial_running = False
+                if failure:
+                    self._open()
+                else:
+                    self._state = CLOSED
+                    self._outcomes.clear()
+                return
+            self._outcomes.append(failure)
+            failures = sum(self._outcomes)
+            if (self._state == CLOSED and len(self._outcomes) >= self.min_calls
+                    and failures >= self.failure_rate * len(self._outcomes)):
+                self._open()
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        self.opened += 1
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """
+        Führt `fn` aus, wenn der Breaker es zulässt, und zählt das Ergebnis.
+        Runs `fn` if the breaker allows it and counts the outcome.
+
+        Raises:
+            CircuitOpenError: Wenn der Breaker offen ist. / If the breaker is open.
+        """
+        self._acquire()
+        try:
+            result = fn()
+        except BaseException as e:
+            self._record(self.is_failure(e))
+            raise
+        self._record(False)
+        return result
+
+    def stats(self) -> dict:
+        with self._lock:
+            state = self._current_state()
+            retry_after: Optional[float] = None
+            if state == OPEN:
+                retry_after = round(max(self.open_seconds - (time.monotonic() - self._opened_at), 0.0), 1)
+            return {
+                'state': state,
+                'recent_calls': len(self._outcomes),
+                'recent_failures': sum(self._outcomes),
+                'times_opened': self.opened,
+                'rejected': self.rejected,
+                'retry_after': retry_after,
+            }
@@ -0,0 +1,121 @@
+"""
+api/compression.py
+HTTP-Kompression (gzip, brotli falls installiert) für Antworten der Anwendung, mit Aushandlung über Accept-Encoding.
+HTTP compression (gzip, brotli when installed) for the application's responses, negotiated via Accept-Encoding.
+
+brotli ist optional (pip install brotli). Komprimiert werden nur textartige Antworten ab COMPRESSION_MIN_SIZE Bytes;
+gecachte API-Antworten bringen ihre beim Füllen des Caches komprimierten Varianten mit (siehe CachedResponse) und
+werden hier nicht erneut komprimiert.
+brotli is optional (pip install brotli). Only text-like responses of at least COMPRESSION_MIN_SIZE bytes are compressed;
+cached API responses carry their variants compressed when the cache was filled (see CachedResponse) and are
+not compressed again here.
+"""
+
+import gzip
+import os
+from typing import Dict, Iterable, Optional
+from flask import Flask, request
+from werkzeug.datastructures import Accept
+
+try:
+    import brotli
+except ImportError: # Optional dependency / Optionale Abhängigkeit
+    brotli = None
+
+# Kleinere Antworten passen ohnehin in wenige TCP-Pakete / Smaller responses fit into a few TCP packets anyway
+COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', 1024))
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+# In order of server preference / In Reihenfolge der Server-Präferenz
+SUPPORTED_ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+_COMPRESSIBLE_MIMETYPES = frozenset({
+    'application/json', 'application/x-ndjson', 'application/javascript', 'application/xml', 'image/svg+xml',
+})
+
+def is_compressible(mimetype: Optional[str], size: int) -> bool:
+    """
+    Ob sich eine Antwort dieses Typs und dieser Größe zu komprimieren lohnt.
+    Whether a response of this type and size is worth compressing.
+    """
+    if size < COMPRESSION_MIN_SIZE or not mimetype:
+        return False
+    mimetype = mimetype.split(';', 1)[0].strip().lower()
+    return mimetype.startswith('text/') or mimetype in _COMPRESSIBLE_MIMETYPES
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """
+    Komprimiert `data` mit 'gzip' oder 'br'. / Compresses `data` with 'gzip' or 'br'.
+
+    Raises:
+        ValueError: Bei einer nicht unterstützten Kodierung. / For an unsupported encoding.
+    """
+    if encoding == 'gzip':
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0) # mtime=0: identical bytes for identical input / identische Bytes bei identischer Eingabe
+    if encoding == 'br' and brotli is not None:
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    raise ValueError(f"Unsupported content encoding '{encoding}'.")
+
+def precompress(data: bytes, mimetype: Optional[str]) -> Dict[str, bytes]:
+    """
+    Alle unterstützten komprimierten Varianten von `data`, die tatsächlich kleiner sind; leer, wenn sich
+    Kompression nicht lohnt.
+    All supported compressed variants of `data` that are actually smaller; empty if compression is not worthwhile.
+    """
+    if not is_compressible(mimetype, len(data)):
+        return {}
+    variants = {}
+    for encoding in SUPPORTED_ENCODINGS:
+        compressed = compress(data, encoding)
+        if len(compressed) < len(data):
+            variants[encoding] = compressed
+    return variants
+
+def negotiate_encoding(accept_encodings: Accept, available: Iterable[str] = SUPPORTED_ENCODINGS) -> Optional[str]:
+    """
+    Wählt aus `available` (in Server-Präferenz) die Kodierung mit der höchsten Qualität laut Accept-Encoding.
+    Chooses from `available` (in server preference) the encoding with the highest quality according to Accept-Encoding.
+
+    Returns:
+        str or None: Die Kodierung, oder None für die unkomprimierte Antwort. / The encoding, or None for the uncompressed response.
+    """
+    best, best_quality = None, 0
+    for encoding in available:
+        quality = accept_encodings.quality(encoding)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+def _compress_response(response):
+    """
+    after_request-Hook: komprimiert passende Antworten, die noch keine Content-Encoding haben. Gestreamte
+    Antworten bleiben unkomprimiert, damit ihre ersten Bytes sofort gesendet werden.
+    after_request hook: compresses suitable responses that have no Content-Encoding yet. Streamed
+    responses stay uncompressed so their first bytes are sent immediately.
+    """
+    if (response.direct_passthrough or response.is_streamed or 'Content-Encoding' in response.headers
+            or response.status_code < 200 or response.status_code in (204, 206, 304)):
+        return response
+    if not is_compressible(response.mimetype, response.content_length or 0):
+        return response
+    response.vary.add('Accept-Encoding')
+    encoding = negotiate_encoding(request.accept_encodings)
+    if encoding is None:
+        return response
+    compressed = compress(response.get_data(), encoding)
+    if len(compressed) >= response.content_length:
+        return response
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = encoding
+    # A strong ETag identifies the uncompressed bytes / Ein starkes ETag bezeichnet die unkomprimierten Bytes
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+def init_compression(app: Flask) -> None:
+    """
+    Aktiviert die Antwort-Kompression für `app`. / Enables response compression for `app`.
+    """
+    app.after_request(_compress_response)
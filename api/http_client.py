@@ -0,0 +1,170 @@
+"""
+api/http_client.py
+Gemeinsamer Client für ausgehende HTTP-Aufrufe (OMDb, OpenRouter): Connection-Pools pro Host mit Keep-Alive,
+begrenzte Wiederholungen mit Backoff und Jitter bei 429/5xx, getrennte Connect-/Read-Timeouts und Pool-Statistiken.
+Shared client for outbound HTTP calls (OMDb, OpenRouter): per-host connection pools with keep-alive,
+bounded retries with jittered backoff on 429/5xx, separate connect/read timeouts and pool statistics.
+
+Jeder Host wird einmal mit register_host() angemeldet (Timeout, wiederholbare Methoden). Die Session wird pro
+Prozess angelegt; per fork() geerbte Verbindungen (z.B. vom Gunicorn-Master) werden nie wiederverwendet.
+Every host is registered once with register_host() (timeout, retryable methods). The session is created per
+process; connections inherited through fork() (e.g. from the gunicorn master) are never reused.
+"""
+
+import os
+import threading
+from collections import Counter
+from typing import Collection, Dict, Optional, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', 10)) # Kept-alive connections per host / Offengehaltene Verbindungen pro Host
+HTTP_MAX_RETRIES = int(os.getenv('HTTP_MAX_RETRIES', 2)) # Retries after the first attempt / Wiederholungen nach dem ersten Versuch
+HTTP_BACKOFF_FACTOR = 0.5 # First retry at once, then 1 s, 2 s, ... (Retry-After takes precedence) / Erste Wiederholung sofort, dann 1 s, 2 s, ... (Retry-After hat Vorrang)
+HTTP_BACKOFF_JITTER = 0.3 # Up to 0.3 s random extra delay per retry / Bis zu 0,3 s zufällige Zusatzverzögerung pro Wiederholung
+HTTP_BACKOFF_MAX = 10 # Seconds, also the upper limit for Retry-After / Sekunden, auch die Obergrenze für Retry-After
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+DEFAULT_TIMEOUT = (3.05, 10) # (connect, read) in seconds / (Connect, Read) in Sekunden
+
+_hosts: Dict[str, dict] = {} # Base URL -> {'timeout', 'retry_methods'} / Basis-URL -> {'timeout', 'retry_methods'}
+_lock = threading.Lock()
+_session: Optional[requests.Session] = None
+_session_pid: Optional[int] = None
+_retries = Counter() # Host -> retries in this process / Host -> Wiederholungen in diesem Prozess
+
+class _CountingRetry(Retry):
+    """
+    Retry, die jede Wiederholung pro Host für stats() zählt und Retry-After auf HTTP_BACKOFF_MAX begrenzt, damit ein
+    429/503 einen Anfragepfad nicht minutenlang blockiert.
+    Retry that counts every retry per host for stats() and caps Retry-After at HTTP_BACKOFF_MAX, so a 429/503 cannot
+    stall a request path for minutes.
+    """
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if _pool is not None:
+            _retries[_pool.host] += 1
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        return min(retry_after, HTTP_BACKOFF_MAX) if retry_after is not None else None
+
+def _adapter(retry_methods: Collection[str]) -> HTTPAdapter:
+    retry = _CountingRetry(
+        total=HTTP_MAX_RETRIES,
+        # Only connection errors and RETRY_STATUSES: a read timeout is raised at once (as requests' ReadTimeout), so a
+        # hung call blocks for one read timeout only / Nur Verbindungsfehler und RETRY_STATUSES: ein Read-Timeout wird
+        # sofort ausgelöst (als ReadTimeout von requests), ein hängender Aufruf blockiert also nur einen Read-Timeout lang
+        read=False,
+        other=0,
+        allowed_methods=frozenset(method.upper() for method in retry_methods),
+        status_forcelist=RETRY_STATUSES,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        backoff_jitter=HTTP_BACKOFF_JITTER,
+        backoff_max=HTTP_BACKOFF_MAX,
+        raise_on_status=False # The last response is returned; callers use raise_for_status() / Die letzte Antwort wird zurückgegeben; Aufrufer nutzen raise_for_status()
+    )
+    return HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retry)
+
+def register_host(base_url: str, timeout: Tuple[float, float] = DEFAULT_TIMEOUT,
+                  retry_methods: Collection[str] = IDEMPOTENT_METHODS) -> None:
+    """
+    Meldet einen Host mit eigenem Connection-Pool an.
+    Registers a host with its own connection pool.
+
+    Args:
+        base_url (str): Präfix der URLs, z.B. 'https://openrouter.ai/'. / Prefix of the URLs, e.g. 'https://openrouter.ai/'.
+        timeout (tuple): Standard-Timeout (Connect, Read) in Sekunden. / Default timeout (connect, read) in seconds.
+        retry_methods (collection): Methoden, die bei 429/5xx wiederholt werden; Verbindungsfehler werden für alle
+                                    Methoden wiederholt, da dann nichts gesendet wurde. Lesefehler nie.
+                                    Methods retried on 429/5xx; connection errors are retried for all methods, as
+                                    nothing was sent then. Read errors never are.
+    """
+    with _lock:
+        _hosts[base_url] = {'timeout': timeout, 'retry_methods': frozenset(retry_methods)}
+        if _session is not None and _session_pid == os.getpid():
+            _session.mount(base_url, _adapter(retry_methods))
+
+def get_session() -> requests.Session:
+    """
+    Liefert die Session dieses Prozesses (threadsicher, Pools pro angemeldetem Host).
+    Returns this process's session (thread-safe, pools per registered host).
+    """
+    global _session, _session_pid
+    session = _session
+    if session is not None and _session_pid == os.getpid():
+        return session
+    with _lock:
+        if _session is None or _session_pid != os.getpid():
+            session = requests.Session()
+            session.mount('http://', _adapter(IDEMPOTENT_METHODS))
+            session.mount('https://', _adapter(IDEMPOTENT_METHODS))
+            for base_url, config in _hosts.items():
+                session.mount(base_url, _adapter(config['retry_methods']))
+            _session, _session_pid = session, os.getpid()
+            _retries.clear()
+        return _session
+
+def _default_timeout(url: str) -> Tuple[float, float]:
+    for base_url, config in _hosts.items():
+        if url.startswith(base_url):
+            return config['timeout']
+    return DEFAULT_TIMEOUT
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    """
+    Wie requests.request, über die gepoolte Session und mit dem Standard-Timeout des Hosts.
+    Like requests.request, via the pooled session and with the host's default timeout.
+
+    Raises:
+        requests.exceptions.RequestException: Wie requests. / As requests does.
+    """
+    kwargs.setdefault('timeout', _default_timeout(url))
+    return get_session().request(method, url, **kwargs)
+
+def get(url: str, **kwargs) -> requests.Response:
+    """
+    GET über die gepoolte Session. / GET via the pooled session.
+    """
+    return request('GET', url, **kwargs)
+
+def post(url: str, **kwargs) -> requests.Response:
+    """
+    POST über die gepoolte Session. / POST via the pooled session.
+    """
+    return request('POST', url, **kwargs)
+
+def stats() -> dict:
+    """
+    Pool-Statistiken dieses Prozesses: pro Host geöffnete Verbindungen, gesendete Anfragen und Wiederholungen.
+    Verbindungen < Anfragen bedeutet, dass Keep-Alive Verbindungen wiederverwendet.
+    Pool statistics of this process: per host opened connections, sent requests and retries.
+    Connections < requests means keep-alive is reusing connections.
+    """
+    hosts = {}
+    session = _session if _session_pid == os.getpid() else None
+    if session is not None:
+        for adapter in set(session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                hosts[f'{pool.scheme}://{pool.host}:{pool.port}'] = {
+                    'connections_opened': pool.num_connections,
+                    'requests': pool.num_requests,
+                    # The queue holds None placeholders for not yet opened slots / Die Queue enthält None-Platzhalter für noch nicht geöffnete Plätze
+                    'idle_connections': sum(conn is not None for conn in list(pool.pool.queue)) if pool.pool is not None else 0,
+                    'retries': _retries.get(pool.host, 0),
+                }
+    return {
+        'pid': os.getpid(),
+        'pool_maxsize': HTTP_POOL_MAXSIZE,
+        'max_retries': HTTP_MAX_RETRIES,
+        'registered_hosts': {base_url: {'timeout': list(config['timeout']), 'retry_methods': sorted(config['retry_methods'])}
+                             for base_url, config in _hosts.items()},
+        'hosts': hosts,
+    }
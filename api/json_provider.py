@@ -0,0 +1,68 @@
+"""
+api/json_provider.py
+Flask-JSON-Provider, der orjson verwendet, wenn es installiert ist, und sonst auf die Standardbibliothek zurückfällt.
+Flask JSON provider that uses orjson when it is installed and falls back to the standard library otherwise.
+
+orjson ist optional (pip install orjson). Die Ausgabe entspricht dem Standard-Provider (sortierte Schlüssel,
+kompakt bzw. eingerückt im Debug-Modus, Datumswerte als HTTP-Datum), nur Nicht-ASCII-Zeichen werden als UTF-8
+statt als \\u-Escapes geschrieben.
+orjson is optional (pip install orjson). The output matches the default provider (sorted keys, compact or
+indented in debug mode, datetimes as HTTP dates); only non-ASCII characters are written as UTF-8 instead of \\u escapes.
+"""
+
+import typing as t
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError: # Optional dependency / Optionale Abhängigkeit
+    orjson = None
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    JSON-Provider mit orjson-Encoder und Fallback auf DefaultJSONProvider (json der Standardbibliothek).
+    Aufrufe mit zusätzlichen json-Argumenten (z.B. indent=4) laufen immer über die Standardbibliothek.
+    JSON provider with an orjson encoder and fallback to DefaultJSONProvider (standard library json).
+    Calls with extra json arguments (e.g. indent=4) always go through the standard library.
+    """
+
+    use_orjson = orjson is not None
+
+    def _orjson_options(self, indent: bool = False) -> int:
+        # Datetimes go through self.default (HTTP date) like in the default provider
+        # Datumswerte laufen wie im Standard-Provider über self.default (HTTP-Datum)
+        options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps(self, obj: t.Any, **kwargs: t.Any) -> str:
+        """
+        Serialisiert `obj` zu einem JSON-String. / Serializes `obj` to a JSON string.
+        """
+        if not self.use_orjson or kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._orjson_options()).decode('utf-8')
+
+    def loads(self, s: t.Union[str, bytes], **kwargs: t.Any) -> t.Any:
+        """
+        Deserialisiert JSON aus String oder Bytes. / Deserializes JSON from a string or bytes.
+        """
+        if not self.use_orjson or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: t.Any, **kwargs: t.Any) -> Response:
+        """
+        Wie DefaultJSONProvider.response, mit orjson werden die Bytes direkt ohne Umweg über str in die Antwort geschrieben.
+        Like DefaultJSONProvider.response; with orjson the bytes go straight into the response without a detour through str.
+        """
+        if not self.use_orjson:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = orjson.dumps(obj, default=self.default, option=self._orjson_options(indent) | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
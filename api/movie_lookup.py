@@ -0,0 +1,45 @@
+"""
+api/movie_lookup.py
+Filmsuche mit dem lokalen IMDb-Katalog zuerst (siehe import_imdb.py); OMDb wird dann nur noch per IMDb-ID gefragt
+und bei Ausfall einfach weggelassen.
+Movie lookup with the local IMDb catalog first (see import_imdb.py); OMDb is then only asked by IMDb ID and is
+simply left out when it fails.
+"""
+
+from typing import Optional
+import requests
+from flask import current_app
+from datamanager.sqlite_data_manager import SQLiteDataManager
+from api.omdb_client import fetch_omdb
+
+data_manager = SQLiteDataManager()
+
+def lookup_movie(title: Optional[str] = None, imdb_id: Optional[str] = None, year: Optional[int] = None,
+                 plot: str = 'short') -> dict:
+    """
+    Film nach Titel oder IMDb-ID im OMDb-Format. Ist der Film eindeutig im lokalen Katalog (per IMDb-ID oder Titel und
+    Jahr, siehe get_local_catalog_entry(unique=True)), wird OMDb nur per IMDb-ID (meist aus dem persistenten OMDb-Cache)
+    gefragt; dessen Felder haben Vorrang, der Katalog füllt die Lücken. Sonst (auch bei einem Titel ohne Jahr oder
+    mehrdeutigem Treffer) wie fetch_omdb.
+    Movie by title or IMDb ID in the OMDb format. If the movie is uniquely in the local catalog (by IMDb ID or title and
+    year, see get_local_catalog_entry(unique=True)), OMDb is only asked by IMDb ID (usually from the persistent OMDb
+    cache); its fields win and the catalog fills the gaps. Otherwise (also for a title without a year or an ambiguous
+    match) like fetch_omdb.
+
+    Raises:
+        requests.exceptions.RequestException, ValueError: Wie fetch_omdb, nur wenn der Film nicht lokal bekannt ist.
+                                                          As fetch_omdb, only if the movie is not known locally.
+    """
+    local_entry = data_manager.get_local_catalog_entry(title=title, imdb_id=imdb_id, year=year, unique=True)
+    if local_entry is None:
+        return fetch_omdb(title=title, imdb_id=imdb_id, year=str(year) if year else None, plot=plot)
+
+    omdb_data = None
+    try:
+        omdb_data = fetch_omdb(imdb_id=local_entry['imdbID'], plot=plot)
+    except (requests.exceptions.RequestException, ValueError) as e:
+        # Local details are complete enough to continue without poster and plot / Lokale Details reichen, um ohne Poster und Handlung fortzufahren
+        current_app.logger.warning(f"OMDb enrichment failed for {local_entry['imdbID']}, using the local catalog only: {e}")
+    if omdb_data and omdb_data.get('Response') == 'True':
+        return data_manager.merge_local_catalog_entry(local_entry, omdb_data)
+    return {'Poster': 'N/A', 'Plot': 'N/A', **local_entry}
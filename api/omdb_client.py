@@ -0,0 +1,212 @@
+"""
+api/omdb_client.py
+OMDb-Abfragen mit persistentem Cache (Tabelle omdb_cache), gemeinsam genutzt von add_movie, /api/omdb_proxy
+und /api/check_or_create_movie_by_imdb.
+OMDb lookups with a persistent cache (table omdb_cache), shared by add_movie, /api/omdb_proxy
+and /api/check_or_create_movie_by_imdb.
+
+Schlüssel sind die normalisierte Anfrage: 'i:<imdb_id>:<plot>' für IMDb-IDs, 't:<titel>:<jahr>:<plot>' für Titel
+(Kleinschreibung, Leerzeichen zusammengefasst). Eine per Titel gefundene Antwort wird zusätzlich unter ihrer IMDb-ID
+gespeichert. Gecacht werden Treffer (OMDB_CACHE_TTL) und "nicht gefunden"-Antworten (OMDB_NEGATIVE_CACHE_TTL),
+nie Fehler wie ein ungültiger API-Schlüssel oder ein erreichtes Tageslimit. Eine TTL von 0 schaltet den Cache ab.
+Keys are the normalized request: 'i:<imdb_id>:<plot>' for IMDb IDs, 't:<title>:<year>:<plot>' for titles
+(lowercase, whitespace collapsed). A response found by title is also stored under its IMDb ID. Hits
+(OMDB_CACHE_TTL) and "not found" answers (OMDB_NEGATIVE_CACHE_TTL) are cached, never errors such as an
+invalid API key or a reached daily limit. A TTL of 0 disables the cache.
+
+Gleichzeitige identische Anfragen (gleicher Schlüssel) innerhalb eines Worker-Prozesses teilen sich einen
+OMDb-Aufruf und sein Ergebnis (Singleflight); Zähler dazu liefert stats().
+Concurrent identical requests (same key) within a worker process share one OMDb call and its result
+(singleflight); stats() returns the counters for it.
+
+Ein Circuit Breaker (api/circuit_breaker.py) lehnt OMDb-Aufrufe nach gehäuften Timeouts, Verbindungs- und
+5xx-Fehlern für OMDB_BREAKER_OPEN_SECONDS sofort mit CircuitOpenError ab; gecachte Antworten bleiben verfügbar.
+A circuit breaker (api/circuit_breaker.py) rejects OMDb calls immediately with CircuitOpenError for
+OMDB_BREAKER_OPEN_SECONDS after repeated timeouts, connection and 5xx errors; cached answers stay available.
+"""
+
+import copy
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+from dotenv import load_dotenv
+from flask import current_app
+from datamanager.sqlite_data_manager import SQLiteDataManager
+from api import http_client
+from api.circuit_breaker import CircuitBreaker
+
+load_dotenv()
+OMDB_API_KEY = os.getenv('OMDB_API_KEY')
+OMDB_URL = 'http://www.omdbapi.com/'
+OMDB_TIMEOUT = (3.05, 10) # (connect, read) in seconds / (Connect, Read) in Sekunden
+
+OMDB_CACHE_TTL = int(os.getenv('OMDB_CACHE_TTL', 7 * 24 * 3600)) # Found movies, 7 days / Gefundene Filme, 7 Tage
+OMDB_NEGATIVE_CACHE_TTL = int(os.getenv('OMDB_NEGATIVE_CACHE_TTL', 3600)) # "Not found" answers, 1 hour / "Nicht gefunden"-Antworten, 1 Stunde
+OMDB_BREAKER_OPEN_SECONDS = float(os.getenv('OMDB_BREAKER_OPEN_SECONDS', 30)) # Fast-fail period after OMDb failures / Schnell-Abbruch-Dauer nach OMDb-Fehlern
+
+# Error texts of OMDb that describe the request, not the service state / Fehlertexte von OMDb, die die Anfrage beschreiben, nicht den Dienstzustand
+_NOT_FOUND_ERRORS = frozenset({'Movie not found!', 'Incorrect IMDb ID.'})
+
+data_manager = SQLiteDataManager()
+
+def is_not_found(payload: dict) -> bool:
+    """
+    Ob OMDb geantwortet hat, dass es den Film nicht gibt (statt eines Dienstfehlers wie "Invalid API key!").
+    Whether OMDb answered that the movie does not exist (rather than a service error such as "Invalid API key!").
+    """
+    return payload.get('Response') != 'True' and payload.get('Error') in _NOT_FOUND_ERRORS
+
+class _Call:
+    """
+    Ein laufender OMDb-Aufruf, auf den weitere Threads warten. / An OMDb call in flight that other threads wait for.
+    """
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class _SingleFlight:
+    """
+    Führt pro Schlüssel höchstens einen Aufruf gleichzeitig aus; wer währenddessen denselben Schlüssel anfragt,
+    wartet und erhält dasselbe Ergebnis bzw. dieselbe Ausnahme.
+    Runs at most one call per key at a time; whoever asks for the same key meanwhile waits and receives the same
+    result or the same exception.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], dict]) -> Tuple[dict, bool]:
+        """
+        Returns:
+            tuple: (Ergebnis, ob es von einem anderen Thread geteilt wurde). / (result, whether it was shared by another thread).
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+        try:
+            call.result = fn()
+            return call.result, False
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'executed': self.executed, 'coalesced': self.coalesced, 'in_flight': len(self._calls)}
+
+_flights = _SingleFlight()
+
+# Opens at >= 50 % failures among the last up to 20 calls (at least 5) / Öffnet bei >= 50 % Fehlschlägen unter den letzten bis zu 20 Aufrufen (mindestens 5)
+breaker = CircuitBreaker('OMDb', window=20, min_calls=5, failure_rate=0.5, open_seconds=OMDB_BREAKER_OPEN_SECONDS)
+
+# Pooled keep-alive connections, GET retried on 429/5xx / Gepoolte Keep-Alive-Verbindungen, GET bei 429/5xx wiederholt
+http_client.register_host(OMDB_URL, timeout=OMDB_TIMEOUT)
+
+def omdb_cache_key(title: Optional[str] = None, imdb_id: Optional[str] = None, year: Optional[str] = None,
+                   plot: str = 'short') -> str:
+    """
+    Normalisierter Cache-Schlüssel einer OMDb-Anfrage. Mit imdb_id entscheidet OMDb allein danach, Titel und Jahr
+    sind dann nicht Teil des Schlüssels.
+    Normalized cache key of an OMDb request. With an imdb_id OMDb decides by it alone, title and year are then
+    not part of the key.
+    """
+    if imdb_id:
+        return f"i:{imdb_id.strip().lower()}:{plot}"
+    return f"t:{' '.join((title or '').split()).casefold()}:{(year or '').strip()}:{plot}"
+
+def get_cached_omdb(title: Optional[str] = None, imdb_id: Optional[str] = None, year: Optional[str] = None,
+                    plot: str = 'short') -> Optional[dict]:
+    """
+    Liefert die gecachte, noch gültige OMDb-Antwort zu einer Anfrage ohne OMDb aufzurufen, sonst None.
+    Returns the cached, still valid OMDb response for a request without calling OMDb, otherwise None.
+    """
+    entry = data_manager.get_omdb_cache_entry(omdb_cache_key(title, imdb_id, year, plot))
+    if entry is None:
+        return None
+    ttl = OMDB_CACHE_TTL if entry.found else OMDB_NEGATIVE_CACHE_TTL
+    if ttl <= 0 or datetime.utcnow() - entry.fetched_at > timedelta(seconds=ttl):
+        return None
+    return current_app.json.loads(entry.payload)
+
+def fetch_omdb(title: Optional[str] = None, imdb_id: Optional[str] = None, year: Optional[str] = None,
+               plot: str = 'short', use_cache: bool = True) -> dict:
+    """
+    OMDb-Anfrage nach Titel (t) oder IMDb-ID (i), beantwortet aus dem persistenten Cache, solange die Antwort gültig ist.
+    OMDb request by title (t) or IMDb ID (i), answered from the persistent cache while the response is valid.
+    Concurrent identical requests share one outbound call. While the circuit breaker is open, OMDb is not called.
+    use_cache=False always asks OMDb (the answer still replaces the cached one), e.g. for the background refresh.
+
+    Returns:
+        dict: Die OMDb-Antwort (auch 'Response': 'False'). / The OMDb response (also 'Response': 'False').
+
+    Raises:
+        CircuitOpenError: Wenn der Circuit Breaker offen ist (eine RequestException). / If the circuit breaker is open (a RequestException).
+        requests.exceptions.RequestException: Bei Netzwerk- oder HTTP-Fehlern. / For network or HTTP errors.
+        ValueError: Wenn OMDb kein gültiges JSON liefert. / If OMDb does not return valid JSON.
+    """
+    cached = get_cached_omdb(title, imdb_id, year, plot) if use_cache else None
+    if cached is not None:
+        current_app.logger.debug(f"OMDb cache hit for '{imdb_id or title}'.")
+        return cached
+
+    cache_key = omdb_cache_key(title, imdb_id, year, plot)
+    payload, shared = _flights.do(cache_key, lambda: breaker.call(lambda: _request(title, imdb_id, year, plot, cache_key)))
+    if shared:
+        current_app.logger.debug(f"OMDb lookup for '{imdb_id or title}' coalesced with a request in flight.")
+        return copy.deepcopy(payload) # Every caller gets its own dict / Jeder Aufrufer erhält sein eigenes Dictionary
+    return payload
+
+def _request(title: Optional[str], imdb_id: Optional[str], year: Optional[str], plot: str, cache_key: str) -> dict:
+    params = {'apikey': OMDB_API_KEY, 'plot': plot}
+    if title:
+        params['t'] = title
+    if imdb_id:
+        params['i'] = imdb_id
+    if year:
+        params['y'] = year
+    response = http_client.get(OMDB_URL, params=params)
+    response.raise_for_status()
+    payload = response.json()
+    _store(payload, response.text, [cache_key], plot)
+    return payload
+
+def stats() -> dict:
+    """
+    OMDb-Zähler dieses Prozesses: Singleflight (ausgeführte, zusammengelegte, laufende Aufrufe) und Circuit Breaker.
+    OMDb counters of this process: singleflight (executed, coalesced, in-flight calls) and circuit breaker.
+    """
+    return {**_flights.stats(), 'circuit_breaker': breaker.stats()}
+
+def _store(payload: dict, raw: str, cache_keys: List[str], plot: str) -> None:
+    # Only answers about the movie itself are cached, not service errors / Nur Antworten über den Film selbst werden gecacht, keine Dienstfehler
+    if not isinstance(payload, dict):
+        return
+    found = payload.get('Response') == 'True'
+    if found and OMDB_CACHE_TTL > 0:
+        imdb_id = payload.get('imdbID')
+        if imdb_id:
+            cache_keys.append(omdb_cache_key(imdb_id=imdb_id, plot=plot))
+        data_manager.save_omdb_cache_entry(cache_keys, raw, True, imdb_id)
+    elif is_not_found(payload) and OMDB_NEGATIVE_CACHE_TTL > 0:
+        data_manager.save_omdb_cache_entry(cache_keys, raw, False)
@@ -0,0 +1,248 @@
+"""
+api/omdb_refresh.py
+Hintergrund-Aktualisierung von imdb_rating, imdb_votes und metascore: Die am längsten nicht aktualisierten Filme
+werden blockweise bei OMDb abgefragt (am Cache vorbei) und pro Block mit einem UPDATE geschrieben; last_refreshed_at
+hält den Zeitpunkt fest. Anfragen von Benutzern warten nie darauf.
+Background refresh of imdb_rating, imdb_votes and metascore: the movies refreshed longest ago are looked up at OMDb
+in batches (bypassing the cache) and written with one UPDATE per batch; last_refreshed_at records the time.
+User requests never wait for it.
+
+Kontingent / Quota: höchstens OMDB_REFRESH_DAILY_QUOTA OMDb-Aufrufe pro UTC-Tag (der Rest des Tageslimits des
+API-Schlüssels bleibt den Benutzern); nach "Request limit reached!" pausiert der Job OMDB_REFRESH_LIMIT_PAUSE Sekunden,
+bei offenem Circuit Breaker bis zum nächsten Lauf. Zähler und Pause liegen in der Datenbank (omdb_refresh_quota) und
+gelten für alle Prozesse, Neustarts und `flask refresh-omdb`; ein Token-Bucket pro Prozess verteilt die Aufrufe über den Tag.
+At most OMDB_REFRESH_DAILY_QUOTA OMDb calls per UTC day (the rest of the API key's daily limit is left to users);
+after "Request limit reached!" the job pauses for OMDB_REFRESH_LIMIT_PAUSE seconds, with an open circuit breaker until
+the next run. Count and pause live in the database (omdb_refresh_quota) and hold for all processes, restarts and
+`flask refresh-omdb`; a token bucket per process spreads the calls over the day.
+
+Der Job startet mit der ersten Anfrage eines Prozesses, wenn OMDB_REFRESH_INTERVAL > 0 ist. Von mehreren Prozessen
+(Gunicorn-Worker) arbeitet nur der, der die Sperrdatei OMDB_REFRESH_LOCK_PATH hält. Alternativ einmalig bzw.
+per Cron: `flask refresh-omdb`.
+The job starts with a process's first request if OMDB_REFRESH_INTERVAL > 0. Of several processes (gunicorn
+workers) only the one holding the lock file OMDB_REFRESH_LOCK_PATH works. Alternatively once or via cron:
+`flask refresh-omdb`.
+"""
+
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+import requests
+from flask import Flask, current_app
+from datamanager.sqlite_data_manager import SQLiteDataManager
+from api.circuit_breaker import CircuitOpenError
+from api.omdb_client import fetch_omdb, is_not_found
+
+try:
+    import fcntl
+except ImportError: # Not available on Windows: every process runs the job / Unter Windows nicht verfügbar: jeder Prozess führt den Job aus
+    fcntl = None
+
+OMDB_REFRESH_INTERVAL = int(os.getenv('OMDB_REFRESH_INTERVAL', 0)) # Seconds between batches, 0 = off / Sekunden zwischen Blöcken, 0 = aus
+OMDB_REFRESH_BATCH_SIZE = int(os.getenv('OMDB_REFRESH_BATCH_SIZE', 50)) # Movies per batch and transaction / Filme pro Block und Transaktion
+OMDB_REFRESH_MAX_AGE = int(os.getenv('OMDB_REFRESH_MAX_AGE', 7 * 24 * 3600)) # Refreshed longer ago = stale / Länger her = veraltet
+OMDB_REFRESH_DAILY_QUOTA = int(os.getenv('OMDB_REFRESH_DAILY_QUOTA', 500)) # Free OMDb keys allow 1000 calls per day / Kostenlose OMDb-Schlüssel erlauben 1000 Aufrufe pro Tag
+OMDB_REFRESH_LIMIT_PAUSE = int(os.getenv('OMDB_REFRESH_LIMIT_PAUSE', 3600)) # Pause after "Request limit reached!" / Pause nach "Request limit reached!"
+OMDB_REFRESH_LOCK_PATH = os.getenv('OMDB_REFRESH_LOCK_PATH', os.path.join(tempfile.gettempdir(), 'movieweb_omdb_refresh.lock'))
+
+_LIMIT_REACHED_ERROR = 'Request limit reached!'
+
+data_manager = SQLiteDataManager()
+
+class _TokenBucket:
+    """
+    Token-Bucket: füllt sich mit `per_day` Tokens pro Tag bis `capacity` auf; ein Token pro OMDb-Aufruf. Verteilt die
+    Aufrufe eines Prozesses nur über den Tag, das Tageskontingent selbst setzt die Datenbank durch.
+    Token bucket: refills with `per_day` tokens per day up to `capacity`; one token per OMDb call. Only spreads a
+    process's calls over the day, the daily quota itself is enforced by the database.
+    """
+
+    def __init__(self, per_day: int, capacity: int):
+        self.rate = per_day / 86400.0
+        self.capacity = max(capacity, 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def available(self) -> int:
+        with self._lock:
+            self._refill()
+            return int(self.tokens)
+
+    def take(self) -> bool:
+        with self._lock:
+            self._refill()
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+    def drain(self) -> None:
+        with self._lock:
+            self.tokens = 0.0
+            self.updated = time.monotonic()
+
+_quota = _TokenBucket(OMDB_REFRESH_DAILY_QUOTA, capacity=OMDB_REFRESH_BATCH_SIZE)
+_state = {'runs': 0, 'last_run_at': None, 'last_result': None}
+_state_lock = threading.Lock()
+_worker = {'pid': None, 'lock': None} # Process running the thread and its lock file / Prozess mit dem Thread und seine Sperrdatei
+
+def _field(payload: dict, key: str) -> Optional[str]:
+    # Stored like in add_movie_globally / Gespeichert wie in add_movie_globally
+    return (payload.get(key) or '').strip() or None
+
+def refresh_stale_movies(batch_size: int = OMDB_REFRESH_BATCH_SIZE, max_age: int = OMDB_REFRESH_MAX_AGE) -> dict:
+    """
+    Aktualisiert einen Block veralteter Filme. Muss innerhalb eines App-Kontexts aufgerufen werden.
+    Refreshes one batch of stale movies. Must be called inside an app context.
+
+    Returns:
+        dict: 'checked' (bei OMDb abgefragt / looked up at OMDb), 'updated' (geschrieben / written),
+              'not_found' (OMDb kennt die IMDb-ID nicht mehr / OMDb no longer knows the IMDb ID),
+              'stopped' (None, 'quota', 'paused', 'circuit_open' oder/or 'error').
+              Andere OMDb-Fehler als "nicht gefunden" beenden den Block mit 'error', der Film bleibt unverändert.
+              OMDb errors other than "not found" stop the batch with 'error', the movie is left untouched.
+    """
+    result = {'checked': 0, 'updated': 0, 'not_found': 0, 'stopped': None}
+    now = datetime.utcnow()
+    today = now.date()
+    quota = data_manager.get_omdb_refresh_quota(today)
+    if quota is None:
+        result['stopped'] = 'error'
+        return _finish(result)
+    if quota['paused_until'] is not None and now < quota['paused_until']:
+        result['stopped'] = 'paused'
+        return _finish(result)
+    budget = min(batch_size, _quota.available())
+    reserved = data_manager.reserve_omdb_refresh_calls(today, OMDB_REFRESH_DAILY_QUOTA, budget) if budget > 0 else 0
+    if reserved <= 0:
+        result['stopped'] = 'quota'
+        return _finish(result)
+
+    updates = []
+    calls, limit_reached = 0, False
+    for movie in data_manager.get_stale_movies(reserved, now - timedelta(seconds=max_age)):
+        if not _quota.take():
+            result['stopped'] = 'quota'
+            break
+        try:
+            payload = fetch_omdb(imdb_id=movie.imdb_id, use_cache=False)
+        except CircuitOpenError: # Rejected without calling OMDb / Ohne OMDb-Aufruf abgelehnt
+            result['stopped'] = 'circuit_open'
+            break
+        except (requests.exceptions.RequestException, ValueError) as e:
+            calls += 1 # The request may have reached OMDb / Die Anfrage hat OMDb möglicherweise erreicht
+            current_app.logger.warning(f"OMDb refresh of {movie.imdb_id} failed, stopping this batch: {e}")
+            result['stopped'] = 'error'
+            break
+        calls += 1
+        if payload.get('Error') == _LIMIT_REACHED_ERROR:
+            _quota.drain()
+            limit_reached = True
+            data_manager.pause_omdb_refresh(today, OMDB_REFRESH_DAILY_QUOTA,
+                                            datetime.utcnow() + timedelta(seconds=OMDB_REFRESH_LIMIT_PAUSE))
+            result['stopped'] = 'quota'
+            break
+        if payload.get('Response') != 'True' and not is_not_found(payload):
+            # Service-side error (invalid key, outage, ...): retry the movie in a later run / Dienstseitiger Fehler (ungültiger Schlüssel, Ausfall, ...): Film in einem späteren Lauf erneut versuchen
+            current_app.logger.warning(f"OMDb refresh of {movie.imdb_id} failed, stopping this batch: {payload.get('Error')}")
+            result['stopped'] = 'error'
+            break
+        result['checked'] += 1
+        if payload.get('Response') == 'True':
+            values = {'imdb_rating': _field(payload, 'imdbRating'), 'imdb_votes': _field(payload, 'imdbVotes'),
+                      'metascore': _field(payload, 'Metascore')}
+        else:
+            # Not found: keep the old values, but move the movie to the back of the queue / Nicht gefunden: alte Werte behalten, Film aber ans Ende der Warteschlange
+            result['not_found'] += 1
+            values = {'imdb_rating': movie.imdb_rating, 'imdb_votes': movie.imdb_votes, 'metascore': movie.metascore}
+        updates.append({'id': movie.id, **values, 'last_refreshed_at': datetime.utcnow()})
+
+    if not limit_reached: # The pause used up the whole day / Die Pause hat den ganzen Tag verbraucht
+        data_manager.release_omdb_refresh_calls(today, reserved - calls)
+    written = data_manager.update_movie_refresh_data(updates)
+    result['updated'] = max(written, 0)
+    if written < 0:
+        result['stopped'] = 'error'
+    return _finish(result)
+
+def _finish(result: dict) -> dict:
+    with _state_lock:
+        _state['runs'] += 1
+        _state['last_run_at'] = datetime.utcnow().isoformat()
+        _state['last_result'] = result
+    return result
+
+def stats() -> dict:
+    """
+    Zustand des Aktualisierungs-Jobs in diesem Prozess. / State of the refresh job in this process.
+    """
+    now = datetime.utcnow()
+    quota = data_manager.get_omdb_refresh_quota(now.date()) or {'calls': None, 'paused_until': None}
+    paused_for = (quota['paused_until'] - now).total_seconds() if quota['paused_until'] else 0.0
+    with _state_lock:
+        return {
+            'enabled': OMDB_REFRESH_INTERVAL > 0,
+            'running_here': _worker['lock'] is not None,
+            'runs': _state['runs'],
+            'last_run_at': _state['last_run_at'],
+            'last_result': _state['last_result'],
+            'quota_available': _quota.available(),
+            'calls_today': quota['calls'],
+            'daily_quota': OMDB_REFRESH_DAILY_QUOTA,
+            'paused_for': round(paused_for) if paused_for > 0 else None,
+        }
+
+def _acquire_lock():
+    """
+    Sperrdatei ohne Warten sperren; nur ein Prozess führt den Job aus. / Lock the lock file without waiting; only one process runs the job.
+    """
+    if fcntl is None:
+        return True
+    lock_file = open(OMDB_REFRESH_LOCK_PATH, 'a')
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError: # Held by another process / Von einem anderen Prozess gehalten
+        lock_file.close()
+        return None
+    return lock_file # Stays open (and locked) while the process lives / Bleibt offen (und gesperrt), solange der Prozess lebt
+
+def _run(app: Flask) -> None:
+    while True:
+        if _worker['lock'] is None:
+            _worker['lock'] = _acquire_lock()
+        if _worker['lock'] is not None:
+            with app.app_context():
+                try:
+                    result = refresh_stale_movies()
+                    if result['checked']:
+                        app.logger.info(f"OMDb refresh: {result}")
+                except Exception as e: # The job must survive any single failed batch / Der Job muss jeden einzelnen fehlgeschlagenen Block überleben
+                    app.logger.error(f"OMDb refresh batch failed: {e}")
+        time.sleep(OMDB_REFRESH_INTERVAL)
+
+def init_omdb_refresh(app: Flask) -> None:
+    """
+    Startet den Hintergrund-Job mit der ersten Anfrage jedes Prozesses (nicht im Reloader- oder Gunicorn-Master-Prozess),
+    wenn OMDB_REFRESH_INTERVAL > 0 ist.
+    Starts the background job with the first request of every process (not in the reloader or gunicorn master process)
+    if OMDB_REFRESH_INTERVAL > 0.
+    """
+    if OMDB_REFRESH_INTERVAL <= 0:
+        return
+
+    def start_once():
+        if _worker['pid'] == os.getpid():
+            return
+        _worker['pid'], _worker['lock'] = os.getpid(), None
+        threading.Thread(target=_run, args=(app,), name='omdb-refresh', daemon=True).start()
+
+    app.before_request(start_once)
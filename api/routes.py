@@ -4,15 +4,27 @@ API-Routen für die MovieWeb-Anwendung.
 API routes for the MovieWeb application.
 """
 
-from flask import Blueprint, jsonify, request, current_app
+from flask import Blueprint, jsonify, request, current_app, g, stream_with_context
 import requests # Hinzugefügt für OMDb-Anfrage
 import os # Hinzugefügt für os.getenv
 from dotenv import load_dotenv # Hinzugefügt für load_dotenv
 from datamanager.sqlite_data_manager import SQLiteDataManager
+from datamanager.pagination import InvalidCursorError, MAX_PAGE_LIMIT, clamp_limit
+from datamanager.cache_tags import USERS_TAG, CATALOG_TAG, ALL_TAG, user_tag, movie_tag, register_invalidation_listener
+from api.cache import CachedResponse, create_cache_from_env
+from api.compression import negotiate_encoding
+from api import omdb_client, omdb_refresh
+from api.omdb_client import fetch_omdb, get_cached_omdb
+from api.circuit_breaker import CircuitOpenError
+from api import http_client
+from api.serializers import (serialize_movie_summary, serialize_user_movie, serialize_comment,
+                             serialize_user_list_entry, movie_detail_serializer, MOVIE_SUMMARY_FIELDS,
+                             MOVIE_DETAIL_FIELDS)
 from functools import wraps
-import time
 from models import User, Movie, Comment
 import traceback
+import csv
+import io
 
 # Umgebungsvariablen laden (falls noch nicht global geschehen oder zur Sicherheit)
 load_dotenv()
@@ -25,19 +37,84 @@ api = Blueprint('api', __name__)
 # DataManager-Instanz
 data_manager = SQLiteDataManager()
 
-# Einfacher Cache für API-Antworten
-# Simple cache for API responses
-cache = {}
-CACHE_TIMEOUT = 300  # 5 minutes / 5 Minuten
+# Begrenzter LRU+TTL-Cache für API-Antworten (Grenzen über API_CACHE_* Umgebungsvariablen)
+# Bounded LRU+TTL cache for API responses (limits via API_CACHE_* environment variables)
+cache = create_cache_from_env()
+CACHE_TIMEOUT = cache.default_ttl
 
-def cache_response(timeout=CACHE_TIMEOUT):
+# Clients und Reverse-Proxy revalidieren per ETag (Standard), da Schreibzugriffe Antworten jederzeit invalidieren können;
+# API_CLIENT_MAX_AGE > 0 erlaubt ihnen, Antworten so viele Sekunden ungeprüft wiederzuverwenden.
+# Clients and reverse proxy revalidate via ETag (default), as writes may invalidate responses at any time;
+# API_CLIENT_MAX_AGE > 0 lets them reuse responses unchecked for that many seconds.
+API_CLIENT_MAX_AGE = int(os.getenv('API_CLIENT_MAX_AGE', 0))
+API_CACHE_CONTROL = f'public, max-age={API_CLIENT_MAX_AGE}' if API_CLIENT_MAX_AGE > 0 else 'public, no-cache'
+
+# Attribut von flask.g mit den Cache-Tags der laufenden Anfrage / Attribute of flask.g holding the cache tags of the current request
+_CACHE_TAGS_ATTR = '_api_cache_tags'
+
+def _invalidate_cached_responses(tags: frozenset) -> None:
+    """
+    Listener für committete DataManager-Änderungen: entfernt alle Antworten mit einem der Tags.
+    Listener for committed DataManager changes: removes all responses carrying any of the tags.
+    """
+    if ALL_TAG in tags:
+        cache.clear()
+    else:
+        cache.invalidate_tags(tags)
+
+register_invalidation_listener(_invalidate_cached_responses)
+
+# Maximale Anzahl Filme pro Bulk-Anfrage / Maximum number of movies per bulk request
+MAX_BULK_MOVIES = 1000
+
+def tag_response(*tags: str) -> None:
+    """
+    Fügt der gerade berechneten, gecachten Antwort weitere Cache-Tags hinzu (z.B. die Tags der gelisteten Filme).
+    Adds further cache tags to the cached response being computed (e.g. the tags of the listed movies).
     """
-    Decorator für das Caching von API-Antworten.
-    Decorator for caching API responses.
+    request_tags = g.get(_CACHE_TAGS_ATTR)
+    if request_tags is not None:
+        request_tags.update(tags)
+
+def _conditional_response(entry: CachedResponse):
+    """
+    Baut die Antwort aus einem Cache-Eintrag mit ETag und Cache-Control. Passt If-None-Match zum ETag
+    einer 200-Antwort, wird 304 Not Modified ohne Body geliefert. Akzeptiert der Client eine der vorab
+    komprimierten Varianten, wird diese ausgeliefert (mit schwachem ETag, da die Bytes abweichen).
+    Builds the response from a cache entry with ETag and Cache-Control. If If-None-Match matches the ETag
+    of a 200 response, 304 Not Modified is sent without a body. If the client accepts one of the
+    precompressed variants, that one is sent (with a weak ETag, as the bytes differ).
+    """
+    encoding = negotiate_encoding(request.accept_encodings, entry.encodings) if entry.encodings else None
+    if entry.status == 200 and request.if_none_match.contains_weak(entry.etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = current_app.response_class(entry.encodings[encoding] if encoding else entry.body,
+                                              status=entry.status, content_type=entry.content_type)
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+    if entry.encodings:
+        response.vary.add('Accept-Encoding')
+    response.set_etag(entry.etag, weak=encoding is not None)
+    response.headers['Cache-Control'] = API_CACHE_CONTROL
+    return response
+
+def cache_response(timeout=None, tags=None, unless=None):
+    """
+    Decorator für das Caching von API-Antworten. Gecacht werden die serialisierten Bytes samt ETag; Schlüssel
+    enthalten den Query-String, Clients mit passendem If-None-Match erhalten 304. Gecachte Antworten werden
+    entfernt, sobald der DataManager Änderungen an einem ihrer Tags committet.
+    Decorator for caching API responses. The serialized bytes are cached together with an ETag; keys
+    include the query string, clients with a matching If-None-Match get a 304. Cached responses are
+    removed as soon as the DataManager commits changes to one of their tags.
 
     Args:
-        timeout (int): Cache-Timeout in Sekunden.
-                      Cache timeout in seconds.
+        timeout (int, optional): Cache-Timeout in Sekunden; Standard ist CACHE_TIMEOUT.
+                                 Cache timeout in seconds; defaults to CACHE_TIMEOUT.
+        tags (callable, optional): Liefert aus den Routen-Argumenten die Tags der Antwort; weitere über tag_response().
+                                   Returns the response's tags from the route arguments; more via tag_response().
+        unless (callable, optional): Liefert True, wenn die aktuelle Anfrage am Cache vorbei beantwortet wird.
+                                     Returns True if the current request is answered bypassing the cache.
 
     Returns:
         function: Decorierte Funktion.
@@ -46,22 +123,29 @@ def cache_response(timeout=CACHE_TIMEOUT):
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            # Cache-Key aus Funktionsname und Argumenten erstellen
-            # Create cache key from function name and arguments
-            cache_key = f"{f.__name__}:{str(args)}:{str(kwargs)}"
+            if unless is not None and unless():
+                return f(*args, **kwargs)
+            # Cache-Key aus Funktionsname, Argumenten und Query-String (z.B. limit/cursor) erstellen
+            # Create cache key from function name, arguments and query string (e.g. limit/cursor)
+            cache_key = f"{f.__name__}:{str(args)}:{str(kwargs)}:{request.query_string.decode()}"
             
-            # Prüfen ob Antwort im Cache ist und noch gültig
-            # Check if response is in cache and still valid
-            if cache_key in cache:
-                timestamp, response = cache[cache_key]
-                if time.time() - timestamp < timeout:
-                    return response
+            # Gültige Antwort aus dem Cache liefern (abgelaufene Einträge verwirft der Cache selbst)
+            # Serve a valid response from the cache (the cache drops expired entries itself)
+            entry = cache.get(cache_key)
+            if entry is not None:
+                return _conditional_response(entry)
             
-            # Funktion ausführen und Ergebnis cachen
-            # Execute function and cache result
-            response = f(*args, **kwargs)
-            cache[cache_key] = (time.time(), response)
-            return response
+            # Funktion ausführen und Ergebnis serialisiert mit seinen Tags cachen; wurde währenddessen invalidiert, wird nicht gecacht
+            # Execute function and cache the serialized result with its tags; if an invalidation happened meanwhile, it is not cached
+            generation = cache.generation
+            setattr(g, _CACHE_TAGS_ATTR, set(tags(**kwargs)) if tags else set())
+            try:
+                response = current_app.make_response(f(*args, **kwargs))
+            finally:
+                response_tags = g.pop(_CACHE_TAGS_ATTR)
+            entry = CachedResponse.from_response(response)
+            cache.set(cache_key, entry, ttl=timeout, tags=response_tags, generation=generation)
+            return _conditional_response(entry)
         return decorated_function
     return decorator
 
@@ -82,6 +166,9 @@ def handle_api_error(f):
     def decorated_function(*args, **kwargs):
         try:
             return f(*args, **kwargs)
+        except InvalidCursorError as e:
+            # Beschädigter oder fremder Cursor ist ein Client-Fehler / A corrupted or foreign cursor is a client error
+            return jsonify({'success': False, 'message': str(e)}), 400
         except Exception as e:
             # Log API error for server-side diagnostics.
             # Logge API-Fehler für serverseitige Diagnose.
@@ -94,41 +181,179 @@ def handle_api_error(f):
             }), 500
     return decorated_function
 
+def _pagination_args():
+    """
+    Liest die Paging-Parameter ?limit= und ?cursor= aus der Anfrage. Das Limit wird auf 1..MAX_PAGE_LIMIT begrenzt.
+    Reads the paging parameters ?limit= and ?cursor= from the request. The limit is clamped to 1..MAX_PAGE_LIMIT.
+
+    Returns:
+        tuple: (limit, cursor, None) oder (None, None, Fehlermeldung).
+               (limit, cursor, None) or (None, None, error message).
+    """
+    limit_str = request.args.get('limit')
+    try:
+        limit = clamp_limit(int(limit_str) if limit_str else None)
+    except ValueError:
+        return None, None, f'Invalid limit. Must be an integer between 1 and {MAX_PAGE_LIMIT}.'
+    return limit, request.args.get('cursor') or None, None
+
+MOVIE_INCLUDES = ('comments',)
+EXPORT_FORMATS = ('ndjson', 'csv')
+EXPORT_BATCH_SIZE = 1000 # Rows per fetched batch and per written chunk / Zeilen pro geholtem Stapel und geschriebenem Block
+
+def _list_arg(name, allowed):
+    """
+    Liest einen kommagetrennten Parameter (z.B. ?fields=title,year) und prüft ihn gegen `allowed`.
+    Reads a comma-separated parameter (e.g. ?fields=title,year) and checks it against `allowed`.
+
+    Returns:
+        tuple: (Menge der Werte oder None, wenn der Parameter fehlt, None) oder (None, Fehlermeldung).
+               (set of values or None if the parameter is absent, None) or (None, error message).
+    """
+    raw = request.args.get(name)
+    if raw is None:
+        return None, None
+    values = {value.strip() for value in raw.split(',') if value.strip()}
+    unknown = sorted(values.difference(allowed))
+    if unknown:
+        return None, f"Invalid {name}: {', '.join(unknown)}. Allowed: {', '.join(allowed)}."
+    return values, None
+
+def _movie_fieldset_args():
+    """
+    Liest ?fields= und ?include= für /movies/<movie_id>. Ohne beide Parameter gilt die volle Form mit Kommentaren;
+    sobald einer angegeben ist, werden Kommentare nur mit include=comments geladen. 'id' ist immer enthalten.
+    Reads ?fields= and ?include= for /movies/<movie_id>. Without either parameter the full shape with comments
+    applies; as soon as one is given, comments are only loaded with include=comments. 'id' is always included.
+
+    Returns:
+        tuple: (Felder in kanonischer Reihenfolge, Kommentare laden?, None) oder (None, None, Fehlermeldung).
+               (fields in canonical order, load comments?, None) or (None, None, error message).
+    """
+    fields, error_message = _list_arg('fields', MOVIE_DETAIL_FIELDS)
+    if error_message:
+        return None, None, error_message
+    includes, error_message = _list_arg('include', MOVIE_INCLUDES)
+    if error_message:
+        return None, None, error_message
+    if fields is None:
+        fields = set(MOVIE_DETAIL_FIELDS)
+    fields.add('id')
+    if includes is None:
+        includes = set(MOVIE_INCLUDES) if request.args.get('fields') is None else set()
+    # Canonical order, so equal field sets share one compiled serializer
+    # Kanonische Reihenfolge, damit gleiche Feldmengen einen kompilierten Serialisierer teilen
+    return tuple(name for name in MOVIE_DETAIL_FIELDS if name in fields), 'comments' in includes, None
+
+def _ids_arg():
+    """
+    Liest ?ids=1,2,3 für Batch-Abfragen. Doppelte IDs werden entfernt, die angefragte Reihenfolge bleibt erhalten.
+    Reads ?ids=1,2,3 for batch reads. Duplicate IDs are removed, the requested order is kept.
+
+    Returns:
+        tuple: (Liste der IDs, None) oder (None, Fehlermeldung). / (list of IDs, None) or (None, error message).
+    """
+    try:
+        ids = list(dict.fromkeys(int(value) for value in request.args.get('ids', '').split(',') if value.strip()))
+    except ValueError:
+        return None, 'Invalid ids. Must be comma-separated integers.'
+    if not ids:
+        return None, 'No ids given.'
+    if len(ids) > MAX_PAGE_LIMIT:
+        return None, f'Too many ids. At most {MAX_PAGE_LIMIT} per request.'
+    return ids, None
+
+def _has_ids_arg() -> bool:
+    # Batch reads are cached per ID, not as a whole / Batch-Abfragen werden pro ID gecacht, nicht als Ganzes
+    return 'ids' in request.args
+
+def _cached_items(prefix: str, ids, load, tag):
+    """
+    Liefert die Elemente zu `ids` über Cache-Einträge pro ID ('<prefix>:<id>'). Fehlende Elemente lädt `load` in
+    einer Abfrage nach und sie werden mit dem Tag `tag(id)` gecacht, sodass jede Änderung nur ihre eigenen IDs invalidiert.
+    Returns the items for `ids` via cache entries per ID ('<prefix>:<id>'). Missing items are loaded by `load` in
+    one query and cached with the tag `tag(id)`, so every change invalidates only its own IDs.
+
+    Args:
+        prefix (str): Präfix der Cache-Schlüssel (inkl. Form, z.B. Feldliste). / Prefix of the cache keys (incl. shape, e.g. field list).
+        ids (list): Angefragte IDs. / Requested IDs.
+        load (callable): Liste von IDs -> {id: dict} für die gefundenen IDs. / List of IDs -> {id: dict} for the IDs found.
+        tag (callable): ID -> Cache-Tag. / ID -> cache tag.
+
+    Returns:
+        dict: {id: dict} für alle gefundenen IDs. / {id: dict} for all IDs found.
+    """
+    json_provider = current_app.json
+    items, missing = {}, []
+    for item_id in ids:
+        entry = cache.get(f'{prefix}:{item_id}')
+        if entry is not None:
+            items[item_id] = json_provider.loads(entry.body)
+        else:
+            missing.append(item_id)
+    if missing:
+        generation = cache.generation
+        for item_id, item in load(missing).items():
+            items[item_id] = item
+            entry = CachedResponse(json_provider.dumps(item).encode('utf-8'), 200, json_provider.mimetype)
+            cache.set(f'{prefix}:{item_id}', entry, tags=[tag(item_id)], generation=generation)
+    return items
+
 @api.route('/users')
 @handle_api_error
-@cache_response()
+@cache_response(tags=lambda: [USERS_TAG], unless=_has_ids_arg)
 def get_users():
     """
-    Gibt eine Liste aller Benutzer zurück.
-    Returns a list of all users.
+    Gibt eine Seite der Benutzerliste zurück (?limit=, ?cursor=), oder mit ?ids=1,2,3 genau diese Benutzer.
+    Returns one page of the user list (?limit=, ?cursor=), or with ?ids=1,2,3 exactly these users.
 
     Returns:
-        JSON: Liste der Benutzer mit ID, Name und Anzahl der Filme.
-              List of users with ID, name and movie count.
-    """
-    users_from_db = data_manager.get_all_users()
-    users_list = []
-    for user_obj in users_from_db:
-        # Die Logik für 'movie_count' bleibt hier, da sie spezifisch für diese API-Antwort ist.
-        # data_manager.get_all_users() liefert reine User-Objekte.
-        # Um movie_count effizient zu bekommen, müsste man UserMovie-Relationen laden.
-        # Alternativ könnte man die UserMovie-Relation in User vorladen (lazy='joined' oder subquery)
-        # oder eine spezifischere Methode im DataManager erstellen.
-        # Für jetzt belassen wir es bei len(user_obj.movies) direkt auf dem Objekt.
-        users_list.append({
-            'id': user_obj.id,
-            'name': user_obj.name,
-            'movie_count': len(user_obj.movies) # Requires user.movies to be loaded
-        })
+        JSON: Liste der Benutzer mit ID, Name und Anzahl der Filme sowie next_cursor.
+              List of users with ID, name and movie count plus next_cursor.
+    """
+    if _has_ids_arg():
+        return _get_users_by_ids()
+    limit, cursor, error_message = _pagination_args()
+    if error_message:
+        return jsonify({'success': False, 'message': error_message}), 400
+    users_page, next_cursor = data_manager.get_users_with_movie_counts_page(limit, cursor)
+
+    # Counts come from one aggregated query instead of loading every user's UserMovie rows
+    # Die Anzahlen stammen aus einer aggregierten Abfrage, statt die UserMovie-Zeilen jedes Benutzers zu laden
+    users_list = serialize_user_list_entry.many(users_page)
     current_app.logger.info(f"Successfully retrieved {len(users_list)} users for /api/users endpoint.")
     return jsonify({
         'success': True, # Added for consistency / Für Konsistenz hinzugefügt
-        'users': users_list
+        'users': users_list,
+        'limit': limit,
+        'next_cursor': next_cursor
     }), 200 # Explicitly set 200 OK / Explizit 200 OK setzen
 
+def _get_users_by_ids():
+    """
+    Batch-Abfrage für GET /users?ids=: eine IN-Abfrage für alle nicht gecachten IDs, Ergebnis in angefragter
+    Reihenfolge, null an der Stelle unbekannter IDs, die zusätzlich in not_found stehen.
+    Batch read for GET /users?ids=: one IN query for all IDs not cached, result in requested order,
+    null in place of unknown IDs, which are also listed in not_found.
+    """
+    user_ids, error_message = _ids_arg()
+    if error_message:
+        return jsonify({'success': False, 'message': error_message}), 400
+
+    def load(missing_ids):
+        rows = data_manager.get_users_with_movie_counts_by_ids(missing_ids)
+        return {row.id: user for row, user in zip(rows, serialize_user_list_entry.many(rows))}
+
+    users = _cached_items('user_item', user_ids, load, user_tag)
+    return jsonify({
+        'success': True,
+        'users': [users.get(user_id) for user_id in user_ids],
+        'not_found': [user_id for user_id in user_ids if user_id not in users]
+    }), 200
+
 @api.route('/users/<int:user_id>')
 @handle_api_error
-@cache_response()
+@cache_response(tags=lambda user_id: [user_tag(user_id)])
 def get_user(user_id):
     """
     Gibt Details eines bestimmten Benutzers zurück.
@@ -139,47 +364,45 @@ def get_user(user_id):
                       ID of the user.
 
     Returns:
-        JSON: Benutzerdetails mit Filmen.
-              User details with movies.
+        JSON: Benutzerdetails mit der ersten Seite seiner Filme; weitere Seiten über
+              /users/<user_id>/movies?cursor=<movies_next_cursor>.
+              User details with the first page of their movies; further pages via
+              /users/<user_id>/movies?cursor=<movies_next_cursor>.
 
     Raises:
         404: Wenn der Benutzer nicht gefunden wurde.
              If the user was not found.
     """
+    limit, _, error_message = _pagination_args()
+    if error_message:
+        return jsonify({'success': False, 'message': error_message}), 400
     user = data_manager.get_user_by_id(user_id)
     if not user:
         return jsonify({'success': False, 'message': 'User not found'}), 404 # Standardized error / Standardisierter Fehler
-    
     # Hole die Filme des Benutzers separat, um die Datenstruktur beizubehalten
-    # user.movies wird hier direkt verwendet, was okay ist, wenn User-Objekt vom DM kommt
-    # und die Relation geladen ist (Standard ist lazy loading)
-    user_movies_data = [{
-        'id': um_relation.movie.id, # Annahme: user.movies ist eine Liste von UserMovie Objekten
-        'title': um_relation.movie.title,
-        'director': um_relation.movie.director,
-        'year': um_relation.movie.year,
-        'community_rating': um_relation.movie.community_rating,
-        'community_rating_count': um_relation.movie.community_rating_count,
-        'poster_url': um_relation.movie.poster_url,
-        'user_rating': um_relation.user_rating # Hinzufügen der persönlichen Bewertung
-    } for um_relation in user.movies] # user.movies ist die UserMovie Collection
+    # Schlanke Datensätze: nur die ausgegebenen Spalten, in einem Roundtrip (kein N+1)
+    # Lightweight records: only the emitted columns, in a single round trip (no N+1)
+    user_movies, movies_next_cursor = data_manager.get_user_movie_summaries_page(user.id, limit)
+    tag_response(*(movie_tag(user_movie.id) for user_movie in user_movies)) # Community ratings shown / Angezeigte Community-Ratings
+    user_movies_data = serialize_user_movie.many(user_movies) # Inklusive persönlicher Bewertung / Including the personal rating
 
     return jsonify({
         'success': True, # Added for consistency / Für Konsistenz hinzugefügt
         'user': {
             'id': user.id,
             'name': user.name,
-            'movies': user_movies_data
+            'movies': user_movies_data,
+            'movies_next_cursor': movies_next_cursor
         }
     }), 200 # Explicitly set 200 OK / Explizit 200 OK setzen
 
 @api.route('/users/<int:user_id>/movies')
 @handle_api_error
-@cache_response()
+@cache_response(tags=lambda user_id: [user_tag(user_id)])
 def get_user_movies(user_id):
     """
-    Gibt alle Filme eines Benutzers zurück, inklusive persönlicher Bewertung.
-    Returns all movies of a user, including their personal rating.
+    Gibt eine Seite der Filme eines Benutzers zurück, inklusive persönlicher Bewertung (?limit=, ?cursor=).
+    Returns one page of a user's movies, including their personal rating (?limit=, ?cursor=).
 
     Args:
         user_id (int): ID des Benutzers.
@@ -193,124 +416,193 @@ def get_user_movies(user_id):
         404: Wenn der Benutzer nicht gefunden wurde.
              If the user was not found.
     """
+    limit, cursor, error_message = _pagination_args()
+    if error_message:
+        return jsonify({'success': False, 'message': error_message}), 400
     user = data_manager.get_user_by_id(user_id) # Erst Benutzer prüfen
     if not user:
         return jsonify({'success': False, 'message': 'User not found'}), 404 # Standardized error / Standardisierter Fehler
 
-    user_movie_relations = data_manager.get_user_movie_relations(user_id)
+    user_movies, next_cursor = data_manager.get_user_movie_summaries_page(user_id, limit, cursor)
+    tag_response(*(movie_tag(user_movie.id) for user_movie in user_movies)) # Community ratings shown / Angezeigte Community-Ratings
     
-    movies_data = []
-    for relation in user_movie_relations:
-        movies_data.append({
-            'id': relation.movie.id,
-            'title': relation.movie.title,
-            'director': relation.movie.director,
-            'year': relation.movie.year,
-            'community_rating': relation.movie.community_rating,
-            'community_rating_count': relation.movie.community_rating_count,
-            'poster_url': relation.movie.poster_url,
-            'user_rating': relation.user_rating # Persönliche Bewertung des Nutzers
-        })
+    movies_data = serialize_user_movie.many(user_movies) # Inklusive persönlicher Bewertung / Including the personal rating
 
     return jsonify({
         'success': True, # Added for consistency / Für Konsistenz hinzugefügt
         'user_id': user.id, # Include user_id for context / user_id für Kontext einfügen
         'user_name': user.name, # Include user_name for context / user_name für Kontext einfügen
-        'movies': movies_data
+        'movies': movies_data,
+        'limit': limit,
+        'next_cursor': next_cursor
     }), 200 # Explicitly set 200 OK / Explizit 200 OK setzen
 
 @api.route('/movies')
 @handle_api_error
-@cache_response()
+@cache_response(tags=lambda: [CATALOG_TAG], unless=_has_ids_arg)
 def get_movies():
     """
-    Gibt eine Liste aller Filme zurück.
-    Returns a list of all movies.
+    Gibt eine Seite des Filmkatalogs zurück, sortiert nach Titel (?limit=, ?cursor=), oder mit ?ids=1,2,3
+    genau diese Filme (Felder wie /movies, wählbar über ?fields=).
+    Returns one page of the movie catalog, ordered by title (?limit=, ?cursor=), or with ?ids=1,2,3
+    exactly these movies (fields as for /movies, selectable via ?fields=).
 
     Returns:
-        JSON: Liste aller Filme.
-              List of all movies.
+        JSON: Liste der Filme sowie next_cursor.
+              List of movies plus next_cursor.
     """
-    movies_from_db = data_manager.get_all_movies()
+    if _has_ids_arg():
+        return _get_movies_by_ids()
+    limit, cursor, error_message = _pagination_args()
+    if error_message:
+        return jsonify({'success': False, 'message': error_message}), 400
+    movies_from_db, next_cursor = data_manager.get_movie_summaries_page(limit, cursor) # Only the emitted columns / Nur die ausgegebenen Spalten
+    tag_response(*(movie_tag(movie.id) for movie in movies_from_db)) # Community ratings shown / Angezeigte Community-Ratings
     return jsonify({
         'success': True, # Added for consistency / Für Konsistenz hinzugefügt
-        'movies': [{
-            'id': movie.id,
-            'title': movie.title,
-            'director': movie.director,
-            'year': movie.year,
-            'community_rating': movie.community_rating,
-            'community_rating_count': movie.community_rating_count,
-            'poster_url': movie.poster_url
-        } for movie in movies_from_db]
+        'movies': serialize_movie_summary.many(movies_from_db),
+        'limit': limit,
+        'next_cursor': next_cursor
     }), 200 # Explicitly set 200 OK / Explizit 200 OK setzen
 
+def _get_movies_by_ids():
+    """
+    Batch-Abfrage für GET /movies?ids=: eine IN-Abfrage für alle nicht gecachten IDs, Ergebnis in angefragter
+    Reihenfolge, null an der Stelle unbekannter IDs, die zusätzlich in not_found stehen.
+    Batch read for GET /movies?ids=: one IN query for all IDs not cached, result in requested order,
+    null in place of unknown IDs, which are also listed in not_found.
+    """
+    movie_ids, error_message = _ids_arg()
+    if error_message:
+        return jsonify({'success': False, 'message': error_message}), 400
+    fields, error_message = _list_arg('fields', MOVIE_DETAIL_FIELDS)
+    if error_message:
+        return jsonify({'success': False, 'message': error_message}), 400
+    fields = tuple(name for name in MOVIE_DETAIL_FIELDS if name in fields or name == 'id') if fields else MOVIE_SUMMARY_FIELDS
+    serializer = movie_detail_serializer(fields)
+
+    def load(missing_ids):
+        return {row.id: serializer(row) for row in data_manager.get_movie_fields_by_ids(missing_ids, fields)}
+
+    movies = _cached_items(f"movie_item:{','.join(fields)}", movie_ids, load, movie_tag)
+    return jsonify({
+        'success': True,
+        'movies': [movies.get(movie_id) for movie_id in movie_ids],
+        'not_found': [movie_id for movie_id in movie_ids if movie_id not in movies]
+    }), 200
+
+@api.route('/movies/export')
+@handle_api_error
+def export_movies():
+    """
+    Exportiert den gesamten Filmkatalog, sortiert nach ID, als NDJSON (Standard) oder CSV (?format=ndjson|csv).
+    Die Antwort wird stapelweise erzeugt und gestreamt: konstanter Speicherbedarf, die ersten Bytes gehen sofort raus.
+    Optional wählt ?fields= die Spalten (Standard: die Felder von /movies).
+    Exports the whole movie catalog, ordered by ID, as NDJSON (default) or CSV (?format=ndjson|csv).
+    The response is generated and streamed batch by batch: constant memory use, the first bytes go out immediately.
+    Optionally ?fields= selects the columns (default: the fields of /movies).
+
+    Returns:
+        NDJSON: Ein JSON-Objekt pro Zeile. / One JSON object per line.
+        CSV: Kopfzeile mit den Feldnamen, dann eine Zeile pro Film. / Header row with the field names, then one row per movie.
+
+    Raises:
+        400: Bei ungültigem format- oder fields-Parameter. / For an invalid format or fields parameter.
+    """
+    export_format = request.args.get('format', 'ndjson')
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({'success': False, 'message': f"Invalid format. Allowed: {', '.join(EXPORT_FORMATS)}."}), 400
+    fields, error_message = _list_arg('fields', MOVIE_DETAIL_FIELDS)
+    if error_message:
+        return jsonify({'success': False, 'message': error_message}), 400
+    fields = tuple(name for name in MOVIE_DETAIL_FIELDS if name in fields or name == 'id') if fields else MOVIE_SUMMARY_FIELDS
+    batches = data_manager.iter_movie_field_batches(fields, EXPORT_BATCH_SIZE)
+
+    if export_format == 'csv':
+        def generate():
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(fields)
+            yield buffer.getvalue() # The header goes out before the first query / Die Kopfzeile geht vor der ersten Abfrage raus
+            for batch in batches:
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerows(batch)
+                yield buffer.getvalue()
+        mimetype = 'text/csv'
+    else:
+        serializer = movie_detail_serializer(fields)
+        dumps = current_app.json.dumps
+        def generate():
+            for batch in batches:
+                yield ''.join([dumps(movie) + '\n' for movie in serializer.many(batch)])
+        mimetype = 'application/x-ndjson'
+
+    current_app.logger.info(f"Streaming movie catalog export as {export_format} with fields {fields}.")
+    # stream_with_context keeps the request (and its DB session) alive while the generator runs
+    # stream_with_context hält die Anfrage (und ihre DB-Session) am Leben, solange der Generator läuft
+    response = current_app.response_class(stream_with_context(generate()), mimetype=mimetype)
+    response.headers['Content-Disposition'] = f'attachment; filename=movies.{export_format}'
+    return response
+
 @api.route('/movies/<int:movie_id>')
 @handle_api_error
-@cache_response()
+@cache_response(tags=lambda movie_id: [movie_tag(movie_id)])
 def get_movie(movie_id):
     """
     Gibt Details eines bestimmten Films zurück.
     Returns details of a specific movie.
 
+    Optional: ?fields=title,community_rating selektiert nur diese Spalten (plus id), ?include=comments lädt die
+    erste Kommentarseite mit. Ohne beide Parameter werden alle Felder samt Kommentaren geliefert.
+    Optional: ?fields=title,community_rating selects only these columns (plus id), ?include=comments also loads
+    the first page of comments. Without either parameter all fields including comments are returned.
+
     Args:
         movie_id (int): ID des Films.
                        ID of the movie.
 
     Returns:
-        JSON: Filmdetails mit Kommentaren.
-              Movie details with comments.
+        JSON: Filmdetails, ggf. mit der ersten Seite der Kommentare; weitere Seiten über
+              /movies/<movie_id>/comments?cursor=<comments_next_cursor>.
+              Movie details, optionally with the first page of comments; further pages via
+              /movies/<movie_id>/comments?cursor=<comments_next_cursor>.
 
     Raises:
+        400: Bei ungültigen Paging-, fields- oder include-Parametern.
+             For invalid paging, fields or include parameters.
         404: Wenn der Film nicht gefunden wurde.
              If the movie was not found.
     """
-    movie = data_manager.get_movie_by_id(movie_id)
+    limit, _, error_message = _pagination_args()
+    if error_message:
+        return jsonify({'success': False, 'message': error_message}), 400
+    fields, include_comments, error_message = _movie_fieldset_args()
+    if error_message:
+        return jsonify({'success': False, 'message': error_message}), 400
+    # Only the requested columns are selected / Nur die angefragten Spalten werden selektiert
+    movie = data_manager.get_movie_fields(movie_id, fields)
     if not movie:
         return jsonify({'success': False, 'message': 'Movie not found'}), 404 # Standardized error / Standardisierter Fehler
 
-    # Kommentare separat laden, um die Struktur beizubehalten
-    comments_from_db = data_manager.get_comments_for_movie(movie_id)
-    comments_data = [{
-        'id': c.id,
-        'text': c.text,
-        'user': c.user.name, # Annahme: c.user Relation ist geladen
-        'created_at': c.created_at.isoformat(),
-        'likes_count': c.likes_count
-    } for c in comments_from_db]
+    movie_data = movie_detail_serializer(fields)(movie)
+    if include_comments:
+        comments_from_db, comments_next_cursor = data_manager.get_comments_for_movie_page(movie_id, limit)
+        movie_data['comments'] = serialize_comment.many(comments_from_db) # c.user wird per selectinload geladen / c.user is loaded via selectinload
+        movie_data['comments_next_cursor'] = comments_next_cursor
 
     return jsonify({
         'success': True, # Added for consistency / Für Konsistenz hinzugefügt
-        'movie': {
-            'id': movie.id,
-            'title': movie.title,
-            'director': movie.director,
-            'year': movie.year,
-            'community_rating': movie.community_rating,
-            'community_rating_count': movie.community_rating_count,
-            'poster_url': movie.poster_url,
-            'plot': movie.plot,
-            'runtime': movie.runtime,
-            'awards': movie.awards,
-            'language': movie.language,
-            'genre': movie.genre,
-            'actors': movie.actors,
-            'writer': movie.writer,
-            'country': movie.country,
-            'metascore': movie.metascore,
-            'rated_omdb': movie.rated_omdb,
-            'imdb_id': movie.imdb_id,
-            'comments': comments_data
-        }
+        'movie': movie_data
     }), 200 # Explicitly set 200 OK / Explizit 200 OK setzen
 
 @api.route('/movies/<int:movie_id>/comments')
 @handle_api_error
-@cache_response()
+@cache_response(tags=lambda movie_id: [movie_tag(movie_id)])
 def get_movie_comments(movie_id):
     """
-    Gibt alle Kommentare für einen bestimmten Film zurück.
-    Returns all comments for a specific movie.
+    Gibt eine Seite der Kommentare eines Films zurück, neueste zuerst (?limit=, ?cursor=).
+    Returns one page of a movie's comments, newest first (?limit=, ?cursor=).
 
     Args:
         movie_id (int): ID des Films.
@@ -327,25 +619,54 @@ def get_movie_comments(movie_id):
     # Sicherstellen, dass der Film existiert, bevor Kommentare geladen werden.
     # data_manager.get_comments_for_movie prüft dies bereits intern und gibt ggf. eine leere Liste zurück.
     # Wenn hier ein 404 gewünscht ist, falls der Film nicht existiert, muss der Film zuerst geladen werden.
+    limit, cursor, error_message = _pagination_args()
+    if error_message:
+        return jsonify({'success': False, 'message': error_message}), 400
     movie = data_manager.get_movie_by_id(movie_id)
     if not movie:
         return jsonify({'success': False, 'message': 'Movie not found'}), 404 # Standardized error / Standardisierter Fehler
 
-    comments_from_db = data_manager.get_comments_for_movie(movie_id)
-    comments_data = [{
-        'id': c.id,
-        'text': c.text,
-        'user': c.user.name, # Annahme: c.user Relation ist geladen
-        'created_at': c.created_at.isoformat(),
-        'likes_count': c.likes_count
-    } for c in comments_from_db]
+    comments_from_db, next_cursor = data_manager.get_comments_for_movie_page(movie_id, limit, cursor)
+    comments_data = serialize_comment.many(comments_from_db) # c.user wird per selectinload geladen / c.user is loaded via selectinload
     
     return jsonify({
         'success': True, # Added for consistency / Für Konsistenz hinzugefügt
         'movie_id': movie_id, # Include movie_id for context / movie_id für Kontext einfügen
-        'comments': comments_data
+        'comments': comments_data,
+        'limit': limit,
+        'next_cursor': next_cursor
     }), 200 # Explicitly set 200 OK / Explizit 200 OK setzen
 
+@api.route('/cache/stats')
+@handle_api_error
+def get_cache_stats():
+    """
+    Gibt Füllstand und Zähler (Treffer, Fehlzugriffe, Verdrängungen, Abläufe) des Antwort-Caches zurück.
+    Returns fill level and counters (hits, misses, evictions, expirations) of the response cache.
+
+    Returns:
+        JSON: Cache-Statistiken.
+              Cache statistics.
+    """
+    return jsonify({'success': True, 'cache': cache.stats()}), 200
+
+@api.route('/http/stats')
+@handle_api_error
+def get_http_stats():
+    """
+    Gibt die Statistiken der ausgehenden Connection-Pools (OMDb, OpenRouter), die OMDb-Singleflight-Zähler und den
+    Zustand der OMDb-Hintergrund-Aktualisierung dieses Prozesses zurück.
+    Returns the statistics of this process's outbound connection pools (OMDb, OpenRouter), its OMDb
+    singleflight counters and the state of its OMDb background refresh.
+
+    Returns:
+        JSON: Pro Host geöffnete Verbindungen, Anfragen, freie Verbindungen und Wiederholungen; ausgeführte und
+              zusammengelegte OMDb-Aufrufe.
+              Per host opened connections, requests, idle connections and retries; executed and coalesced OMDb calls.
+    """
+    return jsonify({'success': True, 'http': http_client.stats(), 'omdb': omdb_client.stats(),
+                    'omdb_refresh': omdb_refresh.stats()}), 200
+
 @api.route('/users/<int:user_id>/movies', methods=['POST'])
 @handle_api_error # Generic error handling / Generische Fehlerbehandlung
 def add_movie_api(user_id):
@@ -356,6 +677,10 @@ def add_movie_api(user_id):
     Erwartet JSON mit 'title', optional 'director', 'year', 'rating', 'poster_url', 'imdb_id'.
     Expects JSON with 'title', optional 'director', 'year', 'rating', 'poster_url', 'imdb_id'.
     """
+    auth_error = _require_user(user_id)
+    if auth_error:
+        return auth_error
+
     # Check if user exists first
     # Zuerst prüfen, ob der Benutzer existiert
     user = data_manager.get_user_by_id(user_id)
@@ -364,86 +689,24 @@ def add_movie_api(user_id):
         return jsonify({'success': False, 'message': 'Benutzer nicht gefunden.'}), 404
 
     data = request.get_json() or {}
-    title = data.get('title')
-    director = data.get('director')
-    year_str = data.get('year') # Year might be a string from JSON / Jahr könnte ein String aus JSON sein
-    rating_str = data.get('rating') # Rating might be a string / Rating könnte ein String sein
-    poster_url = data.get('poster_url')
-    imdb_id = data.get('imdb_id') # Added imdb_id to be passed to data_manager
-    # Fields from OMDb for a potentially new global movie, if imdb_id is provided and movie is not yet global
-    # Felder von OMDb für einen potenziell neuen globalen Film, falls imdb_id angegeben ist und der Film noch nicht global ist
-    plot = data.get('plot')
-    runtime = data.get('runtime')
-    awards = data.get('awards')
-    languages = data.get('language') # OMDb uses 'Language' / OMDb verwendet 'Language'
-    genre = data.get('genre')
-    actors = data.get('actors')
-    writer = data.get('writer')
-    country = data.get('country')
-    metascore = data.get('metascore')
-    rated_omdb = data.get('rated') # OMDb uses 'Rated' / OMDb verwendet 'Rated'
-    omdb_rating_for_community_str = data.get('omdb_initial_rating_5_star') # e.g. from a previous OMDb lookup, scaled to 5 stars / z.B. von einer vorherigen OMDb-Abfrage, auf 5 Sterne skaliert
-
-    if not title:
-        return jsonify({'success': False, 'message': 'Titel ist erforderlich.'}), 400
-
-    year = None
-    if year_str:
-        try:
-            year = int(year_str)
-        except ValueError:
-            return jsonify({'success': False, 'message': 'Ungültiges Jahresformat. Muss eine ganze Zahl sein.'}), 400
-
-    rating = None # User's personal rating for the movie / Persönliche Bewertung des Benutzers für den Film
-    if rating_str is not None: 
-        try:
-            rating = float(rating_str)
-            if not (0 <= rating <= 5):
-                 return jsonify({'success': False, 'message': 'Bewertung muss zwischen 0 und 5 liegen.'}), 400
-        except ValueError:
-            return jsonify({'success': False, 'message': 'Ungültiges Bewertungsformat. Muss eine Zahl sein.'}), 400
-    
-    omdb_rating_for_community_param = None
-    if omdb_rating_for_community_str:
-        try:
-            omdb_rating_for_community_param = float(omdb_rating_for_community_str)
-            if not (0 <= omdb_rating_for_community_param <= 5):
-                omdb_rating_for_community_param = None # Reset if invalid / Bei Ungültigkeit zurücksetzen
-        except ValueError:
-            omdb_rating_for_community_param = None # Ignore if not a valid float / Bei ungültigem Float ignorieren
+    movie_fields, error_message = _parse_movie_payload(data)
+    if error_message:
+        return jsonify({'success': False, 'message': error_message}), 400
+    title = movie_fields['title']
 
     # Call data_manager.add_movie, which handles both adding the movie globally (if new and OMDb data provided)
     # and linking it to the user. It also updates/calculates community rating.
     # Rufe data_manager.add_movie auf, das sowohl das globale Hinzufügen des Films (falls neu und OMDb-Daten vorhanden)
     # als auch die Verknüpfung mit dem Benutzer übernimmt. Es aktualisiert/berechnet auch das Community-Rating.
-    user_movie_link_object = data_manager.add_movie(
-        user_id=user_id, 
-        title=title, 
-        director=director, 
-        year=year, 
-        user_specific_rating=rating, # Pass user's rating here / Hier die Bewertung des Benutzers übergeben
-        poster_url=poster_url, 
-        imdb_id=imdb_id,
-        plot=plot,
-        runtime=runtime,
-        awards=awards,
-        languages=languages,
-        genre=genre,
-        actors=actors,
-        writer=writer,
-        country=country,
-        metascore=metascore,
-        rated=rated_omdb,
-        omdb_rating_for_community=omdb_rating_for_community_param # This is the initial 0-5 star OMDb rating for community calculation
-                                                                # Dies ist das initiale 0-5 Sterne OMDb-Rating für die Community-Berechnung
-    )
+    movie = data_manager.add_movie(user_id=user_id, **movie_fields)
+    user_movie_link_object = data_manager.get_user_movie_link(user_id, movie.id) if movie else None
     
-    if user_movie_link_object and user_movie_link_object.movie:
-        current_app.logger.info(f"Movie {user_movie_link_object.movie.id} ('{title}') successfully added to user {user_id}'s list.")
+    if user_movie_link_object:
+        current_app.logger.info(f"Movie {movie.id} ('{title}') successfully added to user {user_id}'s list.")
         return jsonify({
             'success': True,
             'message': 'Film erfolgreich zur Benutzerliste hinzugefügt.',
-            'movie_id': user_movie_link_object.movie.id,
+            'movie_id': movie.id,
             'user_movie_id': user_movie_link_object.id # ID of the UserMovie link / ID der UserMovie-Verknüpfung
         }), 201
     else:
@@ -460,10 +723,135 @@ def add_movie_api(user_id):
         }), 409 # 409 Conflict is a good general status if it might already exist, or 400/500 for other issues.
                  # 409 Conflict ist ein guter allgemeiner Status, wenn es möglicherweise bereits existiert, oder 400/500 für andere Probleme.
 
+@api.route('/users/<int:user_id>/movies/bulk', methods=['POST'])
+@handle_api_error
+def add_movies_bulk_api(user_id):
+    """
+    POST /api/users/<user_id>/movies/bulk
+    Fügt viele Filme in einer Transaktion zur Liste eines Benutzers hinzu (z.B. Migration von anderen Diensten).
+    Adds many movies to a user's list in one transaction (e.g. migrating from other services).
+    Erwartet JSON {"movies": [...]}, jeder Eintrag mit denselben Feldern wie POST /api/users/<user_id>/movies.
+    Expects JSON {"movies": [...]}, each entry with the same fields as POST /api/users/<user_id>/movies.
+    Antwortet mit einem Ergebnis pro Eintrag (created, added, updated, unchanged, invalid, not_found).
+    Responds with one result per entry (created, added, updated, unchanged, invalid, not_found).
+    """
+    auth_error = _require_user(user_id)
+    if auth_error:
+        return auth_error
+
+    data = request.get_json(silent=True) or {}
+    entries = data.get('movies')
+    if not isinstance(entries, list) or not entries:
+        return jsonify({'success': False, 'message': "A non-empty 'movies' list is required."}), 400
+    if len(entries) > MAX_BULK_MOVIES:
+        return jsonify({'success': False, 'message': f'At most {MAX_BULK_MOVIES} movies per request.'}), 413
+
+    # Entries with invalid fields are reported, the remaining ones are still imported
+    # Einträge mit ungültigen Feldern werden gemeldet, die übrigen trotzdem importiert
+    results = [None] * len(entries)
+    valid_indices, valid_fields = [], []
+    for index, entry in enumerate(entries):
+        movie_fields, error_message = _parse_movie_payload(entry if isinstance(entry, dict) else {})
+        if error_message:
+            results[index] = {'index': index, 'status': 'invalid', 'movie_id': None, 'message': error_message}
+        else:
+            valid_indices.append(index)
+            valid_fields.append(movie_fields)
+
+    bulk_results = data_manager.add_movies_bulk(user_id, valid_fields) if valid_fields else []
+    if bulk_results is None:
+        return jsonify({'success': False, 'message': 'Bulk import failed, no movies were added.'}), 500
+    for index, result in zip(valid_indices, bulk_results):
+        results[index] = dict(result, index=index)
+
+    return jsonify({
+        'success': True,
+        'data': results,
+        'message': f"{sum(1 for r in results if r['status'] in ('created', 'added', 'updated'))} of {len(entries)} movies added or updated."
+    }), 200
+
+def _require_user(user_id: int):
+    """
+    Prüft, ob der eingeloggte Benutzer `user_id` ist (Schreibzugriffe auf eine Filmliste).
+    Checks that the logged-in user is `user_id` (writes to a movie list).
+
+    Returns:
+        tuple | None: (JSON, 401/403) bei fehlendem Login bzw. fremdem Benutzer, sonst None.
+                      (JSON, 401/403) if not logged in or another user, otherwise None.
+    """
+    if not g.user:
+        return jsonify({'success': False, 'message': 'Login required.'}), 401
+    if g.user.id != user_id:
+        return jsonify({'success': False, 'message': 'Not authorized for this user.'}), 403
+    return None
+
+def _parse_movie_payload(data: dict):
+    """
+    Wandelt einen JSON-Filmeintrag in Keyword-Argumente für data_manager.add_movie um.
+    Converts a JSON movie entry into keyword arguments for data_manager.add_movie.
+
+    Returns:
+        tuple: (dict mit Feldern, None) oder (None, Fehlermeldung).
+               (dict of fields, None) or (None, error message).
+    """
+    title = data.get('title')
+    if not title:
+        return None, 'Titel ist erforderlich.'
+
+    year = None
+    year_str = data.get('year') # Year might be a string from JSON / Jahr könnte ein String aus JSON sein
+    if year_str:
+        try:
+            year = int(year_str)
+        except (TypeError, ValueError):
+            return None, 'Ungültiges Jahresformat. Muss eine ganze Zahl sein.'
+
+    rating = None # User's personal rating for the movie / Persönliche Bewertung des Benutzers für den Film
+    rating_str = data.get('rating') # Rating might be a string / Rating könnte ein String sein
+    if rating_str is not None: 
+        try:
+            rating = float(rating_str)
+        except (TypeError, ValueError):
+            return None, 'Ungültiges Bewertungsformat. Muss eine Zahl sein.'
+        if not (0 <= rating <= 5):
+            return None, 'Bewertung muss zwischen 0 und 5 liegen.'
+
+    omdb_rating_for_community = None
+    omdb_rating_for_community_str = data.get('omdb_initial_rating_5_star') # e.g. from a previous OMDb lookup, scaled to 5 stars / z.B. von einer vorherigen OMDb-Abfrage, auf 5 Sterne skaliert
+    if omdb_rating_for_community_str:
+        try:
+            omdb_rating_for_community = float(omdb_rating_for_community_str)
+            if not (0 <= omdb_rating_for_community <= 5):
+                omdb_rating_for_community = None # Reset if invalid / Bei Ungültigkeit zurücksetzen
+        except (TypeError, ValueError):
+            omdb_rating_for_community = None # Ignore if not a valid float / Bei ungültigem Float ignorieren
+
+    return {
+        'title': title,
+        'director': data.get('director'),
+        'year': year,
+        'rating': rating,
+        'poster_url': data.get('poster_url'),
+        'imdb_id': data.get('imdb_id'),
+        # Fields from OMDb for a potentially new global movie, if imdb_id is provided and movie is not yet global
+        # Felder von OMDb für einen potenziell neuen globalen Film, falls imdb_id angegeben ist und der Film noch nicht global ist
+        'plot': data.get('plot'),
+        'runtime': data.get('runtime'),
+        'awards': data.get('awards'),
+        'languages': data.get('language'), # OMDb uses 'Language' / OMDb verwendet 'Language'
+        'genre': data.get('genre'),
+        'actors': data.get('actors'),
+        'writer': data.get('writer'),
+        'country': data.get('country'),
+        'metascore': data.get('metascore'),
+        'rated': data.get('rated'), # OMDb uses 'Rated' / OMDb verwendet 'Rated'
+        'omdb_rating_for_community': omdb_rating_for_community, # Initial 0-5 star OMDb rating for the community calculation / Initiales 0-5 Sterne OMDb-Rating für die Community-Berechnung
+    }, None
+
 @api.route('/omdb_proxy')
 @handle_api_error # Use error handling / Fehlerbehandlung nutzen
-# No caching here, as it's just a proxy and OMDb itself might cache or data could change (rarely)
-# Kein Caching hier, da es nur ein Proxy ist und OMDb selbst ggf. schon cacht oder Daten sich ändern können (selten)
+# No response caching here; OMDb answers themselves are cached persistently (api/omdb_client.py)
+# Kein Antwort-Caching hier; die OMDb-Antworten selbst werden persistent gecacht (api/omdb_client.py)
 def omdb_proxy():
     """
     Proxies OMDb API requests to avoid exposing the API key on the client-side.
@@ -496,25 +884,14 @@ def omdb_proxy():
     if not title and not imdb_id:
         return jsonify({'success': False, 'message': 'Missing query parameter: title or imdb_id required.'}), 400
 
-    params = {
-        'apikey': OMDB_API_KEY,
-        'plot': plot
-    }
-    if title:
-        params['t'] = title
-    if imdb_id:
-        params['i'] = imdb_id
-    if year:
-        params['y'] = year
-    
     # Log OMDb proxy request.
     # Logge OMDb-Proxy-Anfrage.
-    current_app.logger.info(f"OMDb Proxy Request: {params}")
+    current_app.logger.info(f"OMDb Proxy Request: title={title}, imdb_id={imdb_id}, year={year}, plot={plot}")
 
     try:
-        response = requests.get('http://www.omdbapi.com/', params=params, timeout=10)
-        response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx) / HTTPError für schlechte Antworten auslösen (4xx oder 5xx)
-        omdb_data = response.json()
+        # Answered from the persistent OMDb cache when possible; raises HTTPError for bad responses (4xx or 5xx)
+        # Wenn möglich aus dem persistenten OMDb-Cache beantwortet; löst HTTPError für schlechte Antworten aus (4xx oder 5xx)
+        omdb_data = fetch_omdb(title=title, imdb_id=imdb_id, year=year, plot=plot)
         
         if omdb_data.get('Response') == 'True':
             # Log OMDb proxy response success.
@@ -528,6 +905,14 @@ def omdb_proxy():
             current_app.logger.warning(f"OMDb Proxy Response for '{title or imdb_id}': False, Error: {error_message_from_omdb}, Full OMDb Response: {omdb_data}")
             return jsonify({'success': False, 'message': error_message_from_omdb, 'data': omdb_data}), 200
 
+    except CircuitOpenError as open_err:
+        # OMDb is failing: answer at once instead of waiting for another timeout
+        # OMDb ist gestört: sofort antworten, statt auf einen weiteren Timeout zu warten
+        current_app.logger.warning(f"OMDb Proxy fast-fail for '{title or imdb_id}': {open_err}")
+        response = jsonify({'success': False, 'message': 'OMDb is temporarily unavailable. Please try again shortly.',
+                            'retry_after': round(open_err.retry_after)})
+        response.headers['Retry-After'] = str(round(open_err.retry_after))
+        return response, 503
     except requests.exceptions.Timeout:
         # Log OMDb proxy timeout.
         # Logge OMDb-Proxy-Zeitüberschreitung.
@@ -536,6 +921,7 @@ def omdb_proxy():
     except requests.exceptions.HTTPError as http_err:
         # Log OMDb proxy HTTP error.
         # Logge OMDb-Proxy-HTTP-Fehler.
+        response = http_err.response
         current_app.logger.error(f"OMDb Proxy HTTP error for '{title or imdb_id}': {http_err}. Response text: {response.text}")
         error_message = f'OMDb API HTTP error: {http_err}'
         omdb_response_data = None
@@ -554,7 +940,7 @@ def omdb_proxy():
     except ValueError as json_err: # Includes JSONDecodeError
         # Log OMDb proxy JSON decoding error.
         # Logge OMDb-Proxy-JSON-Dekodierungsfehler.
-        current_app.logger.error(f"OMDb Proxy JSON decoding error for '{title or imdb_id}': {json_err}. Response: {response.text if 'response' in locals() else 'N/A'}")
+        current_app.logger.error(f"OMDb Proxy JSON decoding error for '{title or imdb_id}': {json_err}.")
         return jsonify({'success': False, 'message': 'Failed to decode OMDb API response.', 'details': str(json_err)}), 500
 
 @api.route('/check_or_create_movie_by_imdb', methods=['POST'])
@@ -589,6 +975,15 @@ def check_or_create_movie_by_imdb():
         # Film existiert nicht, also global hinzufügen
         # Die 'data' sollten die vollständigen OMDb-Daten sein
         current_app.logger.info(f"Movie with imdbID {imdb_id} not found in DB. Attempting to create globally. / Film mit imdbID {imdb_id} nicht in DB gefunden. Versuch, global zu erstellen.")
+        # Prefer the server-side OMDb payload (usually cached by the preceding omdb_proxy lookup) over the client's copy
+        # Die serverseitige OMDb-Antwort (meist durch die vorherige omdb_proxy-Suche gecacht) der Kopie des Clients vorziehen
+        cached_omdb_data = get_cached_omdb(imdb_id=imdb_id, plot='full') or get_cached_omdb(imdb_id=imdb_id)
+        if cached_omdb_data and cached_omdb_data.get('Response') == 'True':
+            data = cached_omdb_data
+        # The local IMDb catalog fills the fields OMDb/the client left empty / Der lokale IMDb-Katalog füllt die Felder, die OMDb/der Client leer ließ
+        local_entry = data_manager.get_local_catalog_entry(imdb_id=imdb_id)
+        if local_entry:
+            data = data_manager.merge_local_catalog_entry(local_entry, data)
         new_movie = data_manager.add_movie_globally(movie_data=data)
         if new_movie:
             current_app.logger.info(f"Movie with imdbID {imdb_id} created globally (New ID: {new_movie.id}). Status: created. / Film mit imdbID {imdb_id} global erstellt (Neue ID: {new_movie.id}). Status: created.")
@@ -0,0 +1,90 @@
+"""
+api/serializers.py
+Serialisierer für die JSON-Formen der API (Filmzusammenfassung, Filmdetails, Kommentar, Benutzerlisteneintrag).
+Serializers for the JSON shapes of the API (movie summary, movie detail, comment, user list entry).
+
+Jede Form wird einmal beim Import zu einer Funktion kompiliert, die ein Dictionary-Literal aus Attributzugriffen
+zurückgibt - so schnell wie handgeschriebene Dictionaries, aber jede Form ist nur an einer Stelle definiert.
+Every shape is compiled once at import time into a function returning a dict literal built from attribute accesses -
+as fast as hand-built dicts, but every shape is defined in exactly one place.
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Optional
+
+def _isoformat(value) -> Optional[str]:
+    """
+    Datumswerte als ISO-8601-String. / Datetime values as ISO 8601 string.
+    """
+    return value.isoformat() if value is not None else None
+
+def compile_serializer(name: str, fields: Iterable) -> Callable[[Any], dict]:
+    """
+    Kompiliert eine Form zu einer Funktion obj -> dict. Ihr Attribut `many` ist die Listenvariante objs -> [dict],
+    die das Dictionary-Literal direkt in einer List-Comprehension baut (ohne Funktionsaufruf pro Objekt).
+    Compiles a shape into a function obj -> dict. Its attribute `many` is the list variant objs -> [dict],
+    which builds the dict literal directly in a list comprehension (no function call per object).
+
+    Args:
+        name (str): Funktionsname (für Tracebacks). / Function name (for tracebacks).
+        fields (iterable): Je Feld ein Attributname, oder ein Tupel (Schlüssel, Attributpfad[, Konverter]).
+                           Der Attributpfad darf Punkte enthalten (z.B. 'user.name').
+                           Per field an attribute name, or a tuple (key, attribute path[, converter]).
+                           The attribute path may contain dots (e.g. 'user.name').
+
+    Raises:
+        ValueError: Bei einem ungültigen Attributpfad. / For an invalid attribute path.
+    """
+    namespace = {}
+    items = []
+    for index, field in enumerate(fields):
+        key, path, converter = (field, field, None) if isinstance(field, str) else (tuple(field) + (None,))[:3]
+        if not all(part.isidentifier() for part in path.split('.')):
+            raise ValueError(f"Invalid attribute path '{path}' in serializer '{name}'.")
+        expression = f'obj.{path}'
+        if converter is not None:
+            namespace[f'_convert_{index}'] = converter
+            expression = f'_convert_{index}({expression})'
+        items.append(f'{key!r}: {expression}')
+    dict_literal = f"{{{', '.join(items)}}}"
+    source = (f"def {name}(obj):\n    return {dict_literal}\n"
+              f"def {name}_many(objs):\n    return [{dict_literal} for obj in objs]\n")
+    exec(compile(source, f'<serializer {name}>', 'exec'), namespace)
+    serializer = namespace[name]
+    serializer.many = namespace[f'{name}_many']
+    return serializer
+
+MOVIE_SUMMARY_FIELDS = ('id', 'title', 'director', 'year', 'community_rating', 'community_rating_count', 'poster_url')
+
+MOVIE_DETAIL_FIELDS = MOVIE_SUMMARY_FIELDS + (
+    'plot', 'runtime', 'awards', 'language', 'genre', 'actors', 'writer', 'country', 'metascore', 'rated_omdb', 'imdb_id'
+)
+
+COMMENT_FIELDS = ('id', 'text', ('user', 'user.name'), ('created_at', 'created_at', _isoformat), 'likes_count')
+
+USER_LIST_ENTRY_FIELDS = ('id', 'name', 'movie_count')
+
+# Movie, MovieSummary / Movie, MovieSummary
+serialize_movie_summary = compile_serializer('serialize_movie_summary', MOVIE_SUMMARY_FIELDS)
+# UserMovieSummary: summary plus the user's personal rating / Zusammenfassung plus persönliche Bewertung
+serialize_user_movie = compile_serializer('serialize_user_movie', MOVIE_SUMMARY_FIELDS + ('user_rating',))
+# Movie
+serialize_movie_detail = compile_serializer('serialize_movie_detail', MOVIE_DETAIL_FIELDS)
+# Comment (with its user loaded) / Comment (mit geladenem Benutzer)
+serialize_comment = compile_serializer('serialize_comment', COMMENT_FIELDS)
+# Rows of get_users_with_movie_counts(_page) / Zeilen von get_users_with_movie_counts(_page)
+serialize_user_list_entry = compile_serializer('serialize_user_list_entry', USER_LIST_ENTRY_FIELDS)
+
+@lru_cache(maxsize=128)
+def movie_detail_serializer(fields: tuple) -> Callable[[Any], dict]:
+    """
+    Serialisierer für eine Teilmenge von MOVIE_DETAIL_FIELDS (Sparse Fieldsets), einmal pro Feldkombination kompiliert.
+    Serializer for a subset of MOVIE_DETAIL_FIELDS (sparse fieldsets), compiled once per field combination.
+
+    Raises:
+        ValueError: Bei einem Feld außerhalb von MOVIE_DETAIL_FIELDS. / For a field outside MOVIE_DETAIL_FIELDS.
+    """
+    unknown = [name for name in fields if name not in MOVIE_DETAIL_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown movie fields: {unknown}.")
+    return compile_serializer('serialize_movie_fields', fields)
@@ -0,0 +1,379 @@
+"""
+api/sqlite_cache.py
+Geteiltes Cache-Backend in einer SQLite-Datei (WAL) für alle Worker-Prozesse eines Knotens.
+Shared cache backend in a SQLite file (WAL) for all worker processes of a node.
+
+Jeder Gunicorn-Worker öffnet dieselbe Datei: Ein Eintrag, den ein Worker berechnet, ist für alle Worker ein Treffer,
+und Tag-Invalidierungen nach einem Commit wirken in allen Workern. Im WAL-Modus blockieren Leser den Schreiber nicht.
+Every gunicorn worker opens the same file: an entry computed by one worker is a hit for all workers,
+and tag invalidations after a commit take effect in all workers. In WAL mode readers do not block the writer.
+
+Gespeichert werden CachedResponse-Einträge (Body-Bytes, komprimierte Varianten, Status, Content-Type, ETag). LRU ist angenähert: Der letzte
+Zugriff wird höchstens alle `touch_interval` Sekunden geschrieben, damit Treffer fast nie Schreibsperren brauchen.
+Fehler der Cache-Datei werden geloggt und wie Fehlzugriffe behandelt; die API funktioniert dann ohne Cache weiter.
+CachedResponse entries are stored (body bytes, compressed variants, status, content type, ETag). LRU is approximated: the last access
+is written at most every `touch_interval` seconds, so hits almost never need a write lock.
+Errors of the cache file are logged and treated like misses; the API then keeps working without the cache.
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, Iterable, Optional
+from flask import current_app, has_app_context
+from api.cache import (CacheBackend, CachedResponse, CACHE_BACKEND_SQLITE, DEFAULT_MAX_ENTRIES, DEFAULT_MAX_BYTES,
+                       SHARED_DEFAULT_TTL, DEFAULT_SWEEP_INTERVAL, ENTRY_OVERHEAD_BYTES)
+
+DEFAULT_TOUCH_INTERVAL = 5 # Seconds / Sekunden
+
+# Anzahl Einträge, die pro Runde verdrängt werden / Number of entries evicted per round
+_EVICTION_BATCH_SIZE = 64
+
+# Older cache files are dropped and recreated (PRAGMA user_version) / Ältere Cache-Dateien werden verworfen und neu angelegt
+_SCHEMA_VERSION = 1
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS cache_entries (
+        key TEXT PRIMARY KEY,
+        body BLOB NOT NULL,
+        body_br BLOB,
+        body_gzip BLOB,
+        status INTEGER NOT NULL,
+        content_type TEXT,
+        etag TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        expires_at REAL NOT NULL,
+        last_access REAL NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS ix_cache_entries_last_access ON cache_entries (last_access)",
+    "CREATE INDEX IF NOT EXISTS ix_cache_entries_expires_at ON cache_entries (expires_at)",
+    """CREATE TABLE IF NOT EXISTS cache_tags (
+        tag TEXT NOT NULL,
+        key TEXT NOT NULL,
+        PRIMARY KEY (tag, key)
+    ) WITHOUT ROWID""",
+    "CREATE INDEX IF NOT EXISTS ix_cache_tags_key ON cache_tags (key)",
+    "CREATE TABLE IF NOT EXISTS cache_meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)",
+    "INSERT OR IGNORE INTO cache_meta (name, value) VALUES ('generation', 0)",
+)
+
+def default_cache_path() -> str:
+    """
+    Standardpfad der Cache-Datei im temporären Verzeichnis, das alle Worker eines Knotens sehen.
+    Default path of the cache file in the temporary directory seen by all workers of a node.
+    """
+    return os.path.join(tempfile.gettempdir(), 'movieweb_api_cache.sqlite')
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Cache-Backend in einer von allen Worker-Prozessen geteilten SQLite-Datei, mit denselben Grenzen wie LRUTTLCache.
+    Treffer-/Fehlzugriffszähler gelten pro Prozess, Füllstand und Generation für alle Prozesse.
+    Cache backend in a SQLite file shared by all worker processes, with the same limits as LRUTTLCache.
+    Hit/miss counters are per process, fill level and generation are shared by all processes.
+
+    Args:
+        path (str): Pfad der Cache-Datei. / Path of the cache file.
+        max_entries, max_bytes, sweep_interval: Wie bei LRUTTLCache. / As for LRUTTLCache.
+        default_ttl (float): Standard-Lebensdauer, SHARED_DEFAULT_TTL. / Default time to live, SHARED_DEFAULT_TTL.
+        touch_interval (float): Mindestabstand in Sekunden zwischen zwei Aktualisierungen des letzten Zugriffs eines Eintrags.
+                                Minimum time in seconds between two updates of an entry's last access.
+    """
+
+    def __init__(self, path: str, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES,
+                 default_ttl: float = SHARED_DEFAULT_TTL, sweep_interval: float = DEFAULT_SWEEP_INTERVAL,
+                 touch_interval: float = DEFAULT_TOUCH_INTERVAL):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.sweep_interval = sweep_interval
+        self.touch_interval = touch_interval
+        self._local = threading.local() # One connection per thread and process / Eine Verbindung pro Thread und Prozess
+        self._counter_lock = threading.Lock()
+        self._last_sweep = time.time()
+        self._hits = self._misses = self._evictions = self._expirations = self._invalidations = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Internal helper: Returns the connection of the current thread. Connections inherited through fork()
+        (e.g. from the gunicorn master) are never reused; the child opens its own.
+
+        Interne Hilfsmethode: Liefert die Verbindung des aktuellen Threads. Per fork() geerbte Verbindungen
+        (z.B. vom Gunicorn-Master) werden nie wiederverwendet; das Kind öffnet eine eigene.
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            # Autocommit; write transactions are opened explicitly with BEGIN IMMEDIATE
+            # Autocommit; Schreibtransaktionen werden explizit mit BEGIN IMMEDIATE geöffnet
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute('PRAGMA busy_timeout = 5000')
+            connection.execute('PRAGMA journal_mode = WAL')
+            connection.execute('PRAGMA synchronous = OFF') # Losing cache entries on a crash is harmless / Verlorene Cache-Einträge nach einem Absturz sind harmlos
+            if connection.execute('PRAGMA user_version').fetchone()[0] != _SCHEMA_VERSION:
+                self._create_schema(connection)
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    @staticmethod
+    def _create_schema(connection: sqlite3.Connection) -> None:
+        """
+        Internal helper: Creates the tables; entries of a file with an older schema version are dropped,
+        the generation is kept and incremented.
+
+        Interne Hilfsmethode: Legt die Tabellen an; Einträge einer Datei mit älterer Schema-Version werden verworfen,
+        die Generation bleibt erhalten und wird erhöht.
+        """
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            # Another worker may have migrated meanwhile / Ein anderer Worker kann inzwischen migriert haben
+            if connection.execute('PRAGMA user_version').fetchone()[0] != _SCHEMA_VERSION:
+                connection.execute("DROP TABLE IF EXISTS cache_tags")
+                connection.execute("DROP TABLE IF EXISTS cache_entries")
+                for statement in _SCHEMA:
+                    connection.execute(statement)
+                connection.execute("UPDATE cache_meta SET value = value + 1 WHERE name = 'generation'")
+                connection.execute(f'PRAGMA user_version = {_SCHEMA_VERSION}')
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+
+    def _log_error(self, action: str, error: Exception) -> None:
+        # Cache errors must never fail a request / Cache-Fehler dürfen nie eine Anfrage scheitern lassen
+        if has_app_context():
+            current_app.logger.error(f"API cache ({self.path}) {action} failed: {error}.")
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        with self._counter_lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    @property
+    def generation(self) -> int:
+        """
+        Geteilte Generation aus der Cache-Datei. / Shared generation from the cache file.
+        """
+        try:
+            return self._connection().execute("SELECT value FROM cache_meta WHERE name = 'generation'").fetchone()[0]
+        except sqlite3.Error as e:
+            self._log_error('reading the generation', e)
+            return -1 # Never equal to a stored generation, so nothing is cached / Nie gleich einer gespeicherten Generation, daher wird nichts gecacht
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Liefert den Eintrag zu `key` oder `default`. Abgelaufene Einträge zählen als Fehlzugriff und werden beim nächsten Durchlauf entfernt.
+        Returns the entry for `key` or `default`. Expired entries count as a miss and are removed by the next sweep.
+        """
+        now = time.time()
+        try:
+            connection = self._connection()
+            row = connection.execute(
+                "SELECT body, status, content_type, etag, expires_at, last_access, body_br, body_gzip FROM cache_entries WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None or row[4] <= now:
+                self._count('_misses')
+                return default
+            if now - row[5] >= self.touch_interval:
+                try:
+                    connection.execute("UPDATE cache_entries SET last_access = ? WHERE key = ?", (now, key))
+                except sqlite3.OperationalError:
+                    pass # Busy writer: the LRU position is refreshed on a later hit / Schreiber belegt: Die LRU-Position wird bei einem späteren Treffer aktualisiert
+        except sqlite3.Error as e:
+            self._log_error('get', e)
+            self._count('_misses')
+            return default
+        self._count('_hits')
+        encodings = {encoding: variant for encoding, variant in (('br', row[6]), ('gzip', row[7])) if variant is not None}
+        return CachedResponse(row[0], row[1], row[2], etag=row[3], encodings=encodings)
+
+    def set(self, key: str, value: CachedResponse, ttl: Optional[float] = None, tags: Iterable[str] = (),
+            generation: Optional[int] = None) -> bool:
+        """
+        Speichert einen CachedResponse-Eintrag in einer Schreibtransaktion und verdrängt bei Bedarf die am längsten
+        nicht genutzten Einträge. Wurde seit `generation` invalidiert (in irgendeinem Prozess), wird nicht gespeichert.
+        Stores a CachedResponse entry in one write transaction, evicting the least recently used entries as needed.
+        If an invalidation happened since `generation` (in any process), nothing is stored.
+        """
+        if not isinstance(value, CachedResponse):
+            raise TypeError(f"SQLiteCacheBackend stores CachedResponse entries, not {type(value).__name__}.")
+        size = value.size + ENTRY_OVERHEAD_BYTES
+        if size > self.max_bytes:
+            self.delete(key)
+            return False
+        now = time.time()
+        try:
+            connection = self._connection()
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                current_generation = connection.execute("SELECT value FROM cache_meta WHERE name = 'generation'").fetchone()[0]
+                if generation is not None and generation != current_generation:
+                    connection.execute('ROLLBACK')
+                    return False
+                self._remove_keys(connection, [key])
+                if now - self._last_sweep >= self.sweep_interval:
+                    self._sweep(connection, now)
+                self._evict_for(connection, size)
+                connection.execute(
+                    "INSERT INTO cache_entries (key, body, body_br, body_gzip, status, content_type, etag, size, expires_at, last_access) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, value.body, value.encodings.get('br'), value.encodings.get('gzip'), value.status, value.content_type, value.etag, size,
+                     now + (self.default_ttl if ttl is None else ttl), now)
+                )
+                connection.executemany("INSERT OR IGNORE INTO cache_tags (tag, key) VALUES (?, ?)", [(tag, key) for tag in set(tags)])
+                connection.execute('COMMIT')
+                return True
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+        except sqlite3.Error as e:
+            self._log_error('set', e)
+            return False
+
+    def delete(self, key: str) -> bool:
+        """
+        Entfernt `key`; gibt True zurück, wenn er vorhanden war.
+        Removes `key`; returns True if it was present.
+        """
+        try:
+            connection = self._connection()
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                removed = self._remove_keys(connection, [key])
+                connection.execute('COMMIT')
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+            return removed > 0
+        except sqlite3.Error as e:
+            self._log_error('delete', e)
+            return False
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """
+        Entfernt alle Einträge mit einem der Tags - für alle Prozesse - und erhöht die geteilte Generation.
+        Removes all entries carrying any of the tags - for all processes - and increments the shared generation.
+        """
+        try:
+            connection = self._connection()
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                connection.execute("UPDATE cache_meta SET value = value + 1 WHERE name = 'generation'")
+                keys = set()
+                for tag in set(tags):
+                    keys.update(row[0] for row in connection.execute("SELECT key FROM cache_tags WHERE tag = ?", (tag,)))
+                removed = self._remove_keys(connection, list(keys))
+                connection.execute('COMMIT')
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+        except sqlite3.Error as e:
+            self._log_error('invalidate_tags', e)
+            return 0
+        self._count('_invalidations', removed)
+        return removed
+
+    def clear(self) -> None:
+        """
+        Leert den geteilten Cache und erhöht die Generation; die Zähler bleiben erhalten.
+        Empties the shared cache and increments the generation; the counters are kept.
+        """
+        try:
+            connection = self._connection()
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                connection.execute("UPDATE cache_meta SET value = value + 1 WHERE name = 'generation'")
+                connection.execute("DELETE FROM cache_tags")
+                connection.execute("DELETE FROM cache_entries")
+                connection.execute('COMMIT')
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+        except sqlite3.Error as e:
+            self._log_error('clear', e)
+
+    def sweep(self) -> int:
+        """
+        Entfernt alle abgelaufenen Einträge und gibt ihre Anzahl zurück.
+        Removes all expired entries and returns their number.
+        """
+        try:
+            connection = self._connection()
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                expired = self._sweep(connection, time.time())
+                connection.execute('COMMIT')
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+            return expired
+        except sqlite3.Error as e:
+            self._log_error('sweep', e)
+            return 0
+
+    def stats(self) -> dict:
+        """
+        Liefert Füllstand (geteilt) und Zähler (pro Prozess) für das Monitoring.
+        Returns fill level (shared) and counters (per process) for monitoring.
+        """
+        try:
+            connection = self._connection()
+            entries, total_bytes = connection.execute("SELECT COUNT(*), TOTAL(size) FROM cache_entries").fetchone()
+            tag_count = connection.execute("SELECT COUNT(DISTINCT tag) FROM cache_tags").fetchone()[0]
+        except sqlite3.Error as e:
+            self._log_error('stats', e)
+            entries = total_bytes = tag_count = None
+        with self._counter_lock:
+            lookups = self._hits + self._misses
+            return {
+                'backend': CACHE_BACKEND_SQLITE,
+                'path': self.path,
+                'pid': os.getpid(),
+                'entries': entries,
+                'bytes': int(total_bytes) if total_bytes is not None else None,
+                'tags': tag_count,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_ratio': round(self._hits / lookups, 4) if lookups else None,
+                'evictions': self._evictions,
+                'expirations': self._expirations,
+                'invalidations': self._invalidations,
+            }
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+
+    def _remove_keys(self, connection: sqlite3.Connection, keys: list) -> int:
+        # Caller holds a write transaction / Aufrufer hält eine Schreibtransaktion
+        removed = 0
+        for key in keys:
+            connection.execute("DELETE FROM cache_tags WHERE key = ?", (key,))
+            removed += connection.execute("DELETE FROM cache_entries WHERE key = ?", (key,)).rowcount
+        return removed
+
+    def _sweep(self, connection: sqlite3.Connection, now: float) -> int:
+        # Caller holds a write transaction / Aufrufer hält eine Schreibtransaktion
+        expired = [row[0] for row in connection.execute("SELECT key FROM cache_entries WHERE expires_at <= ?", (now,))]
+        self._remove_keys(connection, expired)
+        self._count('_expirations', len(expired))
+        self._last_sweep = now
+        return len(expired)
+
+    def _evict_for(self, connection: sqlite3.Connection, size: int) -> None:
+        # Caller holds a write transaction / Aufrufer hält eine Schreibtransaktion
+        entries, total_bytes = connection.execute("SELECT COUNT(*), TOTAL(size) FROM cache_entries").fetchone()
+        while entries and (entries >= self.max_entries or total_bytes + size > self.max_bytes):
+            oldest = connection.execute(
+                "SELECT key, size FROM cache_entries ORDER BY last_access LIMIT ?", (_EVICTION_BATCH_SIZE,)
+            ).fetchall()
+            for key, entry_size in oldest:
+                if not (entries >= self.max_entries or total_bytes + size > self.max_bytes):
+                    break
+                self._remove_keys(connection, [key])
+                entries -= 1
+                total_bytes -= entry_size
+                self._count('_evictions')
@@ -6,9 +6,11 @@ Main module for the MovieWeb application.
 
 import os
 import re # Import für reguläre Ausdrücke
-from flask import Flask, render_template, request, redirect, current_app, flash, jsonify, session, url_for, g
+from flask import Flask, render_template, request, redirect, current_app, flash, jsonify, session, url_for, g, has_request_context
+from flask.ctx import _AppCtxGlobals
 from datetime import datetime  # For year validation
 import requests  # For OMDb API calls
+import click
 from dotenv import load_dotenv
 from sqlalchemy import func, desc
 import urllib
@@ -25,7 +27,15 @@ OPENROUTER_API_KEY = os.getenv('OPENROUTER_API_KEY')
 
 from models import db, User, Movie, UserMovie, Comment
 from datamanager.sqlite_data_manager import SQLiteDataManager
+from datamanager.sqlite_engine import init_sqlite_engine
 from api.routes import api as api_blueprint
+from api.json_provider import FastJSONProvider
+from api.compression import init_compression
+from api.movie_lookup import lookup_movie
+from api.omdb_refresh import init_omdb_refresh, refresh_stale_movies
+from api.circuit_breaker import CircuitOpenError
+from api import http_client
+from api.serializers import serialize_movie_detail, serialize_comment
 
 # Flask-Anwendung initialisieren
 # Initialize Flask application
@@ -33,17 +43,26 @@ app = Flask(__name__)
 app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URI', 'sqlite:///moviewebapp.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev_secret')
+# JSON über orjson, falls installiert, sonst Standardbibliothek / JSON via orjson if installed, otherwise standard library
+app.json = FastJSONProvider(app)
+# gzip/brotli für größere Text-Antworten / gzip/brotli for larger text responses
+init_compression(app)
 
 csrf = CSRFProtect(app) # Initialize CSRFProtect / CSRFProtect initialisieren
 
-# Datenbank an die App binden
-# Bind database to the app
+# Datenbank an die App binden und SQLite-Profil (PRAGMAs) anwenden
+# Bind database to the app and apply the SQLite profile (PRAGMAs)
 db.init_app(app)
+init_sqlite_engine(app, db)
 
 # Blueprints registrieren
 # Register blueprints
 app.register_blueprint(api_blueprint, url_prefix='/api')
 
+# Hintergrund-Aktualisierung der OMDb-Bewertungen (nur mit OMDB_REFRESH_INTERVAL > 0)
+# Background refresh of the OMDb ratings (only with OMDB_REFRESH_INTERVAL > 0)
+init_omdb_refresh(app)
+
 # DataManager instanziieren
 # Instantiate DataManager
 data_manager = SQLiteDataManager()
@@ -81,6 +100,10 @@ NO_CLEAR_MOVIE_TITLE_MARKER = "NO_CLEAR_MOVIE_TITLE_FOUND_INTERNAL" # Internal m
 # --- Constants for AI response handling and error messages ---
 # --- Konstanten für die Handhabung von KI-Antworten und Fehlermeldungen ---
 AI_MODEL_FOR_REQUESTS = "openai/gpt-3.5-turbo"
+OPENROUTER_CHAT_URL = "https://openrouter.ai/api/v1/chat/completions"
+# Completions have no side effects, so POST is retried on 429/5xx as well; long read timeout for the generation
+# Completions haben keine Seiteneffekte, daher wird auch POST bei 429/5xx wiederholt; langer Read-Timeout für die Generierung
+http_client.register_host("https://openrouter.ai/", timeout=(3.05, 20), retry_methods=("GET", "POST"))
 AI_MSG_OPENROUTER_KEY_MISSING = "OpenRouter API Key not configured on server." # English only for user-facing
 AI_MSG_REQUEST_TIMEOUT = "AI service request timed out. Please try again later." # English only for user-facing
 AI_MSG_CONNECTION_ERROR_GENERIC = "Error connecting to AI service." # English only for user-facing
@@ -141,20 +164,58 @@ def get_ai_interpreted_movie_title(user_input: str, temperature: float = DEFAULT
         current_app.logger.warning(f"AI returned no response for title interpretation of input: '{user_input}'")
         return NO_CLEAR_MOVIE_TITLE_MARKER
 
-@app.before_request
-def load_logged_in_user():
+@app.cli.command('reconcile-ratings')
+def reconcile_ratings_command():
     """
-    Loads the logged-in user from the session before each request.
-    Sets `g.user` to the user object or None if not logged in.
+    CLI command: recomputes all community ratings with a single set-based SQL UPDATE to repair drift
+    of the incrementally maintained rating sums/counts. Usage: `flask reconcile-ratings`.
 
-    Lädt den eingeloggten Benutzer aus der Session vor jeder Anfrage.
-    Setzt `g.user` auf das Benutzerobjekt oder None, falls nicht eingeloggt.
+    CLI-Befehl: Berechnet alle Community-Ratings mit einem einzigen mengenbasierten SQL-UPDATE neu,
+    um Abweichungen der inkrementell gepflegten Bewertungssummen/-anzahlen zu reparieren.
     """
-    user_id = session.get('user_id')
-    if user_id is None:
-        g.user = None
+    updated = data_manager.reconcile_community_ratings()
+    if updated < 0:
+        print("Reconciliation failed, see log. / Abgleich fehlgeschlagen, siehe Log.")
     else:
-        g.user = data_manager.get_user_by_id(user_id)
+        print(f"Community ratings reconciled for {updated} movies. / Community-Ratings für {updated} Filme abgeglichen.")
+
+@app.cli.command('refresh-omdb')
+@click.option('--batch-size', type=int, default=None, help='Movies to refresh (default: OMDB_REFRESH_BATCH_SIZE).')
+def refresh_omdb_command(batch_size):
+    """
+    CLI command: refreshes imdb_rating, imdb_votes and metascore of the stalest movies once (one batch, within the
+    OMDb refresh quota), e.g. from cron instead of the background thread. Usage: `flask refresh-omdb`.
+
+    CLI-Befehl: Aktualisiert imdb_rating, imdb_votes und metascore der am längsten nicht aktualisierten Filme einmal
+    (ein Block, im Rahmen des OMDb-Kontingents), z.B. per Cron statt des Hintergrund-Threads.
+    """
+    result = refresh_stale_movies(batch_size) if batch_size else refresh_stale_movies()
+    print(f"OMDb refresh: {result['checked']} checked, {result['updated']} updated, {result['not_found']} not found"
+          f"{', stopped: ' + result['stopped'] if result['stopped'] else ''}.")
+
+class LazyUserGlobals(_AppCtxGlobals):
+    """
+    `g` with a lazily resolved `user`: the logged-in user is loaded from the session on first access
+    of `g.user` instead of before every request, so requests that never touch the user (static files,
+    JSON API reads) do not query the database for it. Assigning `g.user` (e.g. on logout) works as before.
+
+    `g` mit verzögert aufgelöstem `user`: Der eingeloggte Benutzer wird beim ersten Zugriff auf `g.user`
+    aus der Session geladen statt vor jeder Anfrage, daher fragen Anfragen, die den Benutzer nie benötigen
+    (statische Dateien, lesende JSON-API), die Datenbank nicht nach ihm ab. Das Setzen von `g.user` (z.B. beim Logout) funktioniert wie bisher.
+    """
+
+    @property
+    def user(self):
+        if '_user' not in self.__dict__:
+            user_id = session.get('user_id') if has_request_context() else None
+            self.__dict__['_user'] = data_manager.get_user_by_id(user_id) if user_id is not None else None
+        return self.__dict__['_user']
+
+    @user.setter
+    def user(self, value):
+        self.__dict__['_user'] = value
+
+app.app_ctx_globals_class = LazyUserGlobals
 
 @app.context_processor
 def inject_user_status():
@@ -247,10 +308,10 @@ def logout():
 @app.route('/users')
 def list_users():
     """
-    Users list route: displays all registered users.
-    Zeigt alle registrierten Benutzer an.
+    Users list route: displays all registered users with their movie counts.
+    Zeigt alle registrierten Benutzer mit ihrer Filmanzahl an.
     """
-    users = data_manager.get_all_users()
+    users = data_manager.get_users_with_movie_counts()
     return render_template('users.html', users=users)
 
 @app.route('/users/<int:user_id>')
@@ -380,13 +441,17 @@ def _fetch_movie_details_from_omdb_for_add_template(title_for_omdb_search: str)
         'ai_message': None, # For OMDb errors
         'flash_message': None # Tuple (message, category)
     }
-    params = {'apikey': OMDB_API_KEY, 't': title_for_omdb_search}
     omdb_api_response_data = None # To store the actual response from OMDb API
     try:
-        resp = requests.get('http://www.omdbapi.com/', params=params, timeout=10)
-        resp.raise_for_status()
-        omdb_api_response_data = resp.json()
+        # Local IMDb catalog only for a unique match, otherwise OMDb's own title search / Lokaler IMDb-Katalog nur bei eindeutigem Treffer, sonst die Titelsuche von OMDb
+        omdb_api_response_data = lookup_movie(title=title_for_omdb_search)
         context['omdb'] = omdb_api_response_data # Store full OMDb response under 'omdb' key
+    except CircuitOpenError as e:
+        # OMDb is failing; the page renders at once without details / OMDb ist gestört; die Seite wird sofort ohne Details angezeigt
+        current_app.logger.warning(f"OMDb lookup skipped for title '{title_for_omdb_search}': {e}")
+        omdb_api_response_data = {'Response': 'False', 'Error': 'OMDb is temporarily unavailable.'}
+        context['omdb'] = omdb_api_response_data
+        context['flash_message'] = (f"OMDb is temporarily unavailable, movie details could not be loaded. Please try again in about {round(e.retry_after)} seconds.", "warning")
     except requests.exceptions.RequestException as e:
         current_app.logger.error(f"OMDb API request failed for title '{title_for_omdb_search}': {e}")
         omdb_api_response_data = {'Response': 'False', 'Error': str(e)}
@@ -770,25 +835,9 @@ def movie_details(movie_id):
 
     comments = data_manager.get_comments_for_movie(movie_id)
     
-    movie_data = {
-        'id': movie.id,
-        'title': movie.title,
-        'director': movie.director,
-        'year': movie.year,
-        'community_rating': movie.community_rating,
-        'community_rating_count': movie.community_rating_count,
-        'plot': movie.plot,
-        'genre': movie.genre,
-        'runtime': movie.runtime,
-        'poster_url': movie.poster_url,
-        'imdb_id': movie.imdb_id
-    }
-    comments_data = [{
-        'id': c.id,
-        'text': c.text,
-        'user': c.user.name,
-        'created_at': c.created_at.isoformat()
-    } for c in comments]
+    # Same shapes as /api/movies/<id> / Dieselben Formen wie /api/movies/<id>
+    movie_data = serialize_movie_detail(movie)
+    comments_data = serialize_comment.many(comments)
 
     current_app.logger.info(f"Successfully retrieved details for movie {movie_id} for JSON endpoint.")
     return jsonify({
@@ -1163,16 +1212,16 @@ def ask_openrouter_for_movies(prompt_content: str, temperature: float, expected_
     current_app.logger.debug(f"Sending prompt to AI (model: {AI_MODEL_FOR_REQUESTS}, temp={temperature}, expecting ~{expected_responses} responses):\\n{prompt_content[:500]}...")
 
     try:
-        response = requests.post(
-            url="https://openrouter.ai/api/v1/chat/completions",
+        # Pooled keep-alive connection; 429/5xx are retried with backoff / Gepoolte Keep-Alive-Verbindung; 429/5xx werden mit Backoff wiederholt
+        response = http_client.post(
+            url=OPENROUTER_CHAT_URL,
             headers={"Authorization": f"Bearer {OPENROUTER_API_KEY}"},
             data=json.dumps({
                 "model": AI_MODEL_FOR_REQUESTS,
                 "messages": [{"role": "user", "content": prompt_content}],
                 "temperature": temperature,
                 "max_tokens": 150 if expected_responses > 1 else 50
-            }),
-            timeout=20
+            })
         )
         response.raise_for_status()
         data = response.json()
@@ -0,0 +1,89 @@
+"""
+benchmarks/cache_backends.py
+Vergleicht die Backends des API-Antwort-Caches (memory, sqlite): Trefferquote und Latenz mit mehreren per fork()
+gestarteten Workern, die zufällige GET /api/movies/<id> stellen, sowie die Latenz eines einzelnen Treffers im Backend.
+Compares the backends of the API response cache (memory, sqlite): hit ratio and latency with several workers
+started via fork() that issue random GET /api/movies/<id>, plus the latency of a single backend hit.
+
+    python -m benchmarks.cache_backends [--workers 4] [--requests 1500] [--movies 300]
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import shutil
+import statistics
+import tempfile
+import time
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the API response cache backends.')
+    parser.add_argument('--workers', type=int, default=4, help='Worker processes (default: %(default)s).')
+    parser.add_argument('--requests', type=int, default=1500, help='Requests per worker (default: %(default)s).')
+    parser.add_argument('--movies', type=int, default=300, help='Distinct /api/movies/<id> paths (default: %(default)s).')
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    os.environ['DATABASE_URI'] = f'sqlite:///{directory}/benchmark.db' # Read when importing the app / Wird beim Import der App gelesen
+    from app import app
+    from api import routes
+    from api.cache import CachedResponse, LRUTTLCache
+    from api.sqlite_cache import SQLiteCacheBackend
+    from models import db, User, Movie, Comment
+
+    with app.app_context():
+        db.create_all()
+        db.session.add(User(name='bench'))
+        db.session.execute(db.insert(Movie), [{'title': f'Movie {number}', 'year': 2000, 'plot': 'p' * 600}
+                                              for number in range(args.movies)])
+        db.session.execute(db.insert(Comment), [{'user_id': 1, 'movie_id': 1 + number % args.movies, 'text': 'comment text ' * 10}
+                                                for number in range(20 * args.movies)])
+        db.session.commit()
+        db.engine.dispose() # No connections inherited by the workers / Keine an die Worker vererbten Verbindungen
+    paths = [f'/api/movies/{movie_id}' for movie_id in range(1, args.movies + 1)]
+
+    def worker(seed: int, results) -> None:
+        client, rnd, timings = app.test_client(), random.Random(seed), []
+        for _ in range(args.requests):
+            path = rnd.choice(paths)
+            started = time.perf_counter()
+            client.get(path)
+            timings.append(time.perf_counter() - started)
+        stats = routes.cache.stats()
+        results.put((stats['hits'], stats['misses'], stats['entries'], statistics.median(timings)))
+
+    backends = (
+        ('memory', lambda: LRUTTLCache()),
+        ('sqlite', lambda: SQLiteCacheBackend(os.path.join(directory, 'cache.sqlite'))),
+    )
+    context = multiprocessing.get_context('fork')
+    print(f"{args.workers} workers x {args.requests} random GETs over {args.movies} paths:")
+    for name, create in backends:
+        routes.cache = create() # Looked up on every request / Wird bei jeder Anfrage nachgeschlagen
+        results = context.Queue()
+        workers = [context.Process(target=worker, args=(seed, results)) for seed in range(args.workers)]
+        for process in workers:
+            process.start()
+        outcomes = [results.get() for _ in workers]
+        for process in workers:
+            process.join()
+        hits, misses = sum(outcome[0] for outcome in outcomes), sum(outcome[1] for outcome in outcomes)
+        print(f"  {name:7} hit ratio {hits / (hits + misses):.3f}  misses {misses:5d}  "
+              f"entries per worker {[outcome[2] for outcome in outcomes]}  "
+              f"median request {statistics.median(outcome[3] for outcome in outcomes) * 1e6:.0f} us")
+
+    print("Backend get() of a 12 KB hit:")
+    for name, create in backends:
+        backend = create()
+        backend.set('benchmark', CachedResponse(b'x' * 12000, 200, 'application/json'))
+        rounds = 20000
+        started = time.perf_counter()
+        for _ in range(rounds):
+            backend.get('benchmark')
+        print(f"  {name:7} {(time.perf_counter() - started) / rounds * 1e6:6.1f} us")
+
+    shutil.rmtree(directory)
+
+if __name__ == '__main__':
+    main()
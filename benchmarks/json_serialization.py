@@ -0,0 +1,98 @@
+"""
+benchmarks/json_serialization.py
+Serialisierungsdurchsatz von GET /api/movies auf 100.000 Filmen: handgeschriebene Dictionaries gegen die
+kompilierten Serialisierer (api/serializers.py), json der Standardbibliothek gegen orjson (api/json_provider.py)
+und die Latenz des ungecachten Endpunkts mit beiden Encodern.
+Serialization throughput of GET /api/movies on 100,000 movies: hand-built dicts versus the compiled serializers
+(api/serializers.py), standard library json versus orjson (api/json_provider.py) and the latency of the uncached
+endpoint with both encoders.
+
+    python -m benchmarks.json_serialization [--movies 100000] [--limit 200] [--db /tmp/serialization_benchmark.db]
+
+orjson ist optional; ohne orjson wird nur die Standardbibliothek gemessen. Die Datenbank wird beim ersten Lauf
+angelegt und danach wiederverwendet.
+orjson is optional; without it only the standard library is measured. The database is created on the first run and
+reused afterwards.
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+import timeit
+
+from benchmarks.list_projections import movie_row
+
+def best_of(function, number: int) -> float:
+    """
+    Beste Zeit pro Aufruf aus drei Wiederholungen. / Best time per call out of three repetitions.
+    """
+    return min(timeit.repeat(function, number=number, repeat=3)) / number
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark JSON serialization of /api/movies.')
+    parser.add_argument('--movies', type=int, default=100000, help='Number of movies (default: %(default)s).')
+    parser.add_argument('--limit', type=int, default=200, help='Page size of /api/movies (default: %(default)s).')
+    parser.add_argument('--db', default=os.path.join(tempfile.gettempdir(), 'serialization_benchmark.db'),
+                        help='SQLite file, created if missing or of another size (default: %(default)s).')
+    args = parser.parse_args()
+
+    os.environ['DATABASE_URI'] = f'sqlite:///{args.db}' # Read when importing the app / Wird beim Import der App gelesen
+    from app import app
+    from api.routes import cache
+    from api.json_provider import FastJSONProvider, orjson
+    from api.serializers import serialize_movie_summary
+    from models import db, Movie
+    from datamanager.sqlite_data_manager import SQLiteDataManager
+    data_manager = SQLiteDataManager()
+
+    with app.app_context():
+        if not db.inspect(db.engine).has_table('movies') or Movie.query.count() != args.movies:
+            print(f"Seeding {args.movies:,} movies into {args.db} ...")
+            db.drop_all()
+            db.create_all()
+            db.session.execute(db.insert(Movie), [movie_row(number) for number in range(args.movies)])
+            db.session.commit()
+
+    encoders = (False, True) if orjson is not None else (False,)
+    with app.test_request_context(f'/api/movies?limit={args.limit}'):
+        movies, next_cursor = data_manager.get_movie_summaries_page(args.limit)
+
+        def hand_built():
+            return [{'id': m.id, 'title': m.title, 'director': m.director, 'year': m.year,
+                     'community_rating': m.community_rating, 'community_rating_count': m.community_rating_count,
+                     'poster_url': m.poster_url} for m in movies]
+
+        print(f"Dict building ({len(movies)} movies):")
+        for label, build in (('hand-built dicts', hand_built), ('compiled .many', lambda: serialize_movie_summary.many(movies))):
+            print(f"  {label:24} {best_of(build, 2000) * 1e6:8.1f} us")
+
+        payload = {'success': True, 'movies': serialize_movie_summary.many(movies), 'limit': args.limit,
+                   'next_cursor': next_cursor}
+        print("Encoding + Response:")
+        for use_orjson in encoders:
+            FastJSONProvider.use_orjson = use_orjson
+            elapsed = best_of(lambda: app.json.response(payload), 2000)
+            size = len(app.json.response(payload).get_data())
+            label = 'orjson' if use_orjson else 'stdlib json'
+            print(f"  {label:24} {elapsed * 1e6:8.1f} us  ({size:,} bytes, {size / elapsed / 2 ** 20:5.0f} MiB/s)")
+
+    client = app.test_client()
+    path = f'/api/movies?limit={args.limit}'
+    print(f"GET {path} (response cache cleared before each request, median of 300):")
+    for use_orjson in encoders:
+        FastJSONProvider.use_orjson = use_orjson
+        timings = []
+        for _ in range(300):
+            cache.clear()
+            started = time.perf_counter()
+            client.get(path)
+            timings.append(time.perf_counter() - started)
+        median = statistics.median(timings)
+        label = 'orjson' if use_orjson else 'stdlib json'
+        print(f"  {label:24} {median * 1000:8.2f} ms  ({1 / median:5.0f} req/s)")
+    FastJSONProvider.use_orjson = orjson is not None
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""
+benchmarks/list_projections.py
+ORM-Entitäten gegen Spalten-Projektionen (datamanager/records.py) für die Listenendpunkte auf 100.000 Filmen mit
+realistischen Textspalten und einem Benutzer, der mit allen verknüpft ist: alle Seiten durchlaufen, alle Zeilen auf
+einmal laden (Zeit und Speicher) und die Latenz von GET /api/movies und GET /api/users/<id>/movies.
+ORM entities versus column projections (datamanager/records.py) for the list endpoints on 100,000 movies with
+realistic text columns and one user linked to all of them: walking every page, loading all rows at once (time and
+memory) and the latency of GET /api/movies and GET /api/users/<id>/movies.
+
+    python -m benchmarks.list_projections [--movies 100000] [--db /tmp/projections_benchmark.db]
+
+Die Datenbank wird beim ersten Lauf angelegt und danach wiederverwendet. / The database is created on the first run
+and reused afterwards.
+"""
+
+import argparse
+import gc
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+PAGE_SIZE = 200
+
+def movie_row(number: int) -> dict:
+    return {
+        'title': f'Title {number:06d}', 'year': 1950 + number % 70, 'director': 'Some Director',
+        'poster_url': 'https://m.media-amazon.com/images/M/' + 'x' * 60 + '.jpg',
+        'plot': 'A plot sentence that goes on. ' * 12, 'actors': 'Actor One, Actor Two, Actor Three, Actor Four',
+        'awards': 'Won 3 Oscars. Another 150 wins & 200 nominations.', 'writer': 'Writer A, Writer B',
+        'genre': 'Drama, Crime', 'language': 'English, Italian', 'country': 'United States', 'runtime': '142 min',
+        'community_rating': 3.5, 'community_rating_count': 4,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark ORM hydration against column projections.')
+    parser.add_argument('--movies', type=int, default=100000, help='Number of movies (default: %(default)s).')
+    parser.add_argument('--db', default=os.path.join(tempfile.gettempdir(), 'projections_benchmark.db'),
+                        help='SQLite file, created if missing or of another size (default: %(default)s).')
+    args = parser.parse_args()
+
+    os.environ['DATABASE_URI'] = f'sqlite:///{args.db}' # Read when importing the app / Wird beim Import der App gelesen
+    from sqlalchemy import select
+    from app import app
+    from api.routes import cache
+    from models import db, Movie, User, UserMovie
+    from datamanager.records import MovieSummary
+    from datamanager.sqlite_data_manager import SQLiteDataManager
+    data_manager = SQLiteDataManager()
+
+    with app.app_context():
+        if not db.inspect(db.engine).has_table('movies') or Movie.query.count() != args.movies:
+            print(f"Seeding {args.movies:,} movies into {args.db} ...")
+            db.drop_all()
+            db.create_all()
+            db.session.execute(db.insert(Movie), [movie_row(number) for number in range(args.movies)])
+            db.session.execute(db.insert(User), [{'name': 'bench'}])
+            db.session.execute(db.insert(UserMovie), [{'user_id': 1, 'movie_id': movie_id, 'user_rating': 4.0}
+                                                      for movie_id in range(1, args.movies + 1)])
+            db.session.commit()
+        user_id = User.query.filter_by(name='bench').one().id
+
+    def walk(fetch_page, to_tuple) -> int:
+        cursor, rows = None, 0
+        while True:
+            page, cursor = fetch_page(cursor)
+            rows += len([to_tuple(row) for row in page])
+            db.session.expunge_all()
+            if not cursor:
+                return rows
+
+    def movie_tuple(movie):
+        return (movie.id, movie.title, movie.director, movie.year, movie.community_rating,
+                movie.community_rating_count, movie.poster_url)
+
+    def link_tuple(link):
+        return movie_tuple(link.movie) + (link.user_rating,)
+
+    def summary_tuple(summary):
+        return tuple(getattr(summary, name) for name in summary.COLUMNS)
+
+    walks = (
+        ('/movies pages, ORM', lambda cursor: data_manager.get_movies_page(PAGE_SIZE, cursor), movie_tuple),
+        ('/movies pages, projection', lambda cursor: data_manager.get_movie_summaries_page(PAGE_SIZE, cursor), summary_tuple),
+        ('user list pages, ORM', lambda cursor: data_manager.get_user_movie_relations_page(user_id, PAGE_SIZE, cursor), link_tuple),
+        ('user list pages, projection', lambda cursor: data_manager.get_user_movie_summaries_page(user_id, PAGE_SIZE, cursor), summary_tuple),
+    )
+    with app.app_context():
+        print(f"Every page (limit {PAGE_SIZE}):")
+        for label, fetch_page, to_tuple in walks:
+            gc.collect()
+            started = time.perf_counter()
+            rows = walk(fetch_page, to_tuple)
+            print(f"  {label:28} {time.perf_counter() - started:6.2f} s  ({rows:,} rows)")
+
+        print("All rows at once (tracemalloc on):")
+        loads = (
+            ('ORM Movie.query.all()', lambda: Movie.query.all()),
+            ('projection', lambda: [MovieSummary(*row) for row in
+                                    db.session.execute(select(*[getattr(Movie, column) for column in MovieSummary.COLUMNS]))]),
+        )
+        for label, load in loads:
+            gc.collect()
+            tracemalloc.start()
+            started = time.perf_counter()
+            rows = load()
+            elapsed = time.perf_counter() - started
+            retained, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"  {label:28} {elapsed:6.2f} s  retained {retained / 2 ** 20:6.1f} MiB  peak {peak / 2 ** 20:6.1f} MiB")
+            del rows
+            db.session.expunge_all()
+
+    client = app.test_client()
+    print("Endpoints (response cache cleared before each request, median of 30):")
+    for path in (f'/api/movies?limit={PAGE_SIZE}', f'/api/users/{user_id}/movies?limit={PAGE_SIZE}'):
+        timings = []
+        for _ in range(30):
+            cache.clear()
+            started = time.perf_counter()
+            client.get(path)
+            timings.append(time.perf_counter() - started)
+        print(f"  {path:36} {statistics.median(timings) * 1000:6.1f} ms")
+
+if __name__ == '__main__':
+    main()
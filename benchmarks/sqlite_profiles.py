@@ -0,0 +1,92 @@
+"""
+benchmarks/sqlite_profiles.py
+Vergleicht die SQLite-Profile (datamanager/sqlite_engine.py) auf einer temporären Datenbankdatei: Commits pro Sekunde
+einzeln, danach Lese- und Schreibdurchsatz mit mehreren gleichzeitigen Lesern und einem Schreiber.
+Compares the SQLite profiles (datamanager/sqlite_engine.py) on a temporary database file: single commits per second,
+then read and write throughput with several concurrent readers and one writer.
+
+    python -m benchmarks.sqlite_profiles [--commits 500] [--readers 4] [--seconds 1.5]
+"""
+
+import argparse
+import shutil
+import tempfile
+import threading
+import time
+from flask import Flask
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from models import db, Movie
+from datamanager.sqlite_engine import SQLITE_PROFILES, init_sqlite_engine
+
+NO_PRAGMAS = 'none' # SQLite defaults (rollback journal), the state before the profiles / SQLite-Standard, der Zustand vor den Profilen
+
+def create_app(path: str, profile: str) -> Flask:
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{path}'
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    db.init_app(app)
+    if profile != NO_PRAGMAS:
+        app.config['SQLITE_PROFILE'] = profile
+        init_sqlite_engine(app, db)
+    return app
+
+def run_for(app: Flask, seconds: float, action, counts: dict, name: str) -> None:
+    with app.app_context():
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            try:
+                action()
+                counts[name] += 1
+            except OperationalError: # "database is locked"
+                db.session.rollback()
+                counts['locked'] += 1
+        db.session.remove()
+
+def benchmark(profile: str, commits: int, readers: int, seconds: float) -> dict:
+    directory = tempfile.mkdtemp()
+    try:
+        app = create_app(f'{directory}/benchmark.db', profile)
+        with app.app_context():
+            db.create_all()
+            started = time.perf_counter()
+            for number in range(commits):
+                db.session.add(Movie(title=f'Movie {number}', year=2000))
+                db.session.commit()
+            commits_per_second = commits / (time.perf_counter() - started)
+
+        def read():
+            db.session.execute(text('SELECT COUNT(*) FROM movies')).scalar()
+
+        def write():
+            db.session.add(Movie(title='Written', year=2001))
+            db.session.commit()
+
+        counts = {'reads': 0, 'writes': 0, 'locked': 0}
+        threads = [threading.Thread(target=run_for, args=(app, seconds, read, counts, 'reads')) for _ in range(readers)]
+        threads.append(threading.Thread(target=run_for, args=(app, seconds, write, counts, 'writes')))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        with app.app_context():
+            db.engine.dispose()
+        return {'commits/s': commits_per_second, 'reads/s': counts['reads'] / seconds,
+                'writes/s': counts['writes'] / seconds, 'locked': counts['locked']}
+    finally:
+        shutil.rmtree(directory)
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the SQLite PRAGMA profiles.')
+    parser.add_argument('--commits', type=int, default=500, help='Single-row commits (default: %(default)s).')
+    parser.add_argument('--readers', type=int, default=4, help='Concurrent reader threads (default: %(default)s).')
+    parser.add_argument('--seconds', type=float, default=1.5, help='Duration of the concurrent phase (default: %(default)s).')
+    args = parser.parse_args()
+
+    print(f"{'profile':16} {'commits/s':>10} {'reads/s':>10} {'writes/s':>10} {'locked':>7}")
+    for profile in (NO_PRAGMAS, *SQLITE_PROFILES):
+        result = benchmark(profile, args.commits, args.readers, args.seconds)
+        print(f"{profile:16} {result['commits/s']:10.0f} {result['reads/s']:10.0f} {result['writes/s']:10.0f} {result['locked']:7d}")
+
+if __name__ == '__main__':
+    main()
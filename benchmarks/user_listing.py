@@ -0,0 +1,74 @@
+"""
+benchmarks/user_listing.py
+Benutzerliste mit Filmanzahl auf einem großen Datenbestand (Standard: 50.000 Benutzer mit je 0-10 Filmen): Zeit und
+Spitzenspeicher (tracemalloc) der aggregierten Abfrage, der Seite /users und - optional, dauert Minuten - des
+früheren Wegs über len(user.movies) pro Benutzer.
+User listing with movie counts on a large dataset (default: 50,000 users with 0-10 movies each): time and peak
+memory (tracemalloc) of the aggregated query, the /users page and - optionally, takes minutes - the former
+len(user.movies) per user.
+
+    python -m benchmarks.user_listing [--users 50000] [--db /tmp/users_benchmark.db] [--per-user]
+
+Die Datenbank wird beim ersten Lauf angelegt und danach wiederverwendet. / The database is created on the first run
+and reused afterwards.
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+def seed(db, User, Movie, UserMovie, users: int, movies: int = 2000) -> None:
+    db.drop_all()
+    db.create_all()
+    db.session.execute(db.insert(Movie), [{'title': f'Movie {number}', 'year': 2000} for number in range(movies)])
+    db.session.execute(db.insert(User), [{'name': f'user{number}'} for number in range(users)])
+    rnd = random.Random(1)
+    links = [{'user_id': user_id, 'movie_id': movie_id, 'user_rating': 3.0}
+             for user_id in range(1, users + 1)
+             for movie_id in rnd.sample(range(1, movies + 1), rnd.randint(0, 10))]
+    db.session.execute(db.insert(UserMovie), links)
+    db.session.commit()
+
+def measure(app, label: str, action) -> None:
+    with app.app_context():
+        tracemalloc.start()
+        started = time.perf_counter()
+        rows = action()
+        elapsed = time.perf_counter() - started
+        _current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    print(f"{label:28} {elapsed:8.2f} s {peak / 2 ** 20:8.1f} MiB  {rows}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the user listing with movie counts.')
+    parser.add_argument('--users', type=int, default=50000, help='Number of users (default: %(default)s).')
+    parser.add_argument('--db', default=os.path.join(tempfile.gettempdir(), 'users_benchmark.db'),
+                        help='SQLite file, created if missing or of another size (default: %(default)s).')
+    parser.add_argument('--per-user', action='store_true', help='Also measure len(user.movies) per user (slow).')
+    args = parser.parse_args()
+
+    os.environ['DATABASE_URI'] = f'sqlite:///{args.db}' # Read when importing the app / Wird beim Import der App gelesen
+    from app import app
+    from models import db, User, Movie, UserMovie
+    from datamanager.sqlite_data_manager import SQLiteDataManager
+    data_manager = SQLiteDataManager()
+
+    with app.app_context():
+        if not db.inspect(db.engine).has_table('users') or User.query.count() != args.users:
+            print(f"Seeding {args.users:,} users into {args.db} ...")
+            seed(db, User, Movie, UserMovie, args.users)
+        print(f"{User.query.count():,} users, {UserMovie.query.count():,} links")
+
+    print(f"{'':28} {'time':>10} {'peak':>12}  rows")
+    if args.per_user:
+        measure(app, 'len(user.movies) per user',
+                lambda: len([(user.id, user.name, len(user.movies)) for user in data_manager.get_all_users()]))
+    measure(app, 'get_users_with_movie_counts', lambda: len(data_manager.get_users_with_movie_counts()))
+    client = app.test_client()
+    measure(app, 'GET /users', lambda: client.get('/users').status_code)
+
+if __name__ == '__main__':
+    main()
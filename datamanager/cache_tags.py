@@ -0,0 +1,63 @@
+"""
+cache_tags.py
+Cache-Tags und Invalidierungs-Hook zwischen DataManager und Antwort-Caches.
+Cache tags and invalidation hook between the DataManager and response caches.
+
+Der DataManager sammelt während einer Unit-of-Work die Tags der geänderten Daten und meldet sie nach dem Commit
+an alle registrierten Listener (z.B. den API-Antwort-Cache). Nach einem Rollback wird nichts gemeldet.
+The DataManager collects the tags of changed data during a unit of work and reports them after the commit
+to all registered listeners (e.g. the API response cache). Nothing is reported after a rollback.
+
+Tags / Tags:
+    'users'       Benutzerliste inkl. Filmanzahlen. / User list including movie counts.
+    'catalog'     Zusammensetzung des Filmkatalogs (Filme angelegt/gelöscht). / Composition of the movie catalog (movies created/deleted).
+    'user:<id>'   Ein Benutzer und seine Filmliste. / One user and their movie list.
+    'movie:<id>'  Ein Film, seine Bewertungen und Kommentare. / One movie, its ratings and comments.
+    '*'           Alles (z.B. nach einem vollständigen Abgleich). / Everything (e.g. after a full reconciliation).
+"""
+
+from typing import Callable, Iterable, List
+from flask import current_app, has_app_context
+
+USERS_TAG = 'users'
+CATALOG_TAG = 'catalog'
+ALL_TAG = '*'
+
+_listeners: List[Callable[[frozenset], None]] = []
+
+def user_tag(user_id: int) -> str:
+    """
+    Tag eines Benutzers. / Tag of a user.
+    """
+    return f'user:{user_id}'
+
+def movie_tag(movie_id: int) -> str:
+    """
+    Tag eines Films. / Tag of a movie.
+    """
+    return f'movie:{movie_id}'
+
+def register_invalidation_listener(listener: Callable[[frozenset], None]) -> None:
+    """
+    Registriert eine Funktion, die nach jedem Commit mit den Tags der geänderten Daten aufgerufen wird.
+    Registers a function that is called with the tags of the changed data after every commit.
+    """
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+def emit_invalidations(tags: Iterable[str]) -> None:
+    """
+    Meldet `tags` an alle Listener. Fehler eines Listeners werden geloggt, aber nicht weitergereicht,
+    da die Änderung bereits committet ist.
+    Reports `tags` to all listeners. A listener's errors are logged but not propagated,
+    as the change is already committed.
+    """
+    tags = frozenset(tags)
+    if not tags:
+        return
+    for listener in list(_listeners):
+        try:
+            listener(tags)
+        except Exception as e:
+            if has_app_context():
+                current_app.logger.error(f"Cache invalidation listener failed for tags {sorted(tags)}: {e}.")
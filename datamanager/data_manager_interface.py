@@ -5,8 +5,11 @@ Defines the interface for DataManager implementations.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from models import User, Movie, Comment, UserMovie
+from datetime import date, datetime
+from typing import Iterator, List, Optional, Sequence, Tuple
+from sqlalchemy import Row
+from models import User, Movie, Comment, UserMovie, OmdbCacheEntry
+from datamanager.records import MovieSummary, UserMovieSummary
 
 class DataManagerInterface(ABC):
     """
@@ -23,6 +26,30 @@ class DataManagerInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_users_with_movie_counts(self) -> List[tuple[int, str, int]]:
+        """
+        Liefert (id, name, movie_count) für alle Benutzer.
+        Returns (id, name, movie_count) for all users.
+        """
+        pass
+
+    @abstractmethod
+    def get_users_with_movie_counts_page(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> Tuple[List[tuple[int, str, int]], Optional[str]]:
+        """
+        Liefert eine Seite von (id, name, movie_count) und den Cursor der nächsten Seite (None auf der letzten Seite).
+        Returns one page of (id, name, movie_count) and the cursor of the next page (None on the last page).
+        """
+        pass
+
+    @abstractmethod
+    def get_users_with_movie_counts_by_ids(self, user_ids: Sequence[int]) -> List[tuple[int, str, int]]:
+        """
+        Liefert (id, name, movie_count) der angegebenen Benutzer in einer Abfrage; unbekannte IDs fehlen im Ergebnis.
+        Returns (id, name, movie_count) of the given users in one query; unknown IDs are missing from the result.
+        """
+        pass
+
     @abstractmethod
     def get_user_movies(self, user_id: int) -> List[Movie]:
         """
@@ -47,6 +74,15 @@ class DataManagerInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def add_movies_bulk(self, user_id: int, movies: List[dict]) -> Optional[List[dict]]:
+        """
+        Fügt viele Filme in einer Transaktion zur Liste eines Benutzers hinzu.
+        Adds many movies to a user's list in one transaction.
+        Gibt pro Eintrag ein Ergebnis zurück (None bei Fehler). / Returns one result per entry (None on error).
+        """
+        pass
+
     @abstractmethod
     def update_user_rating_for_movie(self, user_id: int, movie_id: int, new_rating: Optional[float]) -> bool:
         """
@@ -64,6 +100,15 @@ class DataManagerInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def reconcile_community_ratings(self) -> int:
+        """
+        Berechnet alle Community-Ratings aus den gespeicherten Bewertungen neu.
+        Recomputes all community ratings from the stored ratings.
+        Gibt die Anzahl aktualisierter Filme zurück (-1 bei Fehler). / Returns the number of movies updated (-1 on error).
+        """
+        pass
+
     @abstractmethod
     def get_top_movies(self, limit: int = 10) -> List[tuple[Movie, int, Optional[float]]]:
         """
@@ -92,10 +137,30 @@ class DataManagerInterface(ABC):
         pass
 
     @abstractmethod
-    def get_user_movie_relations(self, user_id: int) -> List[UserMovie]:
+    def get_user_movie_relations(self, user_id: int, loading: str = 'joined') -> List[UserMovie]:
         """
         Liefert alle UserMovie-Objekte (Verknüpfungen) für einen bestimmten Benutzer.
         Returns all UserMovie objects (relations) for a given user.
+        `loading` wählt das Ladeprofil für die zugehörigen Filme ('joined', 'selectin', 'lazy').
+        `loading` selects the loading profile for the related movies ('joined', 'selectin', 'lazy').
+        """
+        pass
+
+    @abstractmethod
+    def get_user_movie_relations_page(self, user_id: int, limit: Optional[int] = None, cursor: Optional[str] = None,
+                                      loading: str = 'joined') -> Tuple[List[UserMovie], Optional[str]]:
+        """
+        Liefert eine Seite der UserMovie-Objekte eines Benutzers und den Cursor der nächsten Seite.
+        Returns one page of a user's UserMovie objects and the cursor of the next page.
+        """
+        pass
+
+    @abstractmethod
+    def get_user_movie_summaries_page(self, user_id: int, limit: Optional[int] = None,
+                                      cursor: Optional[str] = None) -> Tuple[List[UserMovieSummary], Optional[str]]:
+        """
+        Wie get_user_movie_relations_page, aber als schlanke, schreibgeschützte Datensätze.
+        Like get_user_movie_relations_page, but as lightweight read-only records.
         """
         pass
 
@@ -107,6 +172,103 @@ class DataManagerInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_movie_fields(self, movie_id: int, fields: Sequence[str]) -> Optional[Row]:
+        """
+        Liefert nur die angegebenen Spalten eines Films als schreibgeschützte Zeile.
+        Returns only the given columns of a movie as a read-only row.
+        """
+        pass
+
+    @abstractmethod
+    def get_movie_fields_by_ids(self, movie_ids: Sequence[int], fields: Sequence[str]) -> List[Row]:
+        """
+        Liefert die angegebenen Spalten mehrerer Filme in einer Abfrage; unbekannte IDs fehlen im Ergebnis.
+        Returns the given columns of several movies in one query; unknown IDs are missing from the result.
+        """
+        pass
+
+    @abstractmethod
+    def iter_movie_field_batches(self, fields: Sequence[str], batch_size: int = 1000) -> Iterator[List[Row]]:
+        """
+        Streamt die angegebenen Spalten aller Filme (nach ID sortiert) stapelweise mit konstantem Speicherbedarf.
+        Streams the given columns of all movies (ordered by ID) in batches with constant memory use.
+        """
+        pass
+
+    @abstractmethod
+    def get_omdb_cache_entry(self, cache_key: str) -> Optional[OmdbCacheEntry]:
+        """
+        Liefert eine gecachte OMDb-Antwort anhand ihres Cache-Schlüssels.
+        Returns a cached OMDb response by its cache key.
+        """
+        pass
+
+    @abstractmethod
+    def save_omdb_cache_entry(self, cache_keys: Sequence[str], payload: str, found: bool, imdb_id: Optional[str] = None) -> bool:
+        """
+        Speichert eine rohe OMDb-Antwort unter einem oder mehreren Cache-Schlüsseln.
+        Stores a raw OMDb response under one or more cache keys.
+        """
+        pass
+
+    @abstractmethod
+    def get_stale_movies(self, limit: int, refreshed_before: datetime) -> List[Row]:
+        """
+        Liefert Filme, deren OMDb-Daten zuletzt vor `refreshed_before` (oder nie) aktualisiert wurden, die ältesten zuerst.
+        Retrieves movies whose OMDb data was last refreshed before `refreshed_before` (or never), stalest first.
+        """
+        pass
+
+    @abstractmethod
+    def update_movie_refresh_data(self, updates: Sequence[dict]) -> int:
+        """
+        Schreibt aktualisierte OMDb-Daten (Rating, Stimmen, Metascore) vieler Filme in einer Transaktion.
+        Writes refreshed OMDb data (rating, votes, metascore) of many movies in one transaction.
+        """
+        pass
+
+    @abstractmethod
+    def reserve_omdb_refresh_calls(self, day: date, daily_quota: int, wanted: int) -> int:
+        """
+        Reserviert bis zu `wanted` OMDb-Aufrufe des Tageskontingents der Aktualisierung; gibt die gewährte Anzahl zurück.
+        Reserves up to `wanted` OMDb calls of the refresh's daily quota; returns the number granted.
+        """
+        pass
+
+    @abstractmethod
+    def release_omdb_refresh_calls(self, day: date, unused: int) -> bool:
+        """
+        Gibt reservierte, nicht genutzte OMDb-Aufrufe zurück. / Gives back reserved, unused OMDb calls.
+        """
+        pass
+
+    @abstractmethod
+    def pause_omdb_refresh(self, day: date, daily_quota: int, until: datetime) -> bool:
+        """
+        Verbraucht das Tageskontingent und pausiert die Aktualisierung bis `until` (UTC).
+        Uses up the daily quota and pauses the refresh until `until` (UTC).
+        """
+        pass
+
+    @abstractmethod
+    def get_omdb_refresh_quota(self, day: date) -> Optional[dict]:
+        """
+        Liefert 'calls' des Tages und 'paused_until' der Aktualisierung. / Returns the day's 'calls' and the refresh's 'paused_until'.
+        """
+        pass
+
+    @abstractmethod
+    def get_local_catalog_entry(self, title: Optional[str] = None, imdb_id: Optional[str] = None,
+                                year: Optional[int] = None, unique: bool = False) -> Optional[dict]:
+        """
+        Sucht einen Film im lokalen IMDb-Katalog und liefert ihn als OMDb-ähnliches Dictionary (ohne Poster/Plot).
+        Mit unique=True nur bei eindeutigem Titel/Jahr-Treffer.
+        Looks up a movie in the local IMDb catalog and returns it as an OMDb-like dict (without poster/plot).
+        With unique=True only for a unique title/year match.
+        """
+        pass
+
     @abstractmethod
     def add_comment(self, movie_id: int, user_id: int, text: str) -> Optional[Comment]:
         """
@@ -123,6 +285,22 @@ class DataManagerInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_movies_page(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> Tuple[List[Movie], Optional[str]]:
+        """
+        Liefert eine Seite von Filmen (nach Titel sortiert) und den Cursor der nächsten Seite.
+        Returns one page of movies (ordered by title) and the cursor of the next page.
+        """
+        pass
+
+    @abstractmethod
+    def get_movie_summaries_page(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> Tuple[List[MovieSummary], Optional[str]]:
+        """
+        Wie get_movies_page, aber als schlanke, schreibgeschützte Datensätze.
+        Like get_movies_page, but as lightweight read-only records.
+        """
+        pass
+
     @abstractmethod
     def get_comments_for_movie(self, movie_id: int) -> List[Comment]:
         """
@@ -131,6 +309,14 @@ class DataManagerInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_comments_for_movie_page(self, movie_id: int, limit: Optional[int] = None, cursor: Optional[str] = None) -> Tuple[List[Comment], Optional[str]]:
+        """
+        Liefert eine Seite der Kommentare eines Films (neueste zuerst) und den Cursor der nächsten Seite.
+        Returns one page of a movie's comments (newest first) and the cursor of the next page.
+        """
+        pass
+
     @abstractmethod
     def get_user_movie_link(self, user_id: int, movie_id: int) -> Optional[UserMovie]:
         """
@@ -0,0 +1,191 @@
+"""
+datamanager/imdb_import.py
+Importiert die öffentlichen IMDb-Datensätze (https://datasets.imdbws.com/) aus lokalen TSV-Dateien (.tsv oder .tsv.gz)
+in die Tabellen imdb_titles und imdb_names. Die Dateien werden zeilenweise gelesen und in Blöcken von `chunk_size`
+Zeilen geschrieben (ein Commit pro Block), der Speicherbedarf hängt also nicht von der Dateigröße ab.
+Imports the public IMDb datasets (https://datasets.imdbws.com/) from local TSV files (.tsv or .tsv.gz)
+into the tables imdb_titles and imdb_names. The files are read line by line and written in chunks of `chunk_size`
+rows (one commit per chunk), so memory use does not depend on the file size.
+
+Reihenfolge / Order: title.basics -> title.ratings -> title.crew -> name.basics. Ratings und Crew ergänzen nur bereits
+importierte Titel; aus name.basics werden nur Personen übernommen, die als Regie oder Drehbuch eines Titels vorkommen.
+Ratings and crew only complete already imported titles; from name.basics only people listed as director or
+writer of a title are taken.
+
+Alle Funktionen müssen innerhalb eines App-Kontexts aufgerufen werden. / All functions must be called inside an app context.
+"""
+
+import gzip
+from array import array
+from bisect import bisect_left
+from itertools import islice
+from typing import Callable, Collection, Iterable, Iterator, List, Optional
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from models import db, ImdbTitle, ImdbName
+
+IMDB_NULL = '\\N' # Missing value in the dumps / Fehlender Wert in den Dumps
+DEFAULT_TITLE_TYPES = frozenset({'movie', 'tvMovie'})
+DEFAULT_CHUNK_SIZE = 5000
+
+def _read_tsv(path: str) -> Iterator[List[str]]:
+    """
+    Liefert die Datenzeilen einer IMDb-TSV-Datei als Listen (ohne Kopfzeile). Die Dumps sind nicht gequotet,
+    ein Split am Tabulator genügt.
+    Yields the data rows of an IMDb TSV file as lists (without the header). The dumps are not quoted,
+    splitting at the tab is enough.
+    """
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8', newline='\n') as tsv_file:
+        next(tsv_file, None) # Header / Kopfzeile
+        for line in tsv_file:
+            yield line.rstrip('\n').split('\t')
+
+def _chunks(rows: Iterable[dict], chunk_size: int) -> Iterator[List[dict]]:
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def _value(raw: str) -> Optional[str]:
+    return None if raw == IMDB_NULL else raw
+
+def _int(raw: str) -> Optional[int]:
+    return None if raw == IMDB_NULL or not raw.isdigit() else int(raw)
+
+def _write_chunks(statement, rows: Iterable[dict], chunk_size: int, progress: Optional[Callable[[int], None]]) -> int:
+    """
+    Führt `statement` blockweise als executemany aus, mit einem Commit pro Block.
+    Executes `statement` chunk by chunk as executemany, with one commit per chunk.
+
+    Returns:
+        int: Anzahl geschriebener Zeilen. / Number of rows written.
+    """
+    written = 0
+    try:
+        for chunk in _chunks(rows, chunk_size):
+            db.session.execute(statement, chunk)
+            db.session.commit()
+            written += len(chunk)
+            if progress is not None:
+                progress(written)
+    except Exception:
+        db.session.rollback()
+        raise
+    return written
+
+def import_title_basics(path: str, title_types: Collection[str] = DEFAULT_TITLE_TYPES, include_adult: bool = False,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE, progress: Optional[Callable[[int], None]] = None) -> int:
+    """
+    Importiert title.basics (nur die gewünschten Titeltypen). Bereits vorhandene Titel werden aktualisiert,
+    ihre Ratings und Crew bleiben erhalten.
+    Imports title.basics (only the wanted title types). Existing titles are updated, their ratings and crew are kept.
+
+    Returns:
+        int: Anzahl importierter Titel. / Number of imported titles.
+    """
+    def rows() -> Iterator[dict]:
+        for tconst, title_type, primary_title, original_title, is_adult, start_year, _end_year, runtime, genres in _read_tsv(path):
+            if title_type not in title_types or (is_adult == '1' and not include_adult):
+                continue
+            yield {
+                'tconst': tconst, 'title_type': title_type, 'primary_title': primary_title,
+                'original_title': _value(original_title), 'start_year': _int(start_year),
+                'runtime_minutes': _int(runtime), 'genres': _value(genres),
+            }
+
+    statement = sqlite_insert(ImdbTitle)
+    statement = statement.on_conflict_do_update(
+        index_elements=[ImdbTitle.tconst],
+        set_={name: statement.excluded[name] for name in
+              ('title_type', 'primary_title', 'original_title', 'start_year', 'runtime_minutes', 'genres')}
+    )
+    return _write_chunks(statement, rows(), chunk_size, progress)
+
+def import_title_ratings(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                         progress: Optional[Callable[[int], None]] = None) -> int:
+    """
+    Übernimmt averageRating und numVotes aus title.ratings für bereits importierte Titel.
+    Takes averageRating and numVotes from title.ratings for already imported titles.
+
+    Returns:
+        int: Anzahl gelesener Zeilen. / Number of rows read.
+    """
+    def rows() -> Iterator[dict]:
+        for tconst, average_rating, num_votes in _read_tsv(path):
+            yield {'key': tconst, 'average_rating': float(average_rating), 'num_votes': int(num_votes)}
+
+    titles = ImdbTitle.__table__
+    statement = (
+        update(titles)
+        .where(titles.c.tconst == bindparam('key'))
+        .values(average_rating=bindparam('average_rating'), num_votes=bindparam('num_votes'))
+    )
+    return _write_chunks(statement, rows(), chunk_size, progress)
+
+def import_title_crew(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                      progress: Optional[Callable[[int], None]] = None) -> int:
+    """
+    Übernimmt Regie und Drehbuch (als nconst-Listen) aus title.crew für bereits importierte Titel.
+    Takes directors and writers (as nconst lists) from title.crew for already imported titles.
+
+    Returns:
+        int: Anzahl gelesener Zeilen. / Number of rows read.
+    """
+    def rows() -> Iterator[dict]:
+        for tconst, directors, writers in _read_tsv(path):
+            yield {'key': tconst, 'directors': _value(directors), 'writers': _value(writers)}
+
+    titles = ImdbTitle.__table__
+    statement = (
+        update(titles)
+        .where(titles.c.tconst == bindparam('key'))
+        .values(directors=bindparam('directors'), writers=bindparam('writers'))
+    )
+    return _write_chunks(statement, rows(), chunk_size, progress)
+
+def _referenced_name_ids() -> array:
+    """
+    Sortierte Zahlenteile aller nconsts, die in imdb_titles als Regie oder Drehbuch vorkommen (4-8 Bytes pro
+    Person statt eines Python-Strings in einem Set).
+    Sorted numeric parts of all nconsts listed as director or writer in imdb_titles (4-8 bytes per person
+    instead of a Python string in a set).
+    """
+    ids = array('L')
+    result = db.session.execute(
+        select(ImdbTitle.directors, ImdbTitle.writers).execution_options(yield_per=DEFAULT_CHUNK_SIZE)
+    )
+    for directors, writers in result:
+        for crew in (directors, writers):
+            if crew:
+                ids.extend(int(nconst[2:]) for nconst in crew.split(','))
+    return array('L', sorted(set(ids)))
+
+def _contains(sorted_ids: array, value: int) -> bool:
+    index = bisect_left(sorted_ids, value)
+    return index < len(sorted_ids) and sorted_ids[index] == value
+
+def import_name_basics(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                       progress: Optional[Callable[[int], None]] = None) -> int:
+    """
+    Importiert die Namen der Personen aus name.basics, die in title.crew der importierten Titel vorkommen.
+    Imports the names from name.basics of the people listed in title.crew of the imported titles.
+
+    Returns:
+        int: Anzahl importierter Namen. / Number of imported names.
+    """
+    referenced = _referenced_name_ids()
+
+    def rows() -> Iterator[dict]:
+        for fields in _read_tsv(path):
+            nconst, primary_name = fields[0], fields[1]
+            if primary_name != IMDB_NULL and _contains(referenced, int(nconst[2:])):
+                yield {'nconst': nconst, 'primary_name': primary_name}
+
+    statement = sqlite_insert(ImdbName)
+    statement = statement.on_conflict_do_update(
+        index_elements=[ImdbName.nconst], set_={'primary_name': statement.excluded.primary_name}
+    )
+    return _write_chunks(statement, rows(), chunk_size, progress)
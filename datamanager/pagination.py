@@ -0,0 +1,64 @@
+"""
+pagination.py
+Hilfsfunktionen für die Keyset-(Cursor-)Paginierung der DataManager-Listenmethoden.
+Helpers for keyset (cursor) pagination of the DataManager list methods.
+
+Ein Cursor ist ein undurchsichtiger, URL-sicherer String, der die Sortierschlüssel der letzten Zeile einer Seite
+und die Art der Liste enthält. Die nächste Seite beginnt direkt nach diesem Schlüssel, daher bleiben
+Antwortzeit und Speicherbedarf unabhängig davon, wie weit geblättert wurde.
+A cursor is an opaque, URL-safe string holding the sort key of the last row of a page and the kind of list.
+The next page starts right after that key, so response time and memory do not depend on how far a client has paged.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Optional
+
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 200
+
+class InvalidCursorError(ValueError):
+    """
+    Wird ausgelöst, wenn ein Cursor nicht dekodiert werden kann oder zu einer anderen Liste gehört.
+    Raised when a cursor cannot be decoded or belongs to a different listing.
+    """
+
+def clamp_limit(limit: Optional[int]) -> int:
+    """
+    Begrenzt die Seitengröße auf 1..MAX_PAGE_LIMIT; None ergibt DEFAULT_PAGE_LIMIT.
+    Clamps the page size to 1..MAX_PAGE_LIMIT; None yields DEFAULT_PAGE_LIMIT.
+    """
+    if limit is None:
+        return DEFAULT_PAGE_LIMIT
+    return max(1, min(int(limit), MAX_PAGE_LIMIT))
+
+def encode_cursor(kind: str, values: list) -> str:
+    """
+    Kodiert die Sortierschlüssel einer Zeile als Cursor. Datumswerte werden als ISO-String markiert abgelegt.
+    Encodes the sort key of a row as a cursor. Datetime values are stored as tagged ISO strings.
+    """
+    encoded_values = [{'dt': value.isoformat()} if isinstance(value, datetime) else value for value in values]
+    payload = json.dumps({'k': kind, 'v': encoded_values}, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(payload).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor: str, kind: str, key_length: int) -> list:
+    """
+    Dekodiert einen Cursor und prüft, dass er zur Liste `kind` gehört und `key_length` Schlüsselwerte enthält.
+    Decodes a cursor and checks that it belongs to the listing `kind` and holds `key_length` key values.
+
+    Raises:
+        InvalidCursorError: Bei einem beschädigten oder fremden Cursor. / For a corrupted or foreign cursor.
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        values = payload['v']
+        if payload['k'] != kind or not isinstance(values, list) or len(values) != key_length:
+            raise InvalidCursorError(f"Cursor does not belong to the '{kind}' listing.")
+        return [datetime.fromisoformat(value['dt']) if isinstance(value, dict) else value for value in values]
+    except InvalidCursorError:
+        raise
+    except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {e}") from e
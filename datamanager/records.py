@@ -0,0 +1,48 @@
+"""
+records.py
+Schlanke, schreibgeschützte Datensätze für Leseendpunkte, die nur wenige Spalten benötigen.
+Lightweight, read-only records for read endpoints that only need a few columns.
+
+Die Datensätze werden direkt aus Core-SELECT-Zeilen gebaut: keine Identity-Map, kein Change-Tracking,
+keine ungenutzten Text-Spalten (plot, actors, awards, ...). __slots__ hält jede Instanz klein.
+Records are built straight from Core SELECT rows: no identity map, no change tracking,
+no unused Text columns (plot, actors, awards, ...). __slots__ keeps every instance small.
+"""
+
+class MovieSummary:
+    """
+    Die Felder eines Films, die Listenendpunkte ausgeben.
+    The fields of a movie emitted by list endpoints.
+    """
+    __slots__ = ('id', 'title', 'director', 'year', 'community_rating', 'community_rating_count', 'poster_url')
+
+    # Columns are selected in this order / Spalten werden in dieser Reihenfolge selektiert
+    COLUMNS = __slots__
+
+    def __init__(self, id, title, director, year, community_rating, community_rating_count, poster_url):
+        self.id = id
+        self.title = title
+        self.director = director
+        self.year = year
+        self.community_rating = community_rating
+        self.community_rating_count = community_rating_count
+        self.poster_url = poster_url
+
+    def __repr__(self):
+        return f"<MovieSummary id={self.id} title={self.title}>"
+
+class UserMovieSummary(MovieSummary):
+    """
+    Ein Film aus der Liste eines Benutzers inklusive dessen persönlicher Bewertung.
+    A movie from a user's list including the user's personal rating.
+    """
+    __slots__ = ('user_rating',)
+
+    COLUMNS = MovieSummary.COLUMNS + __slots__
+
+    def __init__(self, id, title, director, year, community_rating, community_rating_count, poster_url, user_rating):
+        super().__init__(id, title, director, year, community_rating, community_rating_count, poster_url)
+        self.user_rating = user_rating
+
+    def __repr__(self):
+        return f"<UserMovieSummary id={self.id} title={self.title} user_rating={self.user_rating}>"
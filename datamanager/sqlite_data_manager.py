@@ -4,13 +4,20 @@ Dieses Modul implementiert die DataManagerInterface mit SQLite/SQLAlchemy.
 This module implements the DataManagerInterface using SQLite/SQLAlchemy.
 """
 
-from typing import List, Optional
-from flask import current_app
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Sequence, Tuple
+from flask import current_app, g, has_app_context, has_request_context
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import func, desc
+from sqlalchemy import func, desc, case, update, select, insert, tuple_, inspect, bindparam, Row
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import contains_eager, selectinload
+from sqlalchemy.sql import Select
 from datamanager.data_manager_interface import DataManagerInterface
-from models import db, User, Movie, UserMovie, Comment
-from datetime import datetime  # For year validation
+from datamanager.cache_tags import USERS_TAG, CATALOG_TAG, ALL_TAG, user_tag, movie_tag, emit_invalidations
+from datamanager.pagination import clamp_limit, encode_cursor, decode_cursor
+from datamanager.records import MovieSummary, UserMovieSummary
+from models import db, User, Movie, UserMovie, Comment, OmdbCacheEntry, OmdbRefreshQuota, ImdbTitle, ImdbName
+from datetime import date, datetime  # For year validation and the OMDb refresh quota
 
 class SQLiteDataManager(DataManagerInterface):
     """
@@ -24,6 +31,134 @@ class SQLiteDataManager(DataManagerInterface):
     einschließlich der Verwaltung von Benutzern, Filmen, Benutzer-Film-Beziehungen (Bewertungen) und Kommentaren.
     """
 
+    # Loading profiles for UserMovie list views / Ladeprofile für UserMovie-Listenansichten
+    # 'joined':   one SELECT, Movie columns are fetched via the existing JOIN (contains_eager).
+    # 'selectin': two SELECTs, Movies are fetched with a single IN query (selectinload).
+    # 'lazy':     legacy behaviour, one extra SELECT per list entry when .movie is accessed.
+    LOADING_PROFILE_JOINED = 'joined'
+    LOADING_PROFILE_SELECTIN = 'selectin'
+    LOADING_PROFILE_LAZY = 'lazy'
+    LOADING_PROFILES = (LOADING_PROFILE_JOINED, LOADING_PROFILE_SELECTIN, LOADING_PROFILE_LAZY)
+
+    # Key in session.info tracking nested units of work / Schlüssel in session.info für verschachtelte Unit-of-Works
+    _UNIT_OF_WORK_DEPTH_KEY = 'unit_of_work_depth'
+
+    # Key in session.info collecting cache tags until commit / Schlüssel in session.info, der Cache-Tags bis zum Commit sammelt
+    _PENDING_INVALIDATIONS_KEY = 'pending_cache_invalidations'
+
+    # Attribute of flask.g holding the request-scoped lookup cache / Attribut von flask.g für den anfragebezogenen Lookup-Cache
+    _REQUEST_CACHE_ATTR = '_data_manager_request_cache'
+
+    def _request_cache(self) -> dict:
+        """
+        Internal helper: Returns the lookup cache of the current request (stored on flask.g, so it is dropped
+        with the app context). It maps ('user', id), ('movie', id) and ('link', user_id, movie_id) to the loaded
+        object or None, so repeated lookups within one request - including misses - cost no further queries.
+        Outside an app context an empty, throwaway dict is returned.
+
+        Interne Hilfsmethode: Liefert den Lookup-Cache der aktuellen Anfrage (auf flask.g abgelegt, daher wird er
+        mit dem App-Kontext verworfen). Er bildet ('user', id), ('movie', id) und ('link', user_id, movie_id) auf das
+        geladene Objekt oder None ab, sodass wiederholte Lookups innerhalb einer Anfrage - auch Fehltreffer - keine
+        weiteren Abfragen kosten. Außerhalb eines App-Kontexts wird ein leeres Wegwerf-Dictionary zurückgegeben.
+        """
+        if not has_app_context():
+            return {}
+        cache = g.get(self._REQUEST_CACHE_ATTR)
+        if cache is None:
+            cache = {}
+            setattr(g, self._REQUEST_CACHE_ATTR, cache)
+        return cache
+
+    def _prune_request_cache(self) -> None:
+        """
+        Internal helper: Drops cached misses (the row may exist now) and objects that are no longer persistent.
+        The remaining objects are still valid, as _commit keeps them loaded.
+
+        Interne Hilfsmethode: Entfernt gecachte Fehltreffer (die Zeile kann jetzt existieren) und nicht mehr persistente Objekte.
+        Die übrigen Objekte bleiben gültig, da _commit sie geladen lässt.
+        """
+        request_cache = self._request_cache()
+        for key, obj in list(request_cache.items()):
+            if obj is None or not inspect(obj).persistent:
+                del request_cache[key]
+
+    @contextmanager
+    def _unit_of_work(self):
+        """
+        Internal helper: Wraps one user action in exactly one transaction.
+        The outermost unit of work commits once on success and rolls back on any exception;
+        nested units of work (e.g. add_movie_globally called from add_movie) only join the surrounding
+        transaction. Code inside a unit of work only adds and flushes, it never commits.
+        The depth is kept in the (request/thread-scoped) session, not on the shared DataManager instance.
+
+        Interne Hilfsmethode: Fasst eine Benutzeraktion in genau eine Transaktion.
+        Die äußerste Unit-of-Work committet bei Erfolg einmal und macht bei jeder Ausnahme ein Rollback;
+        verschachtelte Unit-of-Works (z.B. add_movie_globally aus add_movie) schließen sich nur der
+        umgebenden Transaktion an. Code innerhalb einer Unit-of-Work fügt nur hinzu und flusht, er committet nie.
+        Die Tiefe wird in der (request-/thread-bezogenen) Session gehalten, nicht in der geteilten DataManager-Instanz.
+        When the outermost unit of work ends, cached misses and objects that are no longer persistent
+        (deleted, rolled back) are dropped from the request-scoped lookup cache.
+        Endet die äußerste Unit-of-Work, werden gecachte Fehltreffer und nicht mehr persistente Objekte
+        (gelöscht, zurückgerollt) aus dem anfragebezogenen Lookup-Cache entfernt.
+        Cache tags collected with _invalidate are emitted after the commit and discarded on rollback.
+        Mit _invalidate gesammelte Cache-Tags werden nach dem Commit gemeldet und beim Rollback verworfen.
+        """
+        session_info = db.session.info
+        depth = session_info.get(self._UNIT_OF_WORK_DEPTH_KEY, 0)
+        session_info[self._UNIT_OF_WORK_DEPTH_KEY] = depth + 1
+        try:
+            yield db.session
+            if depth == 0:
+                self._commit()
+                emit_invalidations(session_info.pop(self._PENDING_INVALIDATIONS_KEY, ()))
+        except Exception:
+            if depth == 0:
+                db.session.rollback()
+                session_info.pop(self._PENDING_INVALIDATIONS_KEY, None)
+            raise
+        finally:
+            session_info[self._UNIT_OF_WORK_DEPTH_KEY] = depth
+            if depth == 0:
+                self._prune_request_cache()
+
+    def _commit(self) -> None:
+        """
+        Internal helper: Commits the session. Outside a request every object expires as usual (CLI commands,
+        the OMDb refresh thread). Within a request the objects in the request-scoped lookup cache (e.g. g.user)
+        stay loaded, so the route does not re-SELECT them after its action; they were read or written in this
+        request, and the request ends soon. Every other object expires as usual.
+
+        Interne Hilfsmethode: Committet die Session. Außerhalb einer Anfrage verfallen alle Objekte wie gewohnt
+        (CLI-Befehle, OMDb-Aktualisierungs-Thread). Innerhalb einer Anfrage bleiben die Objekte im anfragebezogenen
+        Lookup-Cache (z.B. g.user) geladen, damit die Route sie nach ihrer Aktion nicht erneut per SELECT lädt; sie
+        wurden in dieser Anfrage gelesen oder geschrieben, und die Anfrage endet bald. Alle anderen Objekte verfallen wie gewohnt.
+        """
+        session = db.session()
+        kept = {id(obj) for obj in self._request_cache().values() if obj is not None} if has_request_context() else set()
+        if not kept:
+            session.commit()
+            return
+        expire_on_commit = session.expire_on_commit
+        session.expire_on_commit = False
+        try:
+            session.commit()
+        finally:
+            session.expire_on_commit = expire_on_commit
+        if expire_on_commit:
+            for obj in list(session.identity_map.values()):
+                if id(obj) not in kept:
+                    session.expire(obj)
+
+    def _invalidate(self, *tags: str) -> None:
+        """
+        Internal helper: Marks cache tags (see datamanager/cache_tags.py) as changed by the current unit of work.
+        They are reported to the response caches only once the outermost unit of work has committed.
+
+        Interne Hilfsmethode: Markiert Cache-Tags (siehe datamanager/cache_tags.py) als durch die aktuelle Unit-of-Work geändert.
+        Sie werden den Antwort-Caches erst gemeldet, wenn die äußerste Unit-of-Work committet hat.
+        """
+        db.session.info.setdefault(self._PENDING_INVALIDATIONS_KEY, set()).update(tags)
+
     def get_all_users(self) -> List[User]:
         """
         Retrieves all users from the database.
@@ -36,6 +171,99 @@ class SQLiteDataManager(DataManagerInterface):
             # Error fetching all users: {e}. / Fehler beim Abrufen aller Benutzer: {e}.
             return []
 
+    def _keyset_page(self, query, kind: str, sort_columns: list, limit: Optional[int], cursor: Optional[str],
+                     descending: bool = False, cursor_attributes: Optional[list] = None) -> Tuple[list, Optional[str]]:
+        """
+        Internal helper: Returns one page of `query` (ORM query or Core select) ordered by `sort_columns`
+        (the last one must be unique) plus the cursor of the next page (None on the last page).
+        `cursor_attributes` names the row attributes holding the sort key if they differ from the column keys. The cursor holds the sort key of the last row;
+        the next page continues with a row-value comparison on that key, which SQLite resolves as an index range.
+        Fetches limit + 1 rows to detect whether there is a next page. Raises InvalidCursorError for bad cursors.
+
+        Interne Hilfsmethode: Liefert eine Seite von `query` (ORM-Query oder Core-Select), sortiert nach `sort_columns`
+        (die letzte muss eindeutig sein), plus den Cursor der nächsten Seite (None auf der letzten Seite).
+        `cursor_attributes` benennt die Zeilenattribute mit dem Sortierschlüssel, falls sie von den Spaltenschlüsseln abweichen. Der Cursor enthält den Sortierschlüssel der letzten Zeile;
+        die nächste Seite setzt mit einem Zeilenwert-Vergleich auf diesem Schlüssel fort, den SQLite als Indexbereich auflöst.
+        Lädt limit + 1 Zeilen, um zu erkennen, ob es eine nächste Seite gibt. Löst InvalidCursorError bei ungültigen Cursorn aus.
+        """
+        limit = clamp_limit(limit)
+        if cursor:
+            key = decode_cursor(cursor, kind, len(sort_columns))
+            sort_key = tuple_(*sort_columns)
+            query = query.filter(sort_key < tuple_(*key) if descending else sort_key > tuple_(*key))
+        ordering = [column.desc() if descending else column.asc() for column in sort_columns]
+        query = query.order_by(None).order_by(*ordering).limit(limit + 1)
+        rows = db.session.execute(query).all() if isinstance(query, Select) else query.all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last_row = rows[-1]
+            attributes = cursor_attributes or [column.key for column in sort_columns]
+            next_cursor = encode_cursor(kind, [getattr(last_row, attribute) for attribute in attributes])
+        return rows, next_cursor
+
+    def _users_with_movie_counts_query(self):
+        """
+        Internal helper: Query for (id, name, movie_count) rows. The count is a correlated COUNT over the
+        (user_id, movie_id) index, so no User or UserMovie objects are loaded.
+
+        Interne Hilfsmethode: Abfrage für (id, name, movie_count)-Zeilen. Die Anzahl ist ein korreliertes COUNT über den
+        (user_id, movie_id)-Index, daher werden keine User- oder UserMovie-Objekte geladen.
+        """
+        movie_count = (
+            select(func.count())
+            .where(UserMovie.user_id == User.id)
+            .correlate(User)
+            .scalar_subquery()
+            .label('movie_count')
+        )
+        return db.session.query(User.id, User.name, movie_count)
+
+    def get_users_with_movie_counts(self) -> List[tuple[int, str, int]]:
+        """
+        Retrieves (id, name, movie_count) for all users in a single query, ordered by user ID.
+        The returned rows also allow attribute access (row.id, row.name, row.movie_count).
+
+        Liefert (id, name, movie_count) für alle Benutzer in einer einzigen Abfrage, sortiert nach Benutzer-ID.
+        Die zurückgegebenen Zeilen erlauben auch Attributzugriff (row.id, row.name, row.movie_count).
+        """
+        try:
+            return self._users_with_movie_counts_query().order_by(User.id).all()
+        except SQLAlchemyError as e:
+            current_app.logger.error(f"Error fetching users with movie counts: {e}.")
+            # Error fetching users with movie counts: {e}. / Fehler beim Abrufen der Benutzer mit Filmanzahl: {e}.
+            return []
+
+    def get_users_with_movie_counts_page(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> Tuple[List[tuple[int, str, int]], Optional[str]]:
+        """
+        Retrieves one page of (id, name, movie_count) rows ordered by user ID, plus the cursor of the next page.
+        Liefert eine Seite von (id, name, movie_count)-Zeilen, sortiert nach Benutzer-ID, plus den Cursor der nächsten Seite.
+        """
+        try:
+            return self._keyset_page(self._users_with_movie_counts_query(), 'users', [User.id], limit, cursor)
+        except SQLAlchemyError as e:
+            current_app.logger.error(f"Error fetching page of users with movie counts: {e}.")
+            # Error fetching page of users. / Fehler beim Abrufen einer Seite von Benutzern.
+            return [], None
+
+    def get_users_with_movie_counts_by_ids(self, user_ids: Sequence[int]) -> List[tuple[int, str, int]]:
+        """
+        Retrieves (id, name, movie_count) for the given users in a single IN query. Unknown IDs are simply
+        missing from the result; the order is unspecified.
+
+        Liefert (id, name, movie_count) für die angegebenen Benutzer in einer einzigen IN-Abfrage. Unbekannte IDs
+        fehlen einfach im Ergebnis; die Reihenfolge ist nicht festgelegt.
+        """
+        if not user_ids:
+            return []
+        try:
+            return self._users_with_movie_counts_query().filter(User.id.in_(user_ids)).all()
+        except SQLAlchemyError as e:
+            current_app.logger.error(f"Error fetching users {list(user_ids)} with movie counts: {e}.")
+            # Error fetching users by IDs. / Fehler beim Abrufen von Benutzern nach IDs.
+            return []
+
     def get_user_movies(self, user_id: int) -> List[Movie]:
         """
         Retrieves all movies linked to a specific user.
@@ -47,9 +275,9 @@ class SQLiteDataManager(DataManagerInterface):
                 current_app.logger.warning(f"User with ID {user_id} not found when trying to fetch their movies.")
                 # User with ID {user_id} not found. / Benutzer mit ID {user_id} nicht gefunden.
                 return []
-            # Fetch movies via UserMovie relationship
-            # Filme über UserMovie-Beziehung abrufen
-            return [um.movie for um in user.movies]
+            # Fetch movies via UserMovie relationship (eager, avoids one SELECT per entry)
+            # Filme über UserMovie-Beziehung abrufen (eager, vermeidet ein SELECT pro Eintrag)
+            return [um.movie for um in self._user_movie_relations_query(user_id, self.LOADING_PROFILE_JOINED).all()]
         except SQLAlchemyError as e:
             current_app.logger.error(f"Error fetching movies for user {user_id}: {e}.")
             # Error fetching movies for user {user_id}: {e}. / Fehler beim Abrufen der Filme für Benutzer {user_id}: {e}.
@@ -76,14 +304,15 @@ class SQLiteDataManager(DataManagerInterface):
                 # Attempted to add duplicate user '{name_processed}'. / Versuch, doppelten Benutzer '{name_processed}' hinzuzufügen.
                 return None
 
-            user = User(name=name_processed) 
-            db.session.add(user)
-            db.session.commit()
+            with self._unit_of_work():
+                user = User(name=name_processed) 
+                db.session.add(user)
+                db.session.flush() # Assigns user.id for its cache tag (a 404 may be cached) / Vergibt user.id für dessen Cache-Tag (ein 404 kann gecacht sein)
+                self._invalidate(USERS_TAG, user_tag(user.id))
             current_app.logger.info(f"User '{user.name}' (ID: {user.id}) added successfully.")
             # User '{user.name}' (ID: {user.id}) added successfully. / Benutzer '{user.name}' (ID: {user.id}) erfolgreich hinzugefügt.
             return user
         except SQLAlchemyError as e:
-            db.session.rollback()
             current_app.logger.error(f"Error adding user '{name_processed}': {e}.")
             # Error adding user '{name_processed}': {e}. / Fehler beim Hinzufügen von Benutzer '{name_processed}': {e}.
             return None
@@ -125,15 +354,13 @@ class SQLiteDataManager(DataManagerInterface):
         """
         Internal helper: Finds a movie by IMDb ID, or by title and year, or creates a new one using omdb_data.
         If found by title/year and imdb_id is provided, it updates the existing movie's imdb_id if it was missing.
-        Commits changes only if an existing movie's imdb_id is updated.
-        If a new movie is created via add_movie_globally, that method handles its own transactions.
+        Never commits: it runs inside the caller's unit of work (add_movie_globally joins it as well).
 
         Interne Hilfsmethode: Findet einen Film anhand der IMDb-ID oder anhand von Titel und Jahr,
         oder erstellt einen neuen Film unter Verwendung von omdb_data.
         Wenn der Film anhand von Titel/Jahr gefunden wird und eine imdb_id angegeben ist,
         wird die imdb_id des existierenden Films aktualisiert, falls sie fehlte.
-        Committet Änderungen nur, wenn die imdb_id eines existierenden Films aktualisiert wird.
-        Wenn ein neuer Film über add_movie_globally erstellt wird, handhabt diese Methode ihre eigenen Transaktionen.
+        Committet nie: Sie läuft innerhalb der Unit-of-Work des Aufrufers (auch add_movie_globally schließt sich ihr an).
         """
         movie = None # Initialize movie variable / Initialisiere Filmvariable
         try:
@@ -150,12 +377,27 @@ class SQLiteDataManager(DataManagerInterface):
                     if imdb_id and not movie.imdb_id: # If found by title/year, but an imdb_id was passed and it's not yet in the DB movie
                         current_app.logger.info(f"Updating existing movie {movie.id} (Title: '{movie.title}') with new imdb_id '{imdb_id}'.")
                         movie.imdb_id = imdb_id
-                        db.session.commit() # Commit only this specific update / Nur dieses spezifische Update committen
+                        db.session.flush() # Committed with the caller's unit of work / Wird mit der Unit-of-Work des Aufrufers committet
+                        self._invalidate(movie_tag(movie.id))
                     return movie, False # False, as the movie already existed or was just updated (not newly created)
 
+            if not movie and (imdb_id or (title and year is not None)):
+                # Local IMDb catalog before giving up, only by IMDb ID or a unique title/year match. It fills the gaps:
+                # the submitted fields (from OMDb/the form) win.
+                # Lokaler IMDb-Katalog, bevor aufgegeben wird, nur per IMDb-ID oder eindeutigem Titel/Jahr-Treffer. Er füllt
+                # die Lücken: die übergebenen Felder (von OMDb/dem Formular) haben Vorrang.
+                local_entry = self.get_local_catalog_entry(title=title, imdb_id=imdb_id, year=year, unique=True)
+                if local_entry:
+                    current_app.logger.info(f"Movie '{title}' found in the local IMDb catalog as {local_entry['imdbID']}.")
+                    submitted = omdb_data or self._build_omdb_payload(
+                        title=title, director=director, year=year, poster_url=poster_url, plot=plot, runtime=runtime,
+                        awards=awards, languages=languages, genre=genre, actors=actors, writer=writer, country=country,
+                        metascore=metascore, rated=rated, imdb_id=imdb_id)
+                    omdb_data = self.merge_local_catalog_entry(local_entry, submitted)
+
             if not movie and omdb_data: # Movie not found, needs to be created, and we have OMDb data
                 current_app.logger.info(f"Movie '{omdb_data.get('Title', title)}' (imdb_id: {omdb_data.get('imdbID', imdb_id or 'N/A')}) not found. Attempting to create it globally.")
-                new_global_movie = self.add_movie_globally(omdb_data) # This method handles its own commit/rollback
+                new_global_movie = self.add_movie_globally(omdb_data) # Joins the caller's unit of work / Schließt sich der Unit-of-Work des Aufrufers an
                 if new_global_movie:
                     current_app.logger.info(f"Successfully created new global movie '{new_global_movie.title}' (ID: {new_global_movie.id}) via add_movie_globally.")
                     return new_global_movie, True # True, as the movie was newly created
@@ -168,12 +410,10 @@ class SQLiteDataManager(DataManagerInterface):
                  return None, False
 
 
-        except SQLAlchemyError as e:
-            db.session.rollback() 
+        except SQLAlchemyError as e: # The caller's unit of work rolls back / Die Unit-of-Work des Aufrufers macht das Rollback
             current_app.logger.error(f"SQLAlchemyError in _get_or_create_movie_internal for title '{title}', imdb_id {imdb_id or 'N/A'}: {e}.")
             return None, False
         except Exception as e: # Catch any other unexpected error
-            db.session.rollback()
             current_app.logger.error(f"Unexpected error in _get_or_create_movie_internal for title '{title}', imdb_id {imdb_id or 'N/A'}: {e}.")
             return None, False
         
@@ -181,10 +421,12 @@ class SQLiteDataManager(DataManagerInterface):
 
     def _create_or_update_user_movie_link(self, user_id: int, movie_id: int, rating: Optional[float]) -> Optional[UserMovie]:
         """
-        Internal helper: Creates or updates the UserMovie link between a user and a movie.
+        Internal helper: Creates or updates the UserMovie link between a user and a movie
+        and applies the resulting rating delta to the movie's community rating.
         Adds the UserMovie object to the session but does not commit here; calling function handles commit.
 
-        Interne Hilfsmethode: Erstellt oder aktualisiert die UserMovie-Verknüpfung zwischen einem Benutzer und einem Film.
+        Interne Hilfsmethode: Erstellt oder aktualisiert die UserMovie-Verknüpfung zwischen einem Benutzer und einem Film
+        und wendet das resultierende Bewertungs-Delta auf das Community-Rating des Films an.
         Fügt das UserMovie-Objekt zur Session hinzu, committet hier aber nicht; die aufrufende Funktion handhabt den Commit.
         """
         user_movie_link = UserMovie.query.filter_by(user_id=user_id, movie_id=movie_id).first()
@@ -194,17 +436,22 @@ class SQLiteDataManager(DataManagerInterface):
             user_movie_link = UserMovie(user_id=user_id, movie_id=movie_id, user_rating=rating)
             try:
                 db.session.add(user_movie_link)
-                # No flush or commit here, let the calling function manage the transaction.
+                self._apply_community_rating_delta(movie_id, None, rating)
+                self._invalidate(USERS_TAG, user_tag(user_id), movie_tag(movie_id))
+                # No commit here, let the calling function manage the transaction.
             except SQLAlchemyError as e: # Should be rare if objects are fine
                 current_app.logger.error(f"Error adding new UserMovie link for user {user_id}, movie {movie_id} to session: {e}.")
                 return None 
         else: # Link exists, update rating if different
             if user_movie_link.user_rating != rating: # Handles None comparison correctly
                 current_app.logger.info(f"Existing UserMovie link for user {user_id}, movie {movie_id}. Updating rating from {user_movie_link.user_rating} to {rating}.")
+                old_rating = user_movie_link.user_rating
                 user_movie_link.user_rating = rating
                 try:
                     db.session.add(user_movie_link) # Add to session to mark as dirty if changed
-                    # No flush or commit here
+                    self._apply_community_rating_delta(movie_id, old_rating, rating)
+                    self._invalidate(user_tag(user_id), movie_tag(movie_id))
+                    # No commit here
                 except SQLAlchemyError as e: # Should be rare
                      current_app.logger.error(f"Error adding updated UserMovie link for user {user_id}, movie {movie_id} to session: {e}.")
                      return None
@@ -212,6 +459,29 @@ class SQLiteDataManager(DataManagerInterface):
                 current_app.logger.info(f"UserMovie link for user {user_id}, movie {movie_id} exists and rating ({rating}) is unchanged.")
         return user_movie_link
 
+    def _build_omdb_payload(self, title: str, director: Optional[str] = None, year: Optional[int] = None, poster_url: Optional[str] = None,
+                            plot: Optional[str] = None, runtime: Optional[str] = None, awards: Optional[str] = None,
+                            languages: Optional[str] = None, genre: Optional[str] = None, actors: Optional[str] = None,
+                            writer: Optional[str] = None, country: Optional[str] = None, metascore: Optional[str] = None,
+                            rated: Optional[str] = None, imdb_id: Optional[str] = None,
+                            omdb_rating_for_community: Optional[float] = None, **_ignored) -> dict:
+        """
+        Internal helper: Maps add_movie-style keyword fields to the OMDb-like dict expected by
+        add_movie_globally / _parse_omdb_data_for_movie_fields.
+
+        Interne Hilfsmethode: Bildet Felder im Stil von add_movie auf das OMDb-ähnliche Dictionary ab,
+        das add_movie_globally / _parse_omdb_data_for_movie_fields erwarten.
+        """
+        return {
+            'Title': title, 'Director': director, 'Year': str(year) if year else None, 
+            'Poster': poster_url, 'Plot': plot, 'Runtime': runtime, 'Awards': awards, 
+            'Language': languages, 'Genre': genre, 'Actors': actors, 'Writer': writer, 
+            'Country': country, 'Metascore': metascore, 'Rated': rated, 'imdbID': imdb_id,
+            # Pass the user's personal rating as 'imdbRating' only if it's for the initial OMDb import context
+            # This is a bit tricky; omdb_rating_for_community is a better source for initial global rating
+            'imdbRating': str(omdb_rating_for_community * 2) if omdb_rating_for_community is not None else None
+        }
+
     def add_movie(self, user_id: int, title: str, director: Optional[str], year: Optional[int], rating: Optional[float], poster_url: Optional[str] = None,
                   plot: Optional[str] = None, runtime: Optional[str] = None, awards: Optional[str] = None, languages: Optional[str] = None,
                   genre: Optional[str] = None, actors: Optional[str] = None, writer: Optional[str] = None, country: Optional[str] = None,
@@ -219,13 +489,14 @@ class SQLiteDataManager(DataManagerInterface):
                   omdb_rating_for_community: Optional[float] = None) -> Optional[Movie]:
         """
         Adds a movie to a user's list. If the movie doesn't exist globally, it's created.
-        This involves validating input, getting/creating the movie, creating/updating the user-movie link,
-        and then updating the movie's community rating. Commits or rolls back the overall transaction.
+        This involves validating input, getting/creating the movie, creating/updating the user-movie link
+        and adjusting the movie's community rating by the rating delta. All of it runs in one unit of work
+        (one commit, or one rollback on failure).
 
         Fügt einen Film zur Liste eines Benutzers hinzu. Wenn der Film nicht global existiert, wird er erstellt.
         Dies beinhaltet die Validierung der Eingabe, das Holen/Erstellen des Films, das Erstellen/Aktualisieren 
-        der Benutzer-Film-Verknüpfung und die anschließende Aktualisierung des Community-Ratings des Films. 
-        Führt ein Commit oder Rollback der gesamten Transaktion durch.
+        der Benutzer-Film-Verknüpfung und die Anpassung des Community-Ratings des Films um das Bewertungs-Delta. 
+        Alles läuft in einer Unit-of-Work (ein Commit, bzw. ein Rollback bei Fehlern).
         """
         title_cleaned = title.strip() if title else ""
         # director_cleaned = director.strip() if director else None 
@@ -245,70 +516,218 @@ class SQLiteDataManager(DataManagerInterface):
             # Bereite OMDb-Daten-Dictionary für _get_or_create_movie_internal vor, wenn Filmerstellung erwartet wird
             omdb_data_payload = None
             if imdb_id: # If imdb_id is present, we assume this might be OMDb-sourced data
-                omdb_data_payload = {
-                    'Title': title_cleaned, 'Director': director, 'Year': str(year) if year else None, 
-                    'Poster': poster_url, 'Plot': plot, 'Runtime': runtime, 'Awards': awards, 
-                    'Language': languages, 'Genre': genre, 'Actors': actors, 'Writer': writer, 
-                    'Country': country, 'Metascore': metascore, 'Rated': rated, 'imdbID': imdb_id,
-                    # Pass the user's personal rating as 'imdbRating' only if it's for the initial OMDb import context
-                    # This is a bit tricky; omdb_rating_for_community is a better source for initial global rating
-                    'imdbRating': str(omdb_rating_for_community * 2) if omdb_rating_for_community is not None else None
-                }
+                omdb_data_payload = self._build_omdb_payload(
+                    title=title_cleaned, director=director, year=year, poster_url=poster_url, plot=plot,
+                    runtime=runtime, awards=awards, languages=languages, genre=genre, actors=actors,
+                    writer=writer, country=country, metascore=metascore, rated=rated, imdb_id=imdb_id,
+                    omdb_rating_for_community=omdb_rating_for_community
+                )
             
-            movie_obj_tuple = self._get_or_create_movie_internal(
-                title_cleaned, director, year, poster_url, plot, runtime, awards, languages,
-                genre, actors, writer, country, metascore, rated, imdb_id,
-                omdb_data=omdb_data_payload 
-            )
+            # Movie changes (new movie / updated imdb_id), the UserMovie link and the community rating delta are committed together
+            # Movie-Änderungen (neuer Film / aktualisierte imdb_id), UserMovie-Verknüpfung und Community-Rating-Delta werden gemeinsam committet
+            with self._unit_of_work():
+                movie_obj_tuple = self._get_or_create_movie_internal(
+                    title_cleaned, director, year, poster_url, plot, runtime, awards, languages,
+                    genre, actors, writer, country, metascore, rated, imdb_id,
+                    omdb_data=omdb_data_payload 
+                )
             
-            if not movie_obj_tuple or not movie_obj_tuple[0]:
-                # Error logged in _get_or_create_movie_internal
-                raise SQLAlchemyError("Failed to get or create movie internally.")
+                if not movie_obj_tuple or not movie_obj_tuple[0]:
+                    # Error logged in _get_or_create_movie_internal
+                    raise SQLAlchemyError("Failed to get or create movie internally.")
             
-            movie_obj = movie_obj_tuple[0]
-            # is_new_movie = movie_obj_tuple[1] # Can be used if specific logic for new vs existing is needed here
-
-            user_movie_link = self._create_or_update_user_movie_link(user.id, movie_obj.id, rating)
-            if not user_movie_link:
-                raise SQLAlchemyError(f"Failed to create/update UserMovie link for user {user.id}, movie {movie_obj.id}.")
-
-            # Commit changes to Movie (if new/updated imdb_id) and UserMovie link
-            # This commit is crucial before _update_community_rating, which itself commits.
-            db.session.commit() 
-            current_app.logger.info(f"Committed changes for movie {movie_obj.id} and UserMovie link for user {user_id} before updating community rating.")
-
-            if self._update_community_rating(movie_obj.id): # This method also commits on its success
-                current_app.logger.info(f"Movie '{movie_obj.title}' (ID: {movie_obj.id}) successfully processed for user {user_id} and community rating updated.")
-                return movie_obj
-            else:
-                # _update_community_rating handles its own rollback on failure.
-                # The previous commit for UserMovie link might persist if _update_community_rating fails.
-                # This is generally acceptable as the user's rating is saved, even if global update fails.
-                # For stricter atomicity, _update_community_rating should not commit but pass status back.
-                # However, current design is that _update_community_rating is a self-contained unit of work.
-                current_app.logger.error(f"Failed to update community rating for movie {movie_obj.id} after processing for user {user_id}. User-specific changes might be saved.")
-                # We return the movie object as the primary operation (adding to user list) might have succeeded with its commit.
-                return movie_obj # Or raise an error if partial success is not desired.
+                movie_obj = movie_obj_tuple[0]
+                # is_new_movie = movie_obj_tuple[1] # Can be used if specific logic for new vs existing is needed here
+
+                user_movie_link = self._create_or_update_user_movie_link(user.id, movie_obj.id, rating)
+                if not user_movie_link:
+                    raise SQLAlchemyError(f"Failed to create/update UserMovie link for user {user.id}, movie {movie_obj.id}.")
+            current_app.logger.info(f"Movie '{movie_obj.title}' (ID: {movie_obj.id}) successfully processed for user {user_id} and community rating updated.")
+            return movie_obj
                 
         except SQLAlchemyError as e:
-            db.session.rollback()
             current_app.logger.error(f"SQLAlchemyError in add_movie for title '{title_cleaned}', user {user_id}: {e}. Operation rolled back.")
             return None
         except Exception as e:
-            db.session.rollback()
             current_app.logger.error(f"Unexpected error in add_movie for title '{title_cleaned}', user {user_id}: {e}. Operation rolled back.")
             return None
 
+    # Maximum number of bound parameters per IN query (SQLite's default limit is 999 on older versions)
+    # Maximale Anzahl gebundener Parameter pro IN-Abfrage (SQLites Standardlimit ist 999 bei älteren Versionen)
+    _BULK_IN_CHUNK_SIZE = 400
+
+    def _chunked(self, values: list) -> list:
+        """
+        Internal helper: Splits a list into chunks of _BULK_IN_CHUNK_SIZE for IN queries.
+        Interne Hilfsmethode: Teilt eine Liste für IN-Abfragen in Stücke der Größe _BULK_IN_CHUNK_SIZE.
+        """
+        return [values[i:i + self._BULK_IN_CHUNK_SIZE] for i in range(0, len(values), self._BULK_IN_CHUNK_SIZE)]
+
+    def add_movies_bulk(self, user_id: int, movies: List[dict]) -> Optional[List[dict]]:
+        """
+        Adds many movies to a user's list in one unit of work. Each entry takes the keyword fields of add_movie
+        (title, director, year, rating, imdb_id, OMDb fields, omdb_rating_for_community).
+        Existing movies are resolved with set-based IN queries (by imdb_id, then by lowercase title and year),
+        missing movies that carry an imdb_id are inserted, links are created or updated, and the community
+        rating of every affected movie is recomputed once at the end. Later entries for the same movie win.
+        Returns one result dict per input entry ({'index', 'status', 'movie_id'}, status being 'created',
+        'added', 'updated', 'unchanged', 'invalid' or 'not_found'), or None if the user does not exist
+        or the batch was rolled back.
+
+        Fügt viele Filme in einer Unit-of-Work zur Liste eines Benutzers hinzu. Jeder Eintrag nimmt die Felder von add_movie
+        (title, director, year, rating, imdb_id, OMDb-Felder, omdb_rating_for_community).
+        Vorhandene Filme werden mit mengenbasierten IN-Abfragen aufgelöst (per imdb_id, dann per Titel in Kleinbuchstaben und Jahr),
+        fehlende Filme mit imdb_id werden angelegt, Verknüpfungen erstellt oder aktualisiert und das Community-Rating
+        jedes betroffenen Films am Ende einmal neu berechnet. Spätere Einträge für denselben Film gewinnen.
+        Gibt pro Eingabeeintrag ein Ergebnis-Dictionary zurück ({'index', 'status', 'movie_id'}), oder None,
+        wenn der Benutzer nicht existiert oder der Stapel zurückgerollt wurde.
+        """
+        results = [{'index': index, 'status': 'invalid', 'movie_id': None} for index in range(len(movies))]
+
+        # 1. Validate and normalize entries (no database access) / Einträge validieren und normalisieren (ohne Datenbankzugriff)
+        entries = [] # (index, fields, title_key) with title_key = (lowercase title, year)
+        for index, fields in enumerate(movies):
+            title_cleaned = (fields.get('title') or '').strip()
+            imdb_id = (fields.get('imdb_id') or '').strip() or None
+            if not self._validate_movie_input(title_cleaned, fields.get('year'), fields.get('rating')):
+                continue
+            fields = dict(fields, title=title_cleaned, imdb_id=imdb_id)
+            entries.append((index, fields, (title_cleaned.lower(), fields.get('year'))))
+
+        try:
+            user = self.get_user_by_id(user_id)
+            if not user:
+                current_app.logger.warning(f"Bulk add failed: User {user_id} not found.")
+                # User {user_id} not found. / Benutzer {user_id} nicht gefunden.
+                return None
+
+            with self._unit_of_work():
+                # 2. Resolve existing movies with IN queries / Vorhandene Filme mit IN-Abfragen auflösen
+                imdb_ids = list({fields['imdb_id'] for _, fields, _ in entries if fields['imdb_id']})
+                movies_by_imdb_id = {}
+                for chunk in self._chunked(imdb_ids):
+                    for movie in Movie.query.filter(Movie.imdb_id.in_(chunk)).all():
+                        movies_by_imdb_id[movie.imdb_id] = movie
+
+                title_keys = list({title_key for _, fields, title_key in entries
+                                   if title_key[1] is not None and fields['imdb_id'] not in movies_by_imdb_id})
+                movies_by_title_key = {}
+                for chunk in self._chunked(title_keys):
+                    # Matches ix_movies_title_lower_year / Passt zu ix_movies_title_lower_year
+                    query = Movie.query.filter(tuple_(func.lower(Movie.title), Movie.year).in_(chunk)).order_by(Movie.id)
+                    for movie in query.all():
+                        movies_by_title_key.setdefault((movie.title.lower(), movie.year), movie)
+
+                # 3. Pick the movie of every entry, collect rows for missing ones / Film für jeden Eintrag wählen, Zeilen für fehlende sammeln
+                movie_id_for_entry = {}
+                new_movie_rows = {} # imdb_id -> row dict
+                pending_imdb_id_for_entry = {}
+                for index, fields, title_key in entries:
+                    imdb_id = fields['imdb_id']
+                    movie = movies_by_imdb_id.get(imdb_id) if imdb_id else None
+                    if movie is None:
+                        movie = movies_by_title_key.get(title_key)
+                        if movie is not None and imdb_id and not movie.imdb_id and imdb_id not in new_movie_rows:
+                            current_app.logger.info(f"Updating existing movie {movie.id} (Title: '{movie.title}') with new imdb_id '{imdb_id}'.")
+                            movie.imdb_id = imdb_id
+                            movies_by_imdb_id[imdb_id] = movie
+                            self._invalidate(movie_tag(movie.id))
+                    if movie is not None:
+                        movie_id_for_entry[index] = movie.id
+                    elif imdb_id:
+                        if imdb_id not in new_movie_rows:
+                            parsed_movie_fields = self._parse_omdb_data_for_movie_fields(self._build_omdb_payload(**fields))
+                            initial_rating = parsed_movie_fields.get('initial_omdb_rating')
+                            new_movie_rows[imdb_id] = dict(
+                                parsed_movie_fields,
+                                community_rating_sum=initial_rating or 0.0,
+                                community_rating_count=1 if initial_rating is not None else 0,
+                                community_rating=round(initial_rating, 2) if initial_rating is not None else None
+                            )
+                        pending_imdb_id_for_entry[index] = imdb_id
+                    else:
+                        results[index]['status'] = 'not_found'
+
+                # 4. Insert all missing movies with one executemany and read their ids back with IN queries
+                #    (the ORM unit of work would issue one INSERT per row on SQLite)
+                # 4. Alle fehlenden Filme mit einem executemany einfügen und ihre IDs per IN-Abfrage zurücklesen
+                #    (die ORM-Unit-of-Work würde unter SQLite ein INSERT pro Zeile absetzen)
+                db.session.flush()
+                created_movie_ids = set()
+                if new_movie_rows:
+                    db.session.execute(insert(Movie), list(new_movie_rows.values()))
+                    new_ids_by_imdb_id = {}
+                    for chunk in self._chunked(list(new_movie_rows)):
+                        new_ids_by_imdb_id.update(db.session.execute(select(Movie.imdb_id, Movie.id).where(Movie.imdb_id.in_(chunk))).all())
+                    created_movie_ids.update(new_ids_by_imdb_id.values())
+                    for index, imdb_id in pending_imdb_id_for_entry.items():
+                        movie_id_for_entry[index] = new_ids_by_imdb_id[imdb_id]
+
+                # 5. Create or update links, the last entry per movie wins / Verknüpfungen anlegen oder aktualisieren, der letzte Eintrag pro Film gewinnt
+                final_entry_for_movie = {}
+                for index in sorted(movie_id_for_entry):
+                    final_entry_for_movie[movie_id_for_entry[index]] = index
+
+                links_by_movie_id = {}
+                for chunk in self._chunked(list(final_entry_for_movie)):
+                    for link in UserMovie.query.filter(UserMovie.user_id == user.id, UserMovie.movie_id.in_(chunk)).all():
+                        links_by_movie_id[link.movie_id] = link
+
+                new_link_rows = []
+                affected_movie_ids = []
+                for movie_id, index in final_entry_for_movie.items():
+                    rating = movies[index].get('rating')
+                    link = links_by_movie_id.get(movie_id)
+                    if link is None:
+                        new_link_rows.append({'user_id': user.id, 'movie_id': movie_id, 'user_rating': rating})
+                        status = 'created' if movie_id in created_movie_ids else 'added'
+                        if rating is not None:
+                            affected_movie_ids.append(movie_id)
+                    elif link.user_rating != rating:
+                        link.user_rating = rating
+                        status = 'updated'
+                        affected_movie_ids.append(movie_id)
+                    else:
+                        status = 'unchanged'
+                    results[index].update(status=status, movie_id=movie_id)
+                    if status != 'unchanged':
+                        self._invalidate(movie_tag(movie_id))
+
+                for index, movie_id in movie_id_for_entry.items():
+                    if final_entry_for_movie[movie_id] != index: # Superseded by a later entry / Von einem späteren Eintrag ersetzt
+                        results[index].update(status='unchanged', movie_id=movie_id)
+
+                db.session.flush()
+                if new_link_rows:
+                    db.session.execute(insert(UserMovie), new_link_rows)
+                    self._invalidate(USERS_TAG)
+                if created_movie_ids:
+                    self._invalidate(CATALOG_TAG, *(movie_tag(movie_id) for movie_id in created_movie_ids))
+                self._invalidate(user_tag(user.id))
+                # 6. One recompute per affected movie, all in a single UPDATE / Eine Neuberechnung pro betroffenem Film, alle in einem UPDATE
+                for chunk in self._chunked(affected_movie_ids):
+                    self._recompute_community_ratings(chunk)
+
+            db.session.expire_all() # Core INSERTs/UPDATEs bypassed loaded objects / Core-INSERTs/-UPDATEs haben geladene Objekte umgangen
+            current_app.logger.info(f"Bulk add for user {user_id}: {len(movies)} entries, {len(created_movie_ids)} new movies, {len(affected_movie_ids)} community ratings recomputed.")
+            return results
+
+        except SQLAlchemyError as e:
+            current_app.logger.error(f"SQLAlchemyError in add_movies_bulk for user {user_id}: {e}. Operation rolled back.")
+            return None
+        except Exception as e:
+            current_app.logger.error(f"Unexpected error in add_movies_bulk for user {user_id}: {e}. Operation rolled back.")
+            return None
+
     def update_user_rating_for_movie(self, user_id: int, movie_id: int, new_rating: Optional[float]) -> bool:
         """
         Updates an individual user's rating for a specific movie.
-        It first validates the rating, then updates the UserMovie link. 
-        If successful, it commits this change and then triggers an update of the movie's community rating.
+        It first validates the rating, then updates the UserMovie link and adjusts the movie's
+        community rating by the delta between old and new rating in the same transaction.
 
         Aktualisiert das individuelle Rating eines Benutzers für einen bestimmten Film.
-        Validiert zuerst die Bewertung, aktualisiert dann die UserMovie-Verknüpfung.
-        Bei Erfolg wird diese Änderung committet und anschließend eine Aktualisierung 
-        des Community-Ratings des Films ausgelöst.
+        Validiert zuerst die Bewertung, aktualisiert dann die UserMovie-Verknüpfung und passt
+        das Community-Rating des Films in derselben Transaktion um das Delta zwischen alter und neuer Bewertung an.
         """
         try:
             user_movie_link = UserMovie.query.filter_by(user_id=user_id, movie_id=movie_id).first()
@@ -323,15 +742,16 @@ class SQLiteDataManager(DataManagerInterface):
                 # Invalid rating value {new_rating}. Must be between 0 and 5. / Ungültiger Bewertungswert {new_rating}. Muss zwischen 0 und 5 liegen.
                 return False
 
-            user_movie_link.user_rating = new_rating
-            db.session.commit() 
+            with self._unit_of_work():
+                old_rating = user_movie_link.user_rating
+                user_movie_link.user_rating = new_rating
+                self._apply_community_rating_delta(movie_id, old_rating, new_rating)
+                self._invalidate(user_tag(user_id), movie_tag(movie_id))
             current_app.logger.info(f"User rating for user {user_id}, movie {movie_id} updated to {new_rating} and committed.")
             # User rating updated and committed. / Benutzerbewertung aktualisiert und committet.
-            
-            return self._update_community_rating(movie_id)
+            return True
             
         except SQLAlchemyError as e:
-            db.session.rollback() 
             current_app.logger.error(f"Error updating user rating for user {user_id}, movie {movie_id}: {e}.")
             # Error updating user rating. / Fehler beim Aktualisieren der Benutzerbewertung.
             return False
@@ -349,20 +769,23 @@ class SQLiteDataManager(DataManagerInterface):
         Diese Funktion sollte mit äußerster Vorsicht verwendet werden, typischerweise nur für administrative Zwecke.
         """
         try:
-            movie = Movie.query.get(movie_id)
+            movie = self.get_movie_by_id(movie_id)
             if not movie:
                 current_app.logger.warning(f"Global movie deletion failed: Movie with ID {movie_id} not found.")
                 # Movie with ID {movie_id} not found. / Film mit ID {movie_id} nicht gefunden.
                 return False
             
             current_app.logger.info(f"Attempting global deletion of movie '{movie.title}' (ID: {movie_id}). This will remove all associated user links and comments.")
-            db.session.delete(movie)
-            db.session.commit()
+            with self._unit_of_work():
+                # User lists carry the tags of the movies they show; the movie counts of the linked users change
+                # Benutzerlisten tragen die Tags der angezeigten Filme; die Filmanzahlen der verknüpften Benutzer ändern sich
+                linked_user_ids = db.session.scalars(select(UserMovie.user_id).where(UserMovie.movie_id == movie_id)).all()
+                db.session.delete(movie)
+                self._invalidate(CATALOG_TAG, USERS_TAG, movie_tag(movie_id), *(user_tag(user_id) for user_id in linked_user_ids))
             current_app.logger.info(f"Movie '{movie.title}' (ID: {movie_id}) and all its associations deleted globally.")
             # Movie and associations deleted globally. / Film und zugehörige Verknüpfungen global gelöscht.
             return True
         except SQLAlchemyError as e:
-            db.session.rollback()
             current_app.logger.error(f"Error during global deletion of movie {movie_id}: {e}.")
             # Error during global deletion of movie. / Fehler beim globalen Löschen des Films.
             return False
@@ -370,21 +793,21 @@ class SQLiteDataManager(DataManagerInterface):
     def add_existing_movie_to_user_list(self, user_id: int, movie_id: int) -> bool:
         """
         Adds an already globally existing movie to a specific user's list.
-        This creates a UserMovie link without an initial user-specific rating (rating will be None).
-        The movie's community rating is updated afterwards.
+        This creates a UserMovie link without an initial user-specific rating (rating will be None),
+        so the movie's community rating is unchanged.
 
         Fügt einen bereits global existierenden Film zur Liste eines bestimmten Benutzers hinzu.
-        Dies erstellt eine UserMovie-Verknüpfung ohne eine anfängliche benutzerspezifische Bewertung (Bewertung ist None).
-        Das Community-Rating des Films wird danach aktualisiert.
+        Dies erstellt eine UserMovie-Verknüpfung ohne eine anfängliche benutzerspezifische Bewertung (Bewertung ist None),
+        daher bleibt das Community-Rating des Films unverändert.
         """
         try:
-            user = User.query.get(user_id)
+            user = self.get_user_by_id(user_id)
             if not user:
                 current_app.logger.warning(f"Add to list failed: User {user_id} not found.")
                 # User {user_id} not found. / Benutzer {user_id} nicht gefunden.
                 return False
             
-            movie = Movie.query.get(movie_id)
+            movie = self.get_movie_by_id(movie_id)
             if not movie:
                 current_app.logger.warning(f"Add to list failed: Movie {movie_id} not found globally.")
                 # Movie {movie_id} not found globally. / Film {movie_id} global nicht gefunden.
@@ -396,78 +819,115 @@ class SQLiteDataManager(DataManagerInterface):
                 # Movie {movie_id} is already in list of user {user_id}. / Film {movie_id} ist bereits in der Liste von Benutzer {user_id}.
                 return True 
 
-            user_movie_link = UserMovie(user_id=user.id, movie_id=movie.id, user_rating=None)
-            db.session.add(user_movie_link)
-            db.session.commit() 
+            with self._unit_of_work():
+                user_movie_link = UserMovie(user_id=user.id, movie_id=movie.id, user_rating=None)
+                db.session.add(user_movie_link)
+                self._invalidate(USERS_TAG, user_tag(user.id), movie_tag(movie.id))
             current_app.logger.info(f"Added movie {movie_id} to list of user {user_id} (no initial rating) and committed link.")
             # Added movie to user list (no initial rating) and committed link. / Film zur Benutzerliste hinzugefügt (keine initiale Bewertung) und Verknüpfung committet.
-            
-            return self._update_community_rating(movie_id) 
+            return True
 
         except SQLAlchemyError as e:
-            db.session.rollback() 
             current_app.logger.error(f"Error adding movie {movie_id} to list for user {user_id}: {e}.")
             # Error adding movie to user list. / Fehler beim Hinzufügen des Films zur Benutzerliste.
             return False
 
-    def _update_community_rating(self, movie_id: int) -> bool:
+    def _apply_community_rating_delta(self, movie_id: int, old_rating: Optional[float], new_rating: Optional[float]) -> None:
         """
-        Private helper: Recalculates and updates a movie's community rating and rating count.
-        This is based on its initial OMDb rating (if any) and all individual user ratings.
-        Commits the changes to the movie if successful.
+        Private helper: Adjusts a movie's running rating sum/count by the difference between an old and a new
+        user rating (None means "not rated") and derives the average from them in a single UPDATE.
+        The cost is constant regardless of how many ratings the movie has. Does not commit.
 
-        Private Hilfsmethode: Berechnet das Community-Rating und die Anzahl der Bewertungen eines Films neu und aktualisiert diese.
-        Dies basiert auf seiner initialen OMDb-Bewertung (falls vorhanden) und allen individuellen Benutzerbewertungen.
-        Committet die Änderungen am Film bei Erfolg.
+        Private Hilfsmethode: Passt laufende Summe/Anzahl der Bewertungen eines Films um die Differenz zwischen
+        alter und neuer Benutzerbewertung an (None bedeutet "nicht bewertet") und leitet den Durchschnitt
+        in einem einzigen UPDATE daraus ab. Der Aufwand ist unabhängig von der Anzahl der Bewertungen. Committet nicht.
         """
-        try:
-            movie = Movie.query.get(movie_id)
-            if not movie:
-                current_app.logger.warning(f"Community rating update failed: Movie {movie_id} not found.")
-                # Movie {movie_id} not found. / Film {movie_id} nicht gefunden.
-                return False
-
-            current_total_rating = 0.0
-            current_rating_count = 0
+        delta_sum = (new_rating or 0.0) - (old_rating or 0.0)
+        delta_count = (new_rating is not None) - (old_rating is not None)
+        if delta_sum == 0 and delta_count == 0:
+            return
+
+        new_sum = func.coalesce(Movie.community_rating_sum, 0.0) + delta_sum
+        new_count = func.coalesce(Movie.community_rating_count, 0) + delta_count
+        db.session.execute(
+            update(Movie)
+            .where(Movie.id == movie_id)
+            .values(
+                community_rating_sum=new_sum,
+                community_rating_count=new_count,
+                community_rating=case((new_count > 0, func.round(new_sum / new_count, 2)), else_=None)
+            )
+            .execution_options(synchronize_session='fetch')
+        )
+        self._invalidate(movie_tag(movie_id))
+        current_app.logger.debug(f"Community rating delta for movie {movie_id}: sum {delta_sum:+}, count {delta_count:+}.")
 
-            if movie.initial_omdb_rating is not None:
-                current_total_rating += movie.initial_omdb_rating
-                current_rating_count += 1
-                current_app.logger.debug(f"Movie {movie_id}: Initial OMDb rating {movie.initial_omdb_rating} included in community rating calculation.")
+    def _recompute_community_ratings(self, movie_ids: Optional[List[int]] = None):
+        """
+        Private helper: Recomputes the running rating sum, count and average from the initial OMDb rating
+        and all user ratings with a single set-based UPDATE, for the given movies or all movies.
+        Does not commit and does not synchronize loaded objects. Returns the result of the UPDATE.
 
-            user_ratings_query = db.session.query(UserMovie.user_rating).filter(
-                UserMovie.movie_id == movie_id,
-                UserMovie.user_rating.isnot(None) # Only consider non-null ratings
-            ).all()
+        Private Hilfsmethode: Berechnet laufende Bewertungssumme, -anzahl und Durchschnitt aus dem initialen OMDb-Rating
+        und allen Benutzerbewertungen mit einem einzigen mengenbasierten UPDATE neu, für die angegebenen oder alle Filme.
+        Committet nicht und synchronisiert keine geladenen Objekte. Gibt das Ergebnis des UPDATE zurück.
+        """
+        user_rating_sum = (
+            select(func.coalesce(func.sum(UserMovie.user_rating), 0.0))
+            .where(UserMovie.movie_id == Movie.id)
+            .scalar_subquery()
+        )
+        user_rating_count = (
+            select(func.count(UserMovie.user_rating)) # COUNT(column) skips NULL ratings / COUNT(Spalte) überspringt NULL-Bewertungen
+            .where(UserMovie.movie_id == Movie.id)
+            .scalar_subquery()
+        )
+        total_sum = func.coalesce(Movie.initial_omdb_rating, 0.0) + user_rating_sum
+        total_count = case((Movie.initial_omdb_rating.isnot(None), 1), else_=0) + user_rating_count
+        statement = update(Movie)
+        if movie_ids is not None:
+            statement = statement.where(Movie.id.in_(movie_ids))
+            self._invalidate(*(movie_tag(movie_id) for movie_id in movie_ids))
+        else:
+            self._invalidate(ALL_TAG)
+        return db.session.execute(
+            statement
+            .values(
+                community_rating_sum=total_sum,
+                community_rating_count=total_count,
+                community_rating=case((total_count > 0, func.round(total_sum / total_count, 2)), else_=None)
+            )
+            .execution_options(synchronize_session=False)
+        )
 
-            user_ratings_list = [r[0] for r in user_ratings_query]
+    def reconcile_community_ratings(self) -> int:
+        """
+        Recomputes the running rating sum, count and average of all movies from the initial OMDb rating
+        and all user ratings with a single set-based UPDATE, repairing any drift of the incremental values.
+        Returns the number of movies updated, or -1 on error.
 
-            current_total_rating += sum(user_ratings_list)
-            current_rating_count += len(user_ratings_list)
-            
-            if current_rating_count > 0:
-                movie.community_rating = round(current_total_rating / current_rating_count, 2) # Round to 2 decimal places
-                movie.community_rating_count = current_rating_count
-            else: # Should only happen if initial_omdb_rating is also None and no user ratings
-                movie.community_rating = None 
-                movie.community_rating_count = 0
-            
-            db.session.commit() # Commit the updated movie rating and count
-            current_app.logger.info(f"Community rating for movie {movie_id} ('{movie.title}') updated to: {movie.community_rating} ({movie.community_rating_count} ratings). Initial OMDb: {movie.initial_omdb_rating}.")
-            return True
+        Berechnet laufende Bewertungssumme, -anzahl und Durchschnitt aller Filme aus dem initialen OMDb-Rating
+        und allen Benutzerbewertungen mit einem einzigen mengenbasierten UPDATE neu und behebt so Abweichungen
+        der inkrementellen Werte. Gibt die Anzahl aktualisierter Filme zurück, oder -1 bei Fehler.
+        """
+        try:
+            with self._unit_of_work():
+                result = self._recompute_community_ratings()
+            db.session.expire_all() # Loaded Movie objects may hold pre-reconciliation values
+            current_app.logger.info(f"Community ratings reconciled for {result.rowcount} movies.")
+            return result.rowcount
         except SQLAlchemyError as e:
-            db.session.rollback()
-            current_app.logger.error(f"Error updating community rating for movie {movie_id}: {e}.")
-            # Error updating community rating. / Fehler beim Aktualisieren des Community-Ratings.
-            return False
+            current_app.logger.error(f"Error reconciling community ratings: {e}.")
+            # Error reconciling community ratings. / Fehler beim Abgleich der Community-Ratings.
+            return -1
 
     def delete_movie_from_user_list(self, user_id: int, movie_id: int) -> bool:
         """
         Removes a movie from a specific user's list by deleting the UserMovie link.
-        After successfully deleting the link and committing, it updates the movie's community rating.
+        The user's rating (if any) is subtracted from the movie's community rating in the same transaction.
 
         Entfernt einen Film aus der Liste eines bestimmten Benutzers durch Löschen der UserMovie-Verknüpfung.
-        Nach erfolgreichem Löschen der Verknüpfung und Commit wird das Community-Rating des Films aktualisiert.
+        Die Bewertung des Benutzers (falls vorhanden) wird in derselben Transaktion vom Community-Rating des Films abgezogen.
         """
         try:
             user_movie_link = UserMovie.query.filter_by(user_id=user_id, movie_id=movie_id).first()
@@ -477,15 +937,15 @@ class SQLiteDataManager(DataManagerInterface):
                 # No UserMovie link found for user {user_id} and movie {movie_id} to delete. / Keine UserMovie-Verknüpfung für Benutzer {user_id} und Film {movie_id} zum Löschen gefunden.
                 return False 
 
-            db.session.delete(user_movie_link)
-            db.session.commit() 
+            with self._unit_of_work():
+                self._apply_community_rating_delta(movie_id, user_movie_link.user_rating, None)
+                db.session.delete(user_movie_link)
+                self._invalidate(USERS_TAG, user_tag(user_id), movie_tag(movie_id))
             current_app.logger.info(f"UserMovie link for user {user_id}, movie {movie_id} deleted and committed.")
             # UserMovie link deleted and committed. / UserMovie-Verknüpfung gelöscht und committet.
-            
-            return self._update_community_rating(movie_id)
+            return True
             
         except SQLAlchemyError as e:
-            db.session.rollback() 
             current_app.logger.error(f"Error removing movie {movie_id} from list for user {user_id}: {e}.")
             # Error removing movie from list. / Fehler beim Entfernen des Films von der Liste.
             return False
@@ -505,32 +965,284 @@ class SQLiteDataManager(DataManagerInterface):
             # Error fetching movie by imdb_id. / Fehler beim Abrufen des Films nach imdb_id.
             return None
 
+    def get_omdb_cache_entry(self, cache_key: str) -> Optional[OmdbCacheEntry]:
+        """
+        Retrieves a cached OMDb response by its cache key (see api/omdb_client.py), regardless of its age.
+        Liefert eine gecachte OMDb-Antwort anhand ihres Cache-Schlüssels (siehe api/omdb_client.py), unabhängig von ihrem Alter.
+        """
+        try:
+            return db.session.get(OmdbCacheEntry, cache_key)
+        except SQLAlchemyError as e:
+            current_app.logger.error(f"Error reading OMDb cache entry '{cache_key}': {e}.")
+            # Error reading OMDb cache entry. / Fehler beim Lesen des OMDb-Cache-Eintrags.
+            return None
+
+    def save_omdb_cache_entry(self, cache_keys: Sequence[str], payload: str, found: bool, imdb_id: Optional[str] = None) -> bool:
+        """
+        Stores (or replaces) a raw OMDb response under one or more cache keys, e.g. the title key of the lookup
+        and the IMDb ID key of the movie found, so later lookups by either key are hits. Concurrent writers
+        of the same key do not fail (SQLite upsert).
+
+        Speichert (oder ersetzt) eine rohe OMDb-Antwort unter einem oder mehreren Cache-Schlüsseln, z.B. dem Titel-Schlüssel
+        der Suche und dem IMDb-ID-Schlüssel des gefundenen Films, sodass spätere Suchen über beide Schlüssel Treffer sind.
+        Gleichzeitige Schreiber desselben Schlüssels scheitern nicht (SQLite-Upsert).
+        """
+        rows = [{'cache_key': key, 'imdb_id': imdb_id, 'payload': payload, 'found': found, 'fetched_at': datetime.utcnow()}
+                for key in dict.fromkeys(cache_keys)]
+        if not rows:
+            return False
+        statement = sqlite_insert(OmdbCacheEntry)
+        statement = statement.on_conflict_do_update(
+            index_elements=[OmdbCacheEntry.cache_key],
+            set_={name: statement.excluded[name] for name in ('imdb_id', 'payload', 'found', 'fetched_at')}
+        )
+        try:
+            with self._unit_of_work():
+                db.session.execute(statement, rows)
+            return True
+        except SQLAlchemyError as e:
+            current_app.logger.error(f"Error saving OMDb cache entries {list(cache_keys)}: {e}.")
+            # Error saving OMDb cache entries. / Fehler beim Speichern der OMDb-Cache-Einträge.
+            return False
+
+    def get_stale_movies(self, limit: int, refreshed_before: datetime) -> List[Row]:
+        """
+        Retrieves up to `limit` movies with an IMDb ID whose OMDb data was last refreshed before `refreshed_before`
+        (or never), stalest first: rows (id, imdb_id, imdb_rating, imdb_votes, metascore).
+
+        Liefert bis zu `limit` Filme mit IMDb-ID, deren OMDb-Daten zuletzt vor `refreshed_before` (oder nie)
+        aktualisiert wurden, die ältesten zuerst: Zeilen (id, imdb_id, imdb_rating, imdb_votes, metascore).
+        """
+        try:
+            return db.session.execute(
+                select(Movie.id, Movie.imdb_id, Movie.imdb_rating, Movie.imdb_votes, Movie.metascore)
+                .where(Movie.imdb_id.isnot(None),
+                       (Movie.last_refreshed_at.is_(None)) | (Movie.last_refreshed_at < refreshed_before))
+                .order_by(Movie.last_refreshed_at) # NULL (never refreshed) sorts first / NULL (nie aktualisiert) zuerst
+                .limit(limit)
+            ).all()
+        except SQLAlchemyError as e:
+            current_app.logger.error(f"Error fetching stale movies for the OMDb refresh: {e}.")
+            # Error fetching stale movies. / Fehler beim Abrufen veralteter Filme.
+            return []
+
+    def update_movie_refresh_data(self, updates: Sequence[dict]) -> int:
+        """
+        Writes refreshed OMDb data of many movies in one transaction (one executemany UPDATE). Every dict holds
+        'id', 'imdb_rating', 'imdb_votes', 'metascore' and 'last_refreshed_at'. Returns the number of movies
+        updated, or -1 on error.
+
+        Schreibt aktualisierte OMDb-Daten vieler Filme in einer Transaktion (ein executemany-UPDATE). Jedes Dictionary
+        enthält 'id', 'imdb_rating', 'imdb_votes', 'metascore' und 'last_refreshed_at'. Gibt die Anzahl aktualisierter
+        Filme zurück, oder -1 bei Fehler.
+        """
+        if not updates:
+            return 0
+        movies = Movie.__table__
+        statement = (
+            update(movies)
+            .where(movies.c.id == bindparam('movie_id'))
+            .values(imdb_rating=bindparam('imdb_rating'), imdb_votes=bindparam('imdb_votes'),
+                    metascore=bindparam('metascore'), last_refreshed_at=bindparam('last_refreshed_at'))
+        )
+        rows = [{'movie_id': row['id'], 'imdb_rating': row['imdb_rating'], 'imdb_votes': row['imdb_votes'],
+                 'metascore': row['metascore'], 'last_refreshed_at': row['last_refreshed_at']} for row in updates]
+        try:
+            with self._unit_of_work():
+                db.session.execute(statement, rows)
+                self._invalidate(*(movie_tag(row['id']) for row in updates))
+            return len(rows)
+        except SQLAlchemyError as e:
+            current_app.logger.error(f"Error writing OMDb refresh data for {len(rows)} movies: {e}.")
+            # Error writing OMDb refresh data. / Fehler beim Schreiben der OMDb-Aktualisierungsdaten.
+            return -1
+
+    def reserve_omdb_refresh_calls(self, day: date, daily_quota: int, wanted: int) -> int:
+        """
+        Reserves up to `wanted` OMDb calls of the refresh quota of the UTC day `day` and returns how many were granted
+        (0 when the quota is used up). The count is stored in the database, so it holds across processes and restarts;
+        a compare-and-set UPDATE keeps concurrent reservations from exceeding `daily_quota`. Returns 0 on error.
+
+        Reserviert bis zu `wanted` OMDb-Aufrufe des Aktualisierungskontingents des UTC-Tages `day` und gibt zurück, wie
+        viele gewährt wurden (0, wenn das Kontingent verbraucht ist). Der Zähler liegt in der Datenbank und gilt daher
+        über Prozesse und Neustarts hinweg; ein Compare-and-Set-UPDATE verhindert, dass gleichzeitige Reservierungen
+        `daily_quota` überschreiten. Gibt bei Fehler 0 zurück.
+        """
+        try:
+            with self._unit_of_work():
+                # Also starts the write transaction before the count is read / Startet auch die Schreibtransaktion, bevor der Zähler gelesen wird
+                db.session.execute(sqlite_insert(OmdbRefreshQuota).values(day=day, calls=0).on_conflict_do_nothing())
+                calls = db.session.execute(select(OmdbRefreshQuota.calls).where(OmdbRefreshQuota.day == day)).scalar_one()
+                granted = max(min(wanted, daily_quota - calls), 0)
+                if granted:
+                    result = db.session.execute(
+                        update(OmdbRefreshQuota)
+                        .where(OmdbRefreshQuota.day == day, OmdbRefreshQuota.calls == calls)
+                        .values(calls=calls + granted)
+                    )
+                    if result.rowcount != 1: # Another process reserved in between / Ein anderer Prozess hat dazwischen reserviert
+                        granted = 0
+            return granted
+        except SQLAlchemyError as e:
+            current_app.logger.error(f"Error reserving {wanted} OMDb refresh calls for {day}: {e}.")
+            # Error reserving OMDb refresh calls. / Fehler beim Reservieren von OMDb-Aktualisierungsaufrufen.
+            return 0
+
+    def release_omdb_refresh_calls(self, day: date, unused: int) -> bool:
+        """
+        Gives back reserved but unused OMDb calls of the UTC day `day` (e.g. when a batch stopped early).
+        Gibt reservierte, aber nicht genutzte OMDb-Aufrufe des UTC-Tages `day` zurück (z.B. wenn ein Block vorzeitig endete).
+        """
+        if unused <= 0:
+            return True
+        try:
+            with self._unit_of_work():
+                db.session.execute(
+                    update(OmdbRefreshQuota).where(OmdbRefreshQuota.day == day)
+                    .values(calls=func.max(OmdbRefreshQuota.calls - unused, 0))
+                )
+            return True
+        except SQLAlchemyError as e:
+            current_app.logger.error(f"Error releasing {unused} OMDb refresh calls for {day}: {e}.")
+            # Error releasing OMDb refresh calls. / Fehler beim Freigeben von OMDb-Aktualisierungsaufrufen.
+            return False
+
+    def pause_omdb_refresh(self, day: date, daily_quota: int, until: datetime) -> bool:
+        """
+        Marks the refresh quota of the UTC day `day` as used up and pauses the refresh until `until` (UTC) in every
+        process, e.g. after OMDb answered "Request limit reached!".
+        Markiert das Aktualisierungskontingent des UTC-Tages `day` als verbraucht und pausiert die Aktualisierung in
+        jedem Prozess bis `until` (UTC), z.B. nachdem OMDb "Request limit reached!" geantwortet hat.
+        """
+        statement = sqlite_insert(OmdbRefreshQuota).values(day=day, calls=daily_quota, paused_until=until)
+        statement = statement.on_conflict_do_update(
+            index_elements=[OmdbRefreshQuota.day],
+            set_={'calls': func.max(OmdbRefreshQuota.calls, daily_quota), 'paused_until': until}
+        )
+        try:
+            with self._unit_of_work():
+                db.session.execute(statement)
+            return True
+        except SQLAlchemyError as e:
+            current_app.logger.error(f"Error pausing the OMDb refresh until {until}: {e}.")
+            # Error pausing the OMDb refresh. / Fehler beim Pausieren der OMDb-Aktualisierung.
+            return False
+
+    def get_omdb_refresh_quota(self, day: date) -> Optional[dict]:
+        """
+        Returns the OMDb refresh quota state: 'calls' used on the UTC day `day` and the latest 'paused_until' (UTC,
+        of any day, so a pause outlasts midnight). Returns None on error.
+        Liefert den Zustand des OMDb-Aktualisierungskontingents: am UTC-Tag `day` verbrauchte 'calls' und das späteste
+        'paused_until' (UTC, beliebiger Tag, damit eine Pause über Mitternacht hinaus gilt). Gibt bei Fehler None zurück.
+        """
+        try:
+            calls = db.session.execute(select(OmdbRefreshQuota.calls).where(OmdbRefreshQuota.day == day)).scalar()
+            paused_until = db.session.execute(select(func.max(OmdbRefreshQuota.paused_until))).scalar()
+            return {'calls': calls or 0, 'paused_until': paused_until}
+        except SQLAlchemyError as e:
+            current_app.logger.error(f"Error reading the OMDb refresh quota for {day}: {e}.")
+            # Error reading the OMDb refresh quota. / Fehler beim Lesen des OMDb-Aktualisierungskontingents.
+            return None
+
+    def get_local_catalog_entry(self, title: Optional[str] = None, imdb_id: Optional[str] = None,
+                                year: Optional[int] = None, unique: bool = False) -> Optional[dict]:
+        """
+        Looks up a movie in the local IMDb catalog (see import_imdb.py) by IMDb ID, or by title (case-insensitive,
+        optionally with year; the most-voted match wins) and returns it in the OMDb format used by
+        add_movie_globally. Poster and plot are not part of the dumps, the keys are missing.
+        With unique=True a title lookup needs the year and exactly one match, so no movie is guessed.
+        Returns None if the movie is not in the catalog (or the catalog was never imported).
+
+        Sucht einen Film im lokalen IMDb-Katalog (siehe import_imdb.py) anhand der IMDb-ID oder des Titels (ohne
+        Groß-/Kleinschreibung, optional mit Jahr; der meistbewertete Treffer gewinnt) und liefert ihn im OMDb-Format,
+        das add_movie_globally verwendet. Poster und Handlung sind nicht Teil der Dumps, die Schlüssel fehlen.
+        Mit unique=True braucht eine Titelsuche das Jahr und genau einen Treffer, damit kein Film geraten wird.
+        Gibt None zurück, wenn der Film nicht im Katalog ist (oder der Katalog nie importiert wurde).
+        """
+        try:
+            if imdb_id:
+                imdb_title = db.session.get(ImdbTitle, imdb_id.strip())
+            elif title and title.strip():
+                if unique and year is None:
+                    return None
+                query = ImdbTitle.query.filter(func.lower(ImdbTitle.primary_title) == func.lower(' '.join(title.split())))
+                if year is not None:
+                    query = query.filter(ImdbTitle.start_year == year)
+                if unique:
+                    matches = query.limit(2).all()
+                    imdb_title = matches[0] if len(matches) == 1 else None
+                else:
+                    imdb_title = query.order_by(ImdbTitle.num_votes.desc()).first() # NULL votes sort last / NULL-Stimmen zuletzt
+            else:
+                return None
+            if imdb_title is None:
+                return None
+
+            crew = {'directors': (imdb_title.directors or '').split(','), 'writers': (imdb_title.writers or '').split(',')}
+            nconsts = {nconst for nconsts in crew.values() for nconst in nconsts if nconst}
+            names = dict(
+                db.session.execute(select(ImdbName.nconst, ImdbName.primary_name).where(ImdbName.nconst.in_(nconsts))).all()
+            ) if nconsts else {}
+            people = {role: ', '.join(names[nconst] for nconst in nconsts if nconst in names) or 'N/A'
+                      for role, nconsts in crew.items()}
+            return {
+                'Title': imdb_title.primary_title,
+                'Year': str(imdb_title.start_year) if imdb_title.start_year else 'N/A',
+                'Runtime': f"{imdb_title.runtime_minutes} min" if imdb_title.runtime_minutes else 'N/A',
+                'Genre': imdb_title.genres.replace(',', ', ') if imdb_title.genres else 'N/A',
+                'Director': people['directors'],
+                'Writer': people['writers'],
+                'imdbRating': f"{imdb_title.average_rating:.1f}" if imdb_title.average_rating is not None else 'N/A',
+                'imdbVotes': f"{imdb_title.num_votes:,}" if imdb_title.num_votes is not None else 'N/A',
+                'imdbID': imdb_title.tconst,
+                'Type': 'movie',
+                'Response': 'True',
+            }
+        except SQLAlchemyError as e:
+            current_app.logger.error(f"Error looking up '{imdb_id or title}' in the local IMDb catalog: {e}.")
+            # Error looking up the local IMDb catalog. / Fehler bei der Suche im lokalen IMDb-Katalog.
+            return None
+
+    @staticmethod
+    def merge_local_catalog_entry(local_entry: dict, movie_data: Optional[dict]) -> dict:
+        """
+        Merges a local catalog entry with OMDb/form data: every field of movie_data with a value wins, the catalog only
+        fills fields that are missing, empty or 'N/A'.
+
+        Führt einen lokalen Katalogeintrag mit OMDb-/Formulardaten zusammen: jedes Feld von movie_data mit einem Wert hat
+        Vorrang, der Katalog füllt nur fehlende, leere oder 'N/A'-Felder.
+        """
+        supplied = {key: value for key, value in (movie_data or {}).items() if value not in (None, '', 'N/A')}
+        return {**local_entry, **supplied}
+
     def _parse_omdb_data_for_movie_fields(self, movie_data: dict) -> dict:
         """
         Parses raw OMDb-like data and converts it into a clean dictionary suitable for Movie model fields.
-        Handles type conversions (e.g., year to int, rating to float) and default values for missing fields.
+        Handles type conversions (e.g., year to int, rating to float) and default values for missing or None fields.
 
         Parst Rohdaten (OMDb-ähnlich) und konvertiert sie in ein sauberes Dictionary, das für Movie-Modellfelder geeignet ist.
-        Behandelt Typkonvertierungen (z.B. Jahr zu int, Bewertung zu float) und Standardwerte für fehlende Felder.
+        Behandelt Typkonvertierungen (z.B. Jahr zu int, Bewertung zu float) und Standardwerte für fehlende oder None-Felder.
         """
         parsed_data = {}
         imdb_id_for_log = movie_data.get('imdbID', 'N/A') # For logging context
 
-        parsed_data['title'] = movie_data.get('Title', 'N/A').strip()
-        parsed_data['director'] = movie_data.get('Director', '').strip() or None
-        parsed_data['plot'] = movie_data.get('Plot', '').strip() or None
-        parsed_data['runtime'] = movie_data.get('Runtime', '').strip() or None
-        parsed_data['awards'] = movie_data.get('Awards', '').strip() or None
-        parsed_data['language'] = movie_data.get('Language', '').strip() or None
-        parsed_data['genre'] = movie_data.get('Genre', '').strip() or None
-        parsed_data['actors'] = movie_data.get('Actors', '').strip() or None
-        parsed_data['writer'] = movie_data.get('Writer', '').strip() or None
-        parsed_data['country'] = movie_data.get('Country', '').strip() or None
-        parsed_data['metascore'] = movie_data.get('Metascore', '').strip() or None
-        parsed_data['rated_omdb'] = movie_data.get('Rated', '').strip() or None
+        parsed_data['title'] = (movie_data.get('Title') or 'N/A').strip()
+        parsed_data['director'] = (movie_data.get('Director') or '').strip() or None
+        parsed_data['plot'] = (movie_data.get('Plot') or '').strip() or None
+        parsed_data['runtime'] = (movie_data.get('Runtime') or '').strip() or None
+        parsed_data['awards'] = (movie_data.get('Awards') or '').strip() or None
+        parsed_data['language'] = (movie_data.get('Language') or '').strip() or None
+        parsed_data['genre'] = (movie_data.get('Genre') or '').strip() or None
+        parsed_data['actors'] = (movie_data.get('Actors') or '').strip() or None
+        parsed_data['writer'] = (movie_data.get('Writer') or '').strip() or None
+        parsed_data['country'] = (movie_data.get('Country') or '').strip() or None
+        parsed_data['metascore'] = (movie_data.get('Metascore') or '').strip() or None
+        parsed_data['rated_omdb'] = (movie_data.get('Rated') or '').strip() or None
+        parsed_data['imdb_rating'] = (movie_data.get('imdbRating') or '').strip() or None
+        parsed_data['imdb_votes'] = (movie_data.get('imdbVotes') or '').strip() or None
         parsed_data['imdb_id'] = movie_data.get('imdbID') 
 
-        year_str = movie_data.get('Year', '').strip()
+        year_str = (movie_data.get('Year') or '').strip()
         year = None
         if year_str:
             try: # Handle cases like "2000-2005" or "2000"
@@ -562,19 +1274,25 @@ class SQLiteDataManager(DataManagerInterface):
         
         return parsed_data
 
-    def add_movie_globally(self, movie_data: dict) -> Optional[Movie]:
+    def add_movie_globally(self, movie_data: dict, refreshed_at: Optional[datetime] = None) -> Optional[Movie]:
         """
         Adds a movie globally to the database if it doesn't already exist (based on imdbID).
         Uses _parse_omdb_data_for_movie_fields for data preparation.
         Does not update existing movie data if the movie already exists.
         Returns the Movie object (either newly created or pre-existing).
-        This method handles its own database transaction (commit or rollback).
+        Runs in its own unit of work, or joins the caller's (e.g. add_movie) when called from one.
+        refreshed_at is the time of a live OMDb fetch of movie_data and becomes last_refreshed_at. Without it (form
+        data, old omdb_cache rows, local catalog merges) last_refreshed_at stays NULL and the OMDb refresh picks the
+        movie up first.
 
         Fügt einen Film global zur Datenbank hinzu, wenn er nicht bereits existiert (basierend auf imdbID).
         Verwendet _parse_omdb_data_for_movie_fields zur Datenaufbereitung.
         Aktualisiert keine bestehenden Filmdaten, wenn der Film bereits existiert.
         Gibt das Movie-Objekt zurück (entweder das neu erstellte oder das bereits existierende).
-        Diese Methode handhabt ihre eigene Datenbanktransaktion (Commit oder Rollback).
+        Läuft in einer eigenen Unit-of-Work oder schließt sich der des Aufrufers (z.B. add_movie) an.
+        refreshed_at ist der Zeitpunkt eines Live-Abrufs von movie_data bei OMDb und wird zu last_refreshed_at. Ohne ihn
+        (Formulardaten, alte omdb_cache-Zeilen, Zusammenführung mit dem lokalen Katalog) bleibt last_refreshed_at NULL
+        und die OMDb-Aktualisierung nimmt den Film als Erstes dran.
         """
         raw_imdb_id = movie_data.get('imdbID')
         if not raw_imdb_id:
@@ -595,27 +1313,27 @@ class SQLiteDataManager(DataManagerInterface):
 
             current_app.logger.info(f"Creating new global movie entry for '{parsed_movie_fields.get('title', 'N/A')}' (imdbID: {parsed_movie_fields['imdb_id']}).")
             
-            new_movie = Movie(**parsed_movie_fields)
-            
-            db.session.add(new_movie)
-            db.session.flush() # Flush to get new_movie.id for _update_community_rating
-            current_app.logger.info(f"Movie '{new_movie.title}' (imdb_id: {new_movie.imdb_id}) added to session with ID {new_movie.id} before community rating update.")
-            
-            if self._update_community_rating(new_movie.id): # This method commits on its own success
-                current_app.logger.info(f"Movie '{new_movie.title}' (imdb_id: {new_movie.imdb_id}) successfully added globally and community rating updated.")
-                return new_movie # Success
-            else: # _update_community_rating failed and should have rolled back its own changes.
-                  # We need to ensure the new_movie addition is also rolled back.
-                current_app.logger.error(f"Failed to update community rating for new global movie '{new_movie.title}' (ID: {new_movie.id}). Rolling back global add.")
-                db.session.rollback() # Explicit rollback for the new_movie addition
-                return None
+            # Seed the running community rating with the initial OMDb rating (if any)
+            # Laufendes Community-Rating mit dem initialen OMDb-Rating (falls vorhanden) initialisieren
+            initial_rating = parsed_movie_fields.get('initial_omdb_rating')
+            with self._unit_of_work():
+                new_movie = Movie(
+                    **parsed_movie_fields,
+                    community_rating_sum=initial_rating or 0.0,
+                    community_rating_count=1 if initial_rating is not None else 0,
+                    community_rating=round(initial_rating, 2) if initial_rating is not None else None,
+                    last_refreshed_at=refreshed_at
+                )
+                db.session.add(new_movie)
+                db.session.flush() # Assigns new_movie.id (also when joining an outer unit of work) / Vergibt new_movie.id (auch innerhalb einer äußeren Unit-of-Work)
+                self._invalidate(CATALOG_TAG, movie_tag(new_movie.id))
+            current_app.logger.info(f"Movie '{new_movie.title}' (imdb_id: {new_movie.imdb_id}) successfully added globally with ID {new_movie.id} and community rating {new_movie.community_rating}.")
+            return new_movie # Success
 
         except SQLAlchemyError as e:
-            db.session.rollback()
             current_app.logger.error(f"SQLAlchemyError in add_movie_globally for imdbID {raw_imdb_id}: {e}. Operation rolled back.")
             return None
         except Exception as e: # Catch any other unexpected errors
-            db.session.rollback()
             current_app.logger.error(f"Unexpected error in add_movie_globally for imdbID {raw_imdb_id}: {e}. Operation rolled back.")
             return None
 
@@ -680,20 +1398,51 @@ class SQLiteDataManager(DataManagerInterface):
         if not isinstance(user_id, int): # Basic type check
             current_app.logger.warning(f"Attempted to fetch user with non-integer ID: {user_id}.")
             return None
+        request_cache = self._request_cache()
+        if ('user', user_id) in request_cache:
+            return request_cache[('user', user_id)]
         try:
-            return User.query.get(user_id)
+            user = User.query.get(user_id)
+            request_cache[('user', user_id)] = user
+            return user
         except SQLAlchemyError as e: # Should be rare for a simple get by PK
             current_app.logger.error(f"Error fetching user by ID {user_id}: {e}.")
             # Error fetching user by ID {user_id}: {e}. / Fehler beim Abrufen des Benutzers nach ID {user_id}: {e}.
             return None
 
-    def get_user_movie_relations(self, user_id: int) -> List[UserMovie]:
+    def _user_movie_relations_query(self, user_id: int, loading: str):
+        """
+        Internal helper: Builds the UserMovie list query for a user with the requested loading profile.
+        Raises ValueError for unknown profiles.
+
+        Interne Hilfsmethode: Baut die UserMovie-Listenabfrage für einen Benutzer mit dem gewünschten Ladeprofil.
+        Löst ValueError bei unbekannten Profilen aus.
+        """
+        if loading not in self.LOADING_PROFILES:
+            raise ValueError(f"Unknown loading profile '{loading}'. Expected one of {self.LOADING_PROFILES}.")
+
+        # Ordering by UserMovie.movie_id (== Movie.id) lets SQLite walk the (user_id, movie_id) index without a sort
+        # Sortierung nach UserMovie.movie_id (== Movie.id) erlaubt SQLite, den (user_id, movie_id)-Index ohne Sortierung zu nutzen
+        query = UserMovie.query.filter_by(user_id=user_id).join(Movie).order_by(UserMovie.movie_id)
+        if loading == self.LOADING_PROFILE_JOINED:
+            # Populate .movie from the JOIN that is already needed for ordering
+            # .movie aus dem JOIN befüllen, der für die Sortierung ohnehin benötigt wird
+            query = query.options(contains_eager(UserMovie.movie))
+        elif loading == self.LOADING_PROFILE_SELECTIN:
+            query = query.options(selectinload(UserMovie.movie))
+        return query
+
+    def get_user_movie_relations(self, user_id: int, loading: str = LOADING_PROFILE_JOINED) -> List[UserMovie]:
         """
         Retrieves all UserMovie link objects for a specific user.
         These objects contain user-specific ratings. Default ordering by Movie ID.
+        `loading` selects how the related Movie objects are loaded (see LOADING_PROFILES);
+        the default 'joined' profile fetches links and movies in a single round trip.
 
         Liefert alle UserMovie-Verknüpfungsobjekte für einen bestimmten Benutzer.
         Diese Objekte enthalten benutzerspezifische Bewertungen. Standard-Sortierung nach Film-ID.
+        `loading` bestimmt, wie die zugehörigen Movie-Objekte geladen werden (siehe LOADING_PROFILES);
+        das Standardprofil 'joined' lädt Verknüpfungen und Filme in einem einzigen Roundtrip.
         """
         try:
             user = self.get_user_by_id(user_id) # Ensure user exists
@@ -701,13 +1450,59 @@ class SQLiteDataManager(DataManagerInterface):
                 current_app.logger.warning(f"Cannot get UserMovie relations: User {user_id} not found.")
                 return []
 
-            relations = UserMovie.query.filter_by(user_id=user_id).join(Movie).order_by(Movie.id).all()
+            relations = self._user_movie_relations_query(user_id, loading).all()
             return relations
         except SQLAlchemyError as e:
             current_app.logger.error(f"Error fetching UserMovie relations for user {user_id}: {e}.")
             # Error fetching UserMovie relations for user {user_id}: {e}. / Fehler beim Abrufen der Filmverknüpfungen für Benutzer {user_id}: {e}.
             return []
 
+    def get_user_movie_relations_page(self, user_id: int, limit: Optional[int] = None, cursor: Optional[str] = None,
+                                      loading: str = LOADING_PROFILE_JOINED) -> Tuple[List[UserMovie], Optional[str]]:
+        """
+        Retrieves one page of a user's UserMovie links ordered by movie ID, plus the cursor of the next page.
+        The page walks the (user_id, movie_id) index, so later pages cost the same as the first one.
+
+        Liefert eine Seite der UserMovie-Verknüpfungen eines Benutzers, sortiert nach Film-ID, plus den Cursor der nächsten Seite.
+        Die Seite durchläuft den (user_id, movie_id)-Index, daher kosten spätere Seiten so viel wie die erste.
+        """
+        try:
+            query = self._user_movie_relations_query(user_id, loading)
+            return self._keyset_page(query, f'user_movies:{user_id}', [UserMovie.movie_id], limit, cursor)
+        except SQLAlchemyError as e:
+            current_app.logger.error(f"Error fetching page of UserMovie relations for user {user_id}: {e}.")
+            # Error fetching page of UserMovie relations. / Fehler beim Abrufen einer Seite von Filmverknüpfungen.
+            return [], None
+
+    def get_user_movie_summaries_page(self, user_id: int, limit: Optional[int] = None,
+                                      cursor: Optional[str] = None) -> Tuple[List[UserMovieSummary], Optional[str]]:
+        """
+        Read-only variant of get_user_movie_relations_page for list endpoints: selects only the columns of
+        UserMovieSummary with one Core SELECT over the JOIN and returns __slots__ records instead of ORM entities.
+        Cursors are interchangeable with get_user_movie_relations_page.
+
+        Schreibgeschützte Variante von get_user_movie_relations_page für Listenendpunkte: selektiert nur die Spalten von
+        UserMovieSummary mit einem Core-SELECT über den JOIN und liefert __slots__-Datensätze statt ORM-Entitäten.
+        Cursor sind mit get_user_movie_relations_page austauschbar.
+        """
+        # UserMovie.movie_id stands in for Movie.id so SQLite can walk the (user_id, movie_id) index
+        # UserMovie.movie_id ersetzt Movie.id, damit SQLite den (user_id, movie_id)-Index durchlaufen kann
+        columns = [UserMovie.movie_id.label('id')] + [getattr(Movie, name) for name in MovieSummary.COLUMNS[1:]] + [UserMovie.user_rating]
+        query = (
+            select(*columns)
+            .select_from(UserMovie)
+            .join(Movie, Movie.id == UserMovie.movie_id)
+            .where(UserMovie.user_id == user_id)
+        )
+        try:
+            rows, next_cursor = self._keyset_page(query, f'user_movies:{user_id}', [UserMovie.movie_id], limit, cursor,
+                                                  cursor_attributes=['id'])
+            return [UserMovieSummary(*row) for row in rows], next_cursor
+        except SQLAlchemyError as e:
+            current_app.logger.error(f"Error fetching movie summaries for user {user_id}: {e}.")
+            # Error fetching movie summaries for user. / Fehler beim Abrufen der Filmübersicht des Benutzers.
+            return [], None
+
     def get_movie_by_id(self, movie_id: int) -> Optional[Movie]:
         """
         Retrieves a movie by its unique ID.
@@ -716,13 +1511,108 @@ class SQLiteDataManager(DataManagerInterface):
         if not isinstance(movie_id, int): # Basic type check
             current_app.logger.warning(f"Attempted to fetch movie with non-integer ID: {movie_id}.")
             return None
+        request_cache = self._request_cache()
+        if ('movie', movie_id) in request_cache:
+            return request_cache[('movie', movie_id)]
         try:
-            return Movie.query.get(movie_id)
+            movie = Movie.query.get(movie_id)
+            request_cache[('movie', movie_id)] = movie
+            return movie
         except SQLAlchemyError as e: # Should be rare for a simple get by PK
             current_app.logger.error(f"Error fetching movie by ID {movie_id}: {e}.")
             # Error fetching movie by ID {movie_id}: {e}. / Fehler beim Abrufen des Films nach ID {movie_id}: {e}.
             return None
 
+    def get_movie_fields(self, movie_id: int, fields: Sequence[str]) -> Optional[Row]:
+        """
+        Read-only projection of one movie: selects only the given columns with a Core SELECT instead of loading
+        the whole entity (including its long text columns). The result row exposes the columns as attributes.
+
+        Schreibgeschützte Projektion eines Films: selektiert nur die angegebenen Spalten mit einem Core-SELECT, statt
+        die ganze Entität (inkl. ihrer langen Textspalten) zu laden. Die Ergebniszeile bietet die Spalten als Attribute.
+
+        Args:
+            movie_id (int): ID des Films. / ID of the movie.
+            fields (sequence): Spaltennamen von Movie. / Column names of Movie.
+
+        Returns:
+            Row or None: Die Zeile, oder None, wenn der Film nicht existiert oder ein Fehler auftrat.
+                         The row, or None if the movie does not exist or an error occurred.
+
+        Raises:
+            ValueError: Bei einem unbekannten Spaltennamen. / For an unknown column name.
+        """
+        if not isinstance(movie_id, int):
+            current_app.logger.warning(f"Attempted to fetch movie fields with non-integer ID: {movie_id}.")
+            return None
+        columns = self._movie_columns(fields)
+        try:
+            return db.session.execute(select(*columns).where(Movie.id == movie_id)).first()
+        except SQLAlchemyError as e:
+            current_app.logger.error(f"Error fetching fields of movie {movie_id}: {e}.")
+            # Error fetching movie fields. / Fehler beim Abrufen der Filmfelder.
+            return None
+
+    def get_movie_fields_by_ids(self, movie_ids: Sequence[int], fields: Sequence[str]) -> List[Row]:
+        """
+        Like get_movie_fields, but for many movies in a single IN query. Unknown IDs are simply missing
+        from the result; the order is unspecified.
+
+        Wie get_movie_fields, aber für viele Filme in einer einzigen IN-Abfrage. Unbekannte IDs fehlen einfach
+        im Ergebnis; die Reihenfolge ist nicht festgelegt.
+
+        Raises:
+            ValueError: Bei einem unbekannten Spaltennamen. / For an unknown column name.
+        """
+        columns = self._movie_columns(fields)
+        if not movie_ids:
+            return []
+        try:
+            return db.session.execute(select(*columns).where(Movie.id.in_(movie_ids))).all()
+        except SQLAlchemyError as e:
+            current_app.logger.error(f"Error fetching fields of movies {list(movie_ids)}: {e}.")
+            # Error fetching movie fields. / Fehler beim Abrufen der Filmfelder.
+            return []
+
+    def iter_movie_field_batches(self, fields: Sequence[str], batch_size: int = 1000) -> Iterator[List[Row]]:
+        """
+        Streams the given columns of all movies, ordered by ID, in batches of up to `batch_size` rows. The SELECT
+        runs with yield_per, so the rows are fetched from the cursor batch by batch instead of being loaded at once;
+        memory use stays constant regardless of the catalog size. Errors are logged and end the iteration early.
+
+        Streamt die angegebenen Spalten aller Filme, sortiert nach ID, in Stapeln von bis zu `batch_size` Zeilen. Das
+        SELECT läuft mit yield_per, die Zeilen werden also stapelweise vom Cursor geholt statt auf einmal geladen;
+        der Speicherbedarf bleibt unabhängig von der Katalog-Größe konstant. Fehler werden geloggt und beenden die Iteration vorzeitig.
+
+        Raises:
+            ValueError: Bei einem unbekannten Spaltennamen (vor der ersten Abfrage). / For an unknown column name (before the first query).
+        """
+        columns = self._movie_columns(fields)
+        return self._iter_batches(select(*columns).order_by(Movie.id), batch_size)
+
+    def _iter_batches(self, query: Select, batch_size: int) -> Iterator[List[Row]]:
+        """
+        Yields the result of `query` in partitions of `batch_size` rows. / Liefert das Ergebnis von `query` in Partitionen zu `batch_size` Zeilen.
+        """
+        try:
+            result = db.session.execute(query.execution_options(yield_per=batch_size))
+            for batch in result.partitions():
+                yield batch
+        except SQLAlchemyError as e:
+            current_app.logger.error(f"Error streaming query results: {e}.")
+            # Error streaming query results. / Fehler beim Streamen der Abfrageergebnisse.
+
+    @staticmethod
+    def _movie_columns(fields: Sequence[str]) -> list:
+        """
+        Maps Movie column names to columns for Core projections. / Bildet Movie-Spaltennamen auf Spalten für Core-Projektionen ab.
+        """
+        column_names = inspect(Movie).column_attrs.keys()
+        unknown = [name for name in fields if name not in column_names]
+        if unknown or not fields:
+            raise ValueError(f"Invalid movie fields: {unknown or 'none given'}.")
+        return [getattr(Movie, name) for name in fields]
+
     def add_comment(self, movie_id: int, user_id: int, text: str) -> Optional[Comment]:
         """
         Adds a new comment to a movie by a specific user.
@@ -750,14 +1640,14 @@ class SQLiteDataManager(DataManagerInterface):
             return None
             
         try:
-            comment = Comment(movie_id=movie.id, user_id=user.id, text=comment_text)
-            db.session.add(comment)
-            db.session.commit()
+            with self._unit_of_work():
+                comment = Comment(movie_id=movie.id, user_id=user.id, text=comment_text)
+                db.session.add(comment)
+                self._invalidate(movie_tag(movie.id))
             current_app.logger.info(f"Comment (ID: {comment.id}) added by user {user_id} to movie {movie_id} ('{movie.title}').")
             # Comment added by user {user_id} to movie {movie_id}. / Kommentar von Benutzer {user_id} zu Film {movie_id} hinzugefügt.
             return comment
         except SQLAlchemyError as e:
-            db.session.rollback()
             current_app.logger.error(f"Error adding comment by user {user_id} to movie {movie_id}: {e}.")
             # Error adding comment. / Fehler beim Hinzufügen des Kommentars.
             return None
@@ -774,6 +1664,36 @@ class SQLiteDataManager(DataManagerInterface):
             # Error fetching all movies: {e}. / Fehler beim Abrufen aller Filme: {e}.
             return []
 
+    def get_movies_page(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> Tuple[List[Movie], Optional[str]]:
+        """
+        Retrieves one page of movies ordered by title (ties broken by ID), plus the cursor of the next page.
+        Liefert eine Seite von Filmen, sortiert nach Titel (bei Gleichstand nach ID), plus den Cursor der nächsten Seite.
+        """
+        try:
+            return self._keyset_page(Movie.query, 'movies', [Movie.title, Movie.id], limit, cursor)
+        except SQLAlchemyError as e:
+            current_app.logger.error(f"Error fetching page of movies: {e}.")
+            # Error fetching page of movies. / Fehler beim Abrufen einer Seite von Filmen.
+            return [], None
+
+    def get_movie_summaries_page(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> Tuple[List[MovieSummary], Optional[str]]:
+        """
+        Read-only variant of get_movies_page for list endpoints: selects only the columns of MovieSummary
+        with a Core SELECT and returns __slots__ records instead of ORM entities. Cursors are interchangeable
+        with get_movies_page.
+
+        Schreibgeschützte Variante von get_movies_page für Listenendpunkte: selektiert nur die Spalten von MovieSummary
+        mit einem Core-SELECT und liefert __slots__-Datensätze statt ORM-Entitäten. Cursor sind mit get_movies_page austauschbar.
+        """
+        query = select(*[getattr(Movie, name) for name in MovieSummary.COLUMNS])
+        try:
+            rows, next_cursor = self._keyset_page(query, 'movies', [Movie.title, Movie.id], limit, cursor)
+            return [MovieSummary(*row) for row in rows], next_cursor
+        except SQLAlchemyError as e:
+            current_app.logger.error(f"Error fetching movie summaries: {e}.")
+            # Error fetching movie summaries. / Fehler beim Abrufen der Filmübersicht.
+            return [], None
+
     def get_comments_for_movie(self, movie_id: int) -> List[Comment]:
         """
         Retrieves all comments for a specific movie, ordered by creation date (newest first).
@@ -794,6 +1714,22 @@ class SQLiteDataManager(DataManagerInterface):
             # Error fetching comments for movie {movie_id}: {e}. / Fehler beim Abrufen der Kommentare für Film {movie_id}: {e}.
             return []
 
+    def get_comments_for_movie_page(self, movie_id: int, limit: Optional[int] = None, cursor: Optional[str] = None) -> Tuple[List[Comment], Optional[str]]:
+        """
+        Retrieves one page of a movie's comments, newest first (ties broken by ID), plus the cursor of the next page.
+        Does not check that the movie exists; callers that need a 404 check it first.
+
+        Liefert eine Seite der Kommentare eines Films, neueste zuerst (bei Gleichstand nach ID), plus den Cursor der nächsten Seite.
+        Prüft nicht, ob der Film existiert; Aufrufer, die ein 404 benötigen, prüfen dies vorher.
+        """
+        try:
+            query = Comment.query.filter_by(movie_id=movie_id).options(selectinload(Comment.user)) # Author names in one IN query / Autorennamen in einer IN-Abfrage
+            return self._keyset_page(query, f'comments:{movie_id}', [Comment.created_at, Comment.id], limit, cursor, descending=True)
+        except SQLAlchemyError as e:
+            current_app.logger.error(f"Error fetching page of comments for movie {movie_id}: {e}.")
+            # Error fetching page of comments. / Fehler beim Abrufen einer Seite von Kommentaren.
+            return [], None
+
     def get_user_movie_link(self, user_id: int, movie_id: int) -> Optional[UserMovie]:
         """
         Retrieves the specific UserMovie link object between a user and a movie, if one exists.
@@ -802,6 +1738,9 @@ class SQLiteDataManager(DataManagerInterface):
         Liefert die spezifische UserMovie-Verknüpfung zwischen einem Benutzer und einem Film, falls eine existiert.
         Überprüft die Existenz von Benutzer und Film vor der Abfrage der Verknüpfung.
         """
+        request_cache = self._request_cache()
+        if ('link', user_id, movie_id) in request_cache:
+            return request_cache[('link', user_id, movie_id)]
         user = self.get_user_by_id(user_id)
         if not user:
             current_app.logger.warning(f"Cannot get UserMovie link: User {user_id} not found.")
@@ -811,7 +1750,9 @@ class SQLiteDataManager(DataManagerInterface):
             current_app.logger.warning(f"Cannot get UserMovie link: Movie {movie_id} not found.")
             return None
         try:
-            return UserMovie.query.filter_by(user_id=user_id, movie_id=movie_id).first()
+            user_movie_link = UserMovie.query.filter_by(user_id=user_id, movie_id=movie_id).first()
+            request_cache[('link', user_id, movie_id)] = user_movie_link
+            return user_movie_link
         except SQLAlchemyError as e:
             current_app.logger.error(f"Error fetching UserMovie link for user {user_id}, movie {movie_id}: {e}.")
             # Error fetching UserMovie link. / Fehler beim Abrufen der UserMovie-Verknüpfung.
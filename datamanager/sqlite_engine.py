@@ -0,0 +1,133 @@
+"""
+sqlite_engine.py
+Dieses Modul konfiguriert die SQLite-Engine über PRAGMAs, die bei jeder neuen Verbindung gesetzt werden.
+This module configures the SQLite engine via PRAGMAs that are applied on every new connection.
+
+Profil-Auswahl über die Umgebungsvariable SQLITE_PROFILE (dev, prod-read-heavy, bulk-import);
+einzelne PRAGMAs können über SQLITE_<PRAGMA> (z.B. SQLITE_MMAP_SIZE) überschrieben werden.
+Profile selection via the SQLITE_PROFILE environment variable (dev, prod-read-heavy, bulk-import);
+individual PRAGMAs can be overridden via SQLITE_<PRAGMA> (e.g. SQLITE_MMAP_SIZE).
+"""
+
+import os
+import re
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+DEFAULT_SQLITE_PROFILE = 'dev'
+
+# PRAGMA-Profile. busy_timeout steht vorne, da der Wechsel des journal_mode eine Sperre benötigt.
+# PRAGMA profiles. busy_timeout comes first, as switching the journal_mode needs a lock.
+SQLITE_PROFILES = {
+    # Local development: WAL so the dev server and CLI commands don't block each other
+    # Lokale Entwicklung: WAL, damit sich Dev-Server und CLI-Befehle nicht gegenseitig blockieren
+    'dev': {
+        'busy_timeout': 5000,
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'mmap_size': 0,
+        'cache_size': -2000, # Negative = KiB (2 MB) / Negativ = KiB (2 MB)
+        'temp_store': 'DEFAULT',
+        'foreign_keys': 'ON',
+    },
+    # Several gunicorn workers, mostly reads: readers never wait for the writer in WAL mode
+    # Mehrere Gunicorn-Worker, überwiegend Lesezugriffe: Leser warten im WAL-Modus nie auf den Schreiber
+    'prod-read-heavy': {
+        'busy_timeout': 5000,
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'mmap_size': 268435456, # 256 MB
+        'cache_size': -65536, # 64 MB
+        'temp_store': 'MEMORY',
+        'foreign_keys': 'ON',
+    },
+    # One-off imports: no fsync per commit, large cache; not crash-safe for the last transactions
+    # Einmalige Importe: kein fsync pro Commit, großer Cache; die letzten Transaktionen sind nicht absturzsicher
+    'bulk-import': {
+        'busy_timeout': 30000,
+        'journal_mode': 'WAL',
+        'synchronous': 'OFF',
+        'mmap_size': 268435456, # 256 MB
+        'cache_size': -262144, # 256 MB
+        'temp_store': 'MEMORY',
+        'foreign_keys': 'ON',
+    },
+}
+
+# Umgebungsvariablen zum Überschreiben einzelner PRAGMAs / Environment variables overriding single PRAGMAs
+PRAGMA_ENV_VARS = {
+    'busy_timeout': 'SQLITE_BUSY_TIMEOUT',
+    'journal_mode': 'SQLITE_JOURNAL_MODE',
+    'synchronous': 'SQLITE_SYNCHRONOUS',
+    'mmap_size': 'SQLITE_MMAP_SIZE',
+    'cache_size': 'SQLITE_CACHE_SIZE',
+    'temp_store': 'SQLITE_TEMP_STORE',
+    'foreign_keys': 'SQLITE_FOREIGN_KEYS',
+}
+
+_PRAGMA_VALUE_PATTERN = re.compile(r'^-?[A-Za-z0-9_]+$')
+
+def get_sqlite_pragmas(profile_name: str = None) -> dict:
+    """
+    Liefert die PRAGMAs des gewählten Profils inklusive Überschreibungen aus der Umgebung.
+    Returns the PRAGMAs of the selected profile including overrides from the environment.
+
+    Args:
+        profile_name (str, optional): Profilname; Standard ist SQLITE_PROFILE bzw. 'dev'.
+                                      Profile name; defaults to SQLITE_PROFILE or 'dev'.
+
+    Raises:
+        ValueError: Bei unbekanntem Profil oder ungültigem PRAGMA-Wert.
+                    For an unknown profile or an invalid PRAGMA value.
+    """
+    profile_name = profile_name or os.getenv('SQLITE_PROFILE', DEFAULT_SQLITE_PROFILE)
+    if profile_name not in SQLITE_PROFILES:
+        raise ValueError(f"Unknown SQLite profile '{profile_name}'. Expected one of {tuple(SQLITE_PROFILES)}.")
+
+    pragmas = dict(SQLITE_PROFILES[profile_name])
+    for pragma, env_var in PRAGMA_ENV_VARS.items():
+        override = os.getenv(env_var)
+        if override:
+            pragmas[pragma] = override.strip()
+
+    for pragma, value in pragmas.items():
+        # Values end up in the PRAGMA statement verbatim / Werte landen unverändert im PRAGMA-Statement
+        if not _PRAGMA_VALUE_PATTERN.match(str(value)):
+            raise ValueError(f"Invalid value '{value}' for SQLite PRAGMA {pragma}.")
+    return pragmas
+
+def register_sqlite_pragmas(engine: Engine, pragmas: dict) -> bool:
+    """
+    Registriert einen 'connect'-Event-Hook, der die PRAGMAs auf jeder neuen Verbindung setzt.
+    Registers a 'connect' event hook that applies the PRAGMAs on every new connection.
+    Für andere Datenbanken als SQLite passiert nichts. / Does nothing for non-SQLite databases.
+
+    Returns:
+        bool: True, wenn der Hook registriert wurde. / True if the hook was registered.
+    """
+    if engine.dialect.name != 'sqlite':
+        return False
+
+    @event.listens_for(engine, 'connect')
+    def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma, value in pragmas.items():
+                cursor.execute(f"PRAGMA {pragma}={value}")
+        finally:
+            cursor.close()
+
+    return True
+
+def init_sqlite_engine(app, db) -> None:
+    """
+    Wendet das konfigurierte SQLite-Profil auf die Engine der Flask-App an.
+    Muss nach db.init_app(app) und vor der ersten Datenbankverbindung aufgerufen werden.
+    Applies the configured SQLite profile to the Flask app's engine.
+    Must be called after db.init_app(app) and before the first database connection.
+    """
+    profile_name = app.config.get('SQLITE_PROFILE') or os.getenv('SQLITE_PROFILE', DEFAULT_SQLITE_PROFILE)
+    pragmas = get_sqlite_pragmas(profile_name)
+    with app.app_context():
+        if register_sqlite_pragmas(db.engine, pragmas):
+            app.logger.info(f"SQLite profile '{profile_name}' applied: {pragmas}")
@@ -0,0 +1,76 @@
+"""
+import_imdb.py
+Dieses Skript baut den lokalen Filmkatalog (Tabellen imdb_titles, imdb_names) aus den IMDb-Datensätzen auf.
+This script builds the local movie catalog (tables imdb_titles, imdb_names) from the IMDb datasets.
+
+Die Dateien (title.basics.tsv.gz, title.ratings.tsv.gz, title.crew.tsv.gz, name.basics.tsv.gz) von
+https://datasets.imdbws.com/ herunterladen und z.B. aufrufen mit:
+Download the files (title.basics.tsv.gz, title.ratings.tsv.gz, title.crew.tsv.gz, name.basics.tsv.gz) from
+https://datasets.imdbws.com/ and run e.g.:
+
+    SQLITE_PROFILE=bulk-import python import_imdb.py --dir ./imdb
+"""
+
+import argparse
+import os
+import time
+from flask import Flask
+from dotenv import load_dotenv
+from models import db
+from datamanager import imdb_import
+from datamanager.sqlite_engine import init_sqlite_engine
+
+# Umgebungsvariablen aus .env laden
+# Load environment variables from .env
+load_dotenv()
+
+app = Flask(__name__) # Eigene Flask-App-Instanz für dieses Skript
+app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URI', 'sqlite:///moviewebapp.db')
+app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+db.init_app(app)
+init_sqlite_engine(app, db)
+
+# (Argument, Standard-Dateiname, Importfunktion) in Importreihenfolge / (argument, default file name, import function) in import order
+DATASETS = (
+    ('basics', 'title.basics.tsv.gz', imdb_import.import_title_basics),
+    ('ratings', 'title.ratings.tsv.gz', imdb_import.import_title_ratings),
+    ('crew', 'title.crew.tsv.gz', imdb_import.import_title_crew),
+    ('names', 'name.basics.tsv.gz', imdb_import.import_name_basics),
+)
+
+def main():
+    parser = argparse.ArgumentParser(description='Import the IMDb datasets into the local movie catalog.')
+    parser.add_argument('--dir', help='Directory with the dataset files (default file names). / Verzeichnis mit den Dateien.')
+    for name, file_name, _import in DATASETS:
+        parser.add_argument(f'--{name}', help=f'Path to {file_name} (or the unzipped .tsv). / Pfad zu {file_name}.')
+    parser.add_argument('--title-types', default=','.join(sorted(imdb_import.DEFAULT_TITLE_TYPES)),
+                        help='Comma-separated title types to import (default: %(default)s).')
+    parser.add_argument('--chunk-size', type=int, default=imdb_import.DEFAULT_CHUNK_SIZE,
+                        help='Rows per transaction (default: %(default)s).')
+    args = parser.parse_args()
+
+    paths = {}
+    for name, file_name, _import in DATASETS:
+        path = getattr(args, name) or (os.path.join(args.dir, file_name) if args.dir else None)
+        if path and os.path.exists(path):
+            paths[name] = path
+        elif getattr(args, name):
+            parser.error(f'File not found: {path}')
+    if not paths:
+        parser.error('No dataset files given (use --dir or --basics/--ratings/--crew/--names).')
+
+    with app.app_context():
+        db.create_all() # imdb_titles, imdb_names (and the indexes of new tables) / (und die Indizes neuer Tabellen)
+        for name, _file_name, import_function in DATASETS:
+            if name not in paths:
+                continue
+            kwargs = {'chunk_size': args.chunk_size,
+                      'progress': lambda count, name=name: print(f'\r{name}: {count:,} rows', end='', flush=True)}
+            if name == 'basics':
+                kwargs['title_types'] = frozenset(args.title_types.split(','))
+            started = time.perf_counter()
+            count = import_function(paths[name], **kwargs)
+            print(f"\r{name}: {count:,} rows in {time.perf_counter() - started:.1f} s / {name}: {count:,} Zeilen")
+
+if __name__ == '__main__':
+    main()
@@ -7,7 +7,10 @@ This script initializes the database and creates all tables.
 import os
 from flask import Flask
 from dotenv import load_dotenv
+from sqlalchemy import inspect, text
 from models import db, User, Movie, UserMovie # UserMovie hinzugefügt, falls es für create_all benötigt wird, obwohl nicht direkt verwendet
+from datamanager.sqlite_data_manager import SQLiteDataManager
+from datamanager.sqlite_engine import init_sqlite_engine
 
 # Umgebungsvariablen aus .env laden
 # Load environment variables from .env
@@ -20,18 +23,89 @@ app = Flask(__name__) # Eigene Flask-App-Instanz für dieses Skript
 app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URI', 'sqlite:///moviewebapp.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
-# SQLAlchemy an die Flask-App anbinden
-# Bind SQLAlchemy to the Flask app
+# SQLAlchemy an die Flask-App anbinden (inkl. SQLite-Profil, z.B. SQLITE_PROFILE=bulk-import)
+# Bind SQLAlchemy to the Flask app (incl. SQLite profile, e.g. SQLITE_PROFILE=bulk-import)
 db.init_app(app)
+init_sqlite_engine(app, db)
+
+# Spalten, die nach der ersten Version hinzugefügt wurden (create_all ergänzt keine Spalten in bestehenden Tabellen)
+# Columns added after the first release (create_all does not add columns to existing tables)
+ADDED_COLUMNS = {
+    'movies': {
+        'community_rating_sum': 'FLOAT NOT NULL DEFAULT 0.0',
+        'last_refreshed_at': 'DATETIME', # NULL = never refreshed, first in line / NULL = nie aktualisiert, als Erstes an der Reihe
+    },
+}
+
+def upgrade_db() -> list:
+    """
+    Ergänzt fehlende Spalten in bestehenden Tabellen (z.B. einer älteren moviewebapp.db).
+    Adds missing columns to existing tables (e.g. an older moviewebapp.db).
+    Muss innerhalb eines App-Kontexts aufgerufen werden. / Must be called inside an app context.
+
+    Returns:
+        list: Hinzugefügte Spalten als "tabelle.spalte". / Added columns as "table.column".
+    """
+    inspector = inspect(db.engine)
+    added = []
+    with db.engine.begin() as connection:
+        for table_name, columns in ADDED_COLUMNS.items():
+            existing = {column['name'] for column in inspector.get_columns(table_name)}
+            for column_name, column_ddl in columns.items():
+                if column_name not in existing:
+                    connection.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_ddl}"))
+                    added.append(f"{table_name}.{column_name}")
+    return added
+
+def upgrade_indexes() -> list:
+    """
+    Legt fehlende, in models.py deklarierte Indizes in bestehenden Tabellen an.
+    Vor dem eindeutigen (user_id, movie_id)-Index werden doppelte UserMovie-Verknüpfungen entfernt
+    (die älteste Verknüpfung bleibt erhalten).
+    Creates indexes declared in models.py that are missing from existing tables.
+    Duplicate UserMovie links are removed (keeping the oldest) before the unique (user_id, movie_id) index is built.
+    Muss innerhalb eines App-Kontexts aufgerufen werden. / Must be called inside an app context.
+
+    Returns:
+        list: Namen der angelegten Indizes. / Names of the created indexes.
+    """
+    created = []
+    with db.engine.begin() as connection:
+        # sqlite_master statt Inspector, da Ausdrucks-Indizes nicht reflektiert werden
+        # sqlite_master instead of the inspector, as expression-based indexes are not reflected
+        existing = set(connection.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'")).scalars())
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                if index.name in existing:
+                    continue
+                if index.name == 'uq_user_movies_user_id_movie_id':
+                    connection.execute(text(
+                        "DELETE FROM user_movies WHERE id NOT IN "
+                        "(SELECT MIN(id) FROM user_movies GROUP BY user_id, movie_id)"
+                    ))
+                index.create(connection)
+                created.append(index.name)
+    return created
 
 def create_db():
     """
-    Erstellt alle Tabellen in der Datenbank, falls sie noch nicht existieren.
-    Creates all tables in the database if they do not already exist.
+    Erstellt alle Tabellen in der Datenbank, falls sie noch nicht existieren, und ergänzt fehlende Spalten und Indizes.
+    Creates all tables in the database if they do not already exist and adds missing columns and indexes.
     """
     with app.app_context(): # Wichtig: app_context hier verwenden
         db.create_all()
+        added_columns = upgrade_db()
+        created_indexes = upgrade_indexes()
         print("Datenbank und Tabellen wurden erfolgreich erstellt. / Database and tables have been successfully created.")
+        if added_columns:
+            print(f"Fehlende Spalten ergänzt / Added missing columns: {', '.join(added_columns)}")
+        if created_indexes:
+            print(f"Fehlende Indizes angelegt / Created missing indexes: {', '.join(created_indexes)}")
+        if 'movies.community_rating_sum' in added_columns or 'uq_user_movies_user_id_movie_id' in created_indexes:
+            # Laufende Bewertungssummen aus den vorhandenen Bewertungen (neu) befüllen
+            # (Re)fill the running rating sums from the existing ratings
+            updated = SQLiteDataManager().reconcile_community_ratings()
+            print(f"Community-Ratings abgeglichen / Community ratings reconciled: {updated}")
 
 if __name__ == '__main__':
     create_db() 
\ No newline at end of file
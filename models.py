@@ -27,6 +27,10 @@ class User(db.Model):
     def __repr__(self):
         return f"<User id={self.id} name={self.name}>"
 
+# Functional index for case-insensitive name lookups (login, duplicate check)
+# Funktionaler Index für Namenssuche ohne Groß-/Kleinschreibung (Login, Duplikatprüfung)
+db.Index('ix_users_name_lower', db.func.lower(User.name))
+
 class Movie(db.Model):
     """
     Movie
@@ -34,6 +38,10 @@ class Movie(db.Model):
     Represents a movie in the database.
     """
     __tablename__ = 'movies'
+    __table_args__ = (
+        db.Index('ix_movies_title', 'title'), # Catalog ordered by title (paging); the rowid breaks ties / Katalog nach Titel sortiert (Paging); die rowid entscheidet bei Gleichstand
+        db.Index('ix_movies_last_refreshed_at', 'last_refreshed_at'), # Stalest movies first for the OMDb refresh / Älteste Filme zuerst für die OMDb-Aktualisierung
+    )
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(255), nullable=False)
     original_title = db.Column(db.String(255), nullable=True)
@@ -50,12 +58,14 @@ class Movie(db.Model):
     poster_url = db.Column(db.String(255), nullable=True)
     community_rating = db.Column(db.Float, nullable=True) # Average community rating / Durchschnittliches Community-Rating
     community_rating_count = db.Column(db.Integer, default=0) # Number of ratings for the average / Anzahl der Bewertungen für den Durchschnitt
+    community_rating_sum = db.Column(db.Float, default=0.0, nullable=False) # Running sum of all ratings for the average / Laufende Summe aller Bewertungen für den Durchschnitt
     imdb_rating = db.Column(db.String(10), nullable=True)
     imdb_votes = db.Column(db.String(50), nullable=True)
     imdb_id = db.Column(db.String(20), nullable=True, unique=True) # IMDb ID für eindeutige Identifizierung
     metascore = db.Column(db.String(10), nullable=True)
     rated_omdb = db.Column(db.String(20), nullable=True) # MPAA rating from OMDb / MPAA-Bewertung von OMDb
     initial_omdb_rating = db.Column(db.Float, nullable=True) # Initiales, von OMDb übernommenes 5-Sterne-Rating
+    last_refreshed_at = db.Column(db.DateTime, nullable=True) # Last OMDb refresh of imdb_rating/imdb_votes/metascore / Letzte OMDb-Aktualisierung von imdb_rating/imdb_votes/metascore
 
     # Relationships / Beziehungen
     users = db.relationship('UserMovie', back_populates='movie', cascade="all, delete-orphan") # Users who have this movie in their list / Benutzer, die diesen Film in ihrer Liste haben
@@ -64,6 +74,10 @@ class Movie(db.Model):
     def __repr__(self):
         return f"<Movie id={self.id} title={self.title}>"
 
+# Functional index for case-insensitive lookups by title and year
+# Funktionaler Index für die Suche nach Titel (ohne Groß-/Kleinschreibung) und Jahr
+db.Index('ix_movies_title_lower_year', db.func.lower(Movie.title), Movie.year)
+
 class UserMovie(db.Model):
     """
     UserMovie
@@ -71,6 +85,11 @@ class UserMovie(db.Model):
     Connects users and movies (many-to-many relationship).
     """
     __tablename__ = 'user_movies'
+    __table_args__ = (
+        # One link per user and movie; also serves lookups by user_id / Eine Verknüpfung pro Benutzer und Film; dient auch der Suche nach user_id
+        db.Index('uq_user_movies_user_id_movie_id', 'user_id', 'movie_id', unique=True),
+        db.Index('ix_user_movies_movie_id', 'movie_id'), # Ratings and users per movie / Bewertungen und Benutzer pro Film
+    )
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     movie_id = db.Column(db.Integer, db.ForeignKey('movies.id'), nullable=False)
@@ -90,6 +109,10 @@ class Comment(db.Model):
     Represents a comment on a movie.
     """
     __tablename__ = 'comments'
+    __table_args__ = (
+        db.Index('ix_comments_movie_id_created_at', 'movie_id', 'created_at'), # Comments of a movie by date / Kommentare eines Films nach Datum
+        db.Index('ix_comments_user_id', 'user_id'), # Comments of a user / Kommentare eines Benutzers
+    )
     id = db.Column(db.Integer, primary_key=True)
     text = db.Column(db.Text, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -104,3 +127,74 @@ class Comment(db.Model):
 
     def __repr__(self):
         return f"<Comment id={self.id} user_id={self.user_id} movie_id={self.movie_id}>"
+
+class OmdbCacheEntry(db.Model):
+    """
+    OmdbCacheEntry
+    Persistenter Cache roher OMDb-Antworten, geteilt von allen OMDb-Aufrufern (siehe api/omdb_client.py).
+    Persistent cache of raw OMDb responses, shared by all OMDb callers (see api/omdb_client.py).
+    """
+    __tablename__ = 'omdb_cache'
+    # 'i:<imdb_id>:<plot>' or 't:<normalized title>:<year>:<plot>' / 'i:<imdb_id>:<plot>' oder 't:<normalisierter Titel>:<Jahr>:<plot>'
+    cache_key = db.Column(db.String(400), primary_key=True)
+    imdb_id = db.Column(db.String(20), nullable=True) # imdbID of the payload, if found / imdbID der Antwort, falls gefunden
+    payload = db.Column(db.Text, nullable=False) # Raw JSON body from OMDb / Roher JSON-Body von OMDb
+    found = db.Column(db.Boolean, nullable=False) # Response == 'True'; False for cached "not found" answers / False für gecachte "nicht gefunden"-Antworten
+    fetched_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<OmdbCacheEntry key={self.cache_key} found={self.found} fetched_at={self.fetched_at}>"
+
+class OmdbRefreshQuota(db.Model):
+    """
+    OmdbRefreshQuota
+    OMDb-Aufrufe der Hintergrund-Aktualisierung pro UTC-Tag und Pause nach "Request limit reached!", geteilt von allen
+    Prozessen und über Neustarts hinweg (siehe api/omdb_refresh.py).
+    OMDb calls of the background refresh per UTC day and the pause after "Request limit reached!", shared by all
+    processes and kept across restarts (see api/omdb_refresh.py).
+    """
+    __tablename__ = 'omdb_refresh_quota'
+    day = db.Column(db.Date, primary_key=True) # UTC day / UTC-Tag
+    calls = db.Column(db.Integer, nullable=False, default=0) # Calls used (reserved) on this day / An diesem Tag verbrauchte (reservierte) Aufrufe
+    paused_until = db.Column(db.DateTime, nullable=True) # UTC, set after "Request limit reached!" / UTC, gesetzt nach "Request limit reached!"
+
+    def __repr__(self):
+        return f"<OmdbRefreshQuota day={self.day} calls={self.calls} paused_until={self.paused_until}>"
+
+class ImdbTitle(db.Model):
+    """
+    ImdbTitle
+    Lokaler Filmkatalog aus den IMDb-Datensätzen title.basics, title.ratings und title.crew (siehe import_imdb.py).
+    Local movie catalog from the IMDb datasets title.basics, title.ratings and title.crew (see import_imdb.py).
+    """
+    __tablename__ = 'imdb_titles'
+    tconst = db.Column(db.String(20), primary_key=True) # IMDb ID, e.g. 'tt0111161' / IMDb-ID, z.B. 'tt0111161'
+    title_type = db.Column(db.String(20), nullable=False) # 'movie', 'tvMovie', ...
+    primary_title = db.Column(db.String(500), nullable=False)
+    original_title = db.Column(db.String(500), nullable=True)
+    start_year = db.Column(db.Integer, nullable=True)
+    runtime_minutes = db.Column(db.Integer, nullable=True)
+    genres = db.Column(db.String(255), nullable=True) # Comma-separated as in the dump / Kommagetrennt wie im Dump
+    average_rating = db.Column(db.Float, nullable=True) # 0-10 (title.ratings)
+    num_votes = db.Column(db.Integer, nullable=True) # (title.ratings)
+    directors = db.Column(db.Text, nullable=True) # Comma-separated nconsts (title.crew) / Kommagetrennte nconsts (title.crew)
+    writers = db.Column(db.Text, nullable=True) # Comma-separated nconsts (title.crew) / Kommagetrennte nconsts (title.crew)
+
+    def __repr__(self):
+        return f"<ImdbTitle tconst={self.tconst} title={self.primary_title} year={self.start_year}>"
+
+# Lookups by title (case-insensitive) and year, the most-voted title first / Suche nach Titel (ohne Groß-/Kleinschreibung) und Jahr, meistbewerteter Titel zuerst
+db.Index('ix_imdb_titles_title_lower_year', db.func.lower(ImdbTitle.primary_title), ImdbTitle.start_year)
+
+class ImdbName(db.Model):
+    """
+    ImdbName
+    Personennamen aus dem IMDb-Datensatz name.basics, für Regie und Drehbuch von ImdbTitle.
+    Person names from the IMDb dataset name.basics, for directors and writers of ImdbTitle.
+    """
+    __tablename__ = 'imdb_names'
+    nconst = db.Column(db.String(20), primary_key=True) # e.g. 'nm0000229' / z.B. 'nm0000229'
+    primary_name = db.Column(db.String(255), nullable=False)
+
+    def __repr__(self):
+        return f"<ImdbName nconst={self.nconst} name={self.primary_name}>"
@@ -0,0 +1,56 @@
+"""
+tests/conftest.py
+Gemeinsame Fixtures: die App mit einer leeren In-Memory-SQLite-Datenbank pro Test und ein Zähler für SQL-Anweisungen.
+Shared fixtures: the app with an empty in-memory SQLite database per test and a counter for SQL statements.
+"""
+
+import os
+
+# Vor dem Import der App setzen, die sie beim Import liest / Set before importing the app, which reads them on import
+os.environ['DATABASE_URI'] = 'sqlite://'
+os.environ['API_CACHE_BACKEND'] = 'memory'
+os.environ['OMDB_API_KEY'] = ''
+os.environ['OMDB_REFRESH_INTERVAL'] = '0'
+
+from contextlib import contextmanager
+from typing import Iterator, List
+import pytest
+from sqlalchemy import event
+from app import app as flask_app
+from models import db
+from api import routes
+
+@pytest.fixture
+def app():
+    flask_app.config.update(TESTING=True, WTF_CSRF_ENABLED=False)
+    with flask_app.app_context():
+        db.create_all()
+        yield flask_app
+        db.session.remove()
+        db.drop_all()
+    routes.cache.clear() # Cached API responses of the previous database / Gecachte API-Antworten der vorigen Datenbank
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+@pytest.fixture
+def count_statements(app):
+    """
+    Kontextmanager, der die ausgeführten SQL-Anweisungen in einer Liste sammelt.
+    Context manager collecting the executed SQL statements in a list.
+    """
+    @contextmanager
+    def counter() -> Iterator[List[str]]:
+        statements = []
+
+        def record(_connection, _cursor, statement, _parameters, _context, _executemany):
+            statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', record)
+        try:
+            yield statements
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', record)
+
+    return counter
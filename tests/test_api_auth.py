@@ -0,0 +1,48 @@
+"""
+tests/test_api_auth.py
+Schreibzugriffe auf eine Filmliste (einzeln und als Bulk) nur für den eingeloggten Benutzer selbst.
+Writes to a movie list (single and bulk) only for the logged-in user themselves.
+"""
+
+import pytest
+from models import db, User, Movie, UserMovie
+
+ADD_REQUESTS = (
+    ('/api/users/{id}/movies', {'title': 'Heat', 'year': 1995, 'director': 'Michael Mann', 'rating': 4.0}),
+    ('/api/users/{id}/movies/bulk', {'movies': [{'title': 'Heat', 'year': 1995, 'director': 'Michael Mann', 'rating': 4.0}]}),
+)
+
+@pytest.fixture
+def users(app):
+    owner, other = User(name='Owner'), User(name='Other')
+    # Without OMDb data only known movies can be added / Ohne OMDb-Daten lassen sich nur bekannte Filme hinzufügen
+    db.session.add_all([owner, other, Movie(title='Heat', year=1995, director='Michael Mann')])
+    db.session.commit()
+    return owner.id, other.id
+
+def log_in(client, user_id: int) -> None:
+    with client.session_transaction() as session:
+        session['user_id'] = user_id
+
+@pytest.mark.parametrize('path, payload', ADD_REQUESTS)
+def test_add_requires_login(client, users, path, payload):
+    owner_id, _other_id = users
+    response = client.post(path.format(id=owner_id), json=payload)
+    assert response.status_code == 401
+    assert UserMovie.query.count() == 0
+
+@pytest.mark.parametrize('path, payload', ADD_REQUESTS)
+def test_add_to_another_users_list_is_forbidden(client, users, path, payload):
+    owner_id, other_id = users
+    log_in(client, other_id)
+    response = client.post(path.format(id=owner_id), json=payload)
+    assert response.status_code == 403
+    assert UserMovie.query.count() == 0
+
+@pytest.mark.parametrize('path, payload', ADD_REQUESTS)
+def test_add_to_own_list(client, users, path, payload):
+    owner_id, _other_id = users
+    log_in(client, owner_id)
+    response = client.post(path.format(id=owner_id), json=payload)
+    assert response.status_code in (200, 201)
+    assert UserMovie.query.filter_by(user_id=owner_id).count() == 1
@@ -0,0 +1,149 @@
+"""
+tests/test_cache_backends.py
+Gemeinsames Verhalten beider CacheBackend-Implementierungen (LRUTTLCache, SQLiteCacheBackend) sowie die geteilte
+Datei und die Fehlerbehandlung des SQLite-Backends.
+Shared behaviour of both CacheBackend implementations (LRUTTLCache, SQLiteCacheBackend) plus the shared file and
+the error handling of the SQLite backend.
+"""
+
+import multiprocessing
+import sqlite3
+import pytest
+from api.cache import CachedResponse, LRUTTLCache, DEFAULT_TTL, SHARED_DEFAULT_TTL, create_cache_from_env
+from api.sqlite_cache import SQLiteCacheBackend
+
+def entry(body: bytes = b'{"success": true}') -> CachedResponse:
+    return CachedResponse(body, 200, 'application/json', encodings={'gzip': b'compressed'})
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def backend(request, tmp_path):
+    if request.param == 'memory':
+        return LRUTTLCache(max_entries=3)
+    # touch_interval=0: every hit refreshes the LRU position, like the memory backend / wie beim Memory-Backend
+    return SQLiteCacheBackend(str(tmp_path / 'cache.sqlite'), max_entries=3, touch_interval=0)
+
+def test_set_and_get(backend):
+    assert backend.set('movie:1', entry(), tags=['movie:1'])
+    cached = backend.get('movie:1')
+    assert (cached.body, cached.status, cached.content_type) == (b'{"success": true}', 200, 'application/json')
+    assert cached.etag == entry().etag
+    assert cached.encodings == {'gzip': b'compressed'}
+    assert backend.get('movie:2', 'missing') == 'missing'
+
+def test_expired_entries_are_misses_and_swept(backend):
+    backend.set('old', entry(), ttl=0)
+    backend.set('fresh', entry())
+    assert backend.get('old') is None
+    backend.sweep()
+    assert len(backend) == 1
+    assert backend.stats()['expirations'] >= 1
+
+def test_least_recently_used_entry_is_evicted(backend):
+    for key in ('a', 'b', 'c'):
+        backend.set(key, entry())
+    backend.get('a')
+    backend.set('d', entry())
+    assert backend.get('b') is None
+    assert all(backend.get(key) is not None for key in ('a', 'c', 'd'))
+    assert backend.stats()['evictions'] == 1
+
+def test_invalidate_tags(backend):
+    backend.set('movie:1', entry(), tags=['movie:1', 'catalog'])
+    backend.set('movie:2', entry(), tags=['movie:2', 'catalog'])
+    backend.set('user:1', entry(), tags=['user:1'])
+    assert backend.invalidate_tags(['catalog']) == 2
+    assert backend.get('movie:1') is None and backend.get('movie:2') is None
+    assert backend.get('user:1') is not None
+
+def test_stale_generation_is_not_stored(backend):
+    generation = backend.generation
+    backend.invalidate_tags(['movie:1']) # A commit while the response was computed / Ein Commit während der Berechnung
+    assert not backend.set('movie:1', entry(), generation=generation)
+    assert backend.get('movie:1') is None
+
+def test_delete_and_clear(backend):
+    backend.set('a', entry())
+    backend.set('b', entry())
+    assert backend.delete('a')
+    assert not backend.delete('a')
+    generation = backend.generation
+    backend.clear()
+    assert len(backend) == 0
+    assert backend.generation != generation
+
+def test_sqlite_file_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / 'cache.sqlite')
+    worker_a, worker_b = SQLiteCacheBackend(path), SQLiteCacheBackend(path)
+    worker_a.set('movie:1', entry(), tags=['movie:1'])
+    assert worker_b.get('movie:1').body == entry().body
+    generation = worker_a.generation
+    worker_b.invalidate_tags(['movie:1'])
+    assert worker_a.get('movie:1') is None
+    assert not worker_a.set('movie:1', entry(), generation=generation)
+
+def invalidate_in_child_process(backend, tags) -> None:
+    """
+    Invalidiert `tags` in einem eigenen (geforkten) Prozess, wie ein Schreibzugriff in einem anderen Worker.
+    Invalidates `tags` in a separate (forked) process, like a write in another worker.
+    """
+    process = multiprocessing.get_context('fork').Process(target=backend.invalidate_tags, args=(tags,))
+    process.start()
+    process.join(10)
+    assert process.exitcode == 0
+
+def test_sqlite_invalidation_reaches_other_processes(tmp_path):
+    backend = SQLiteCacheBackend(str(tmp_path / 'cache.sqlite'))
+    backend.set('movie:1', entry(), tags=['movie:1'])
+    invalidate_in_child_process(backend, ['movie:1'])
+    assert backend.get('movie:1') is None
+
+def test_memory_invalidation_stays_in_its_process():
+    # Other workers keep their entry until the TTL expires / Andere Worker behalten ihren Eintrag bis zum Ablauf der TTL
+    backend = LRUTTLCache()
+    backend.set('movie:1', entry(), tags=['movie:1'])
+    invalidate_in_child_process(backend, ['movie:1'])
+    assert backend.get('movie:1') is not None
+
+@pytest.mark.parametrize('name, ttl', [('memory', DEFAULT_TTL), ('sqlite', SHARED_DEFAULT_TTL)])
+def test_default_ttl_depends_on_backend(tmp_path, monkeypatch, name, ttl):
+    monkeypatch.setenv('API_CACHE_BACKEND', name)
+    monkeypatch.setenv('API_CACHE_PATH', str(tmp_path / 'cache.sqlite'))
+    monkeypatch.delenv('API_CACHE_TTL', raising=False)
+    assert create_cache_from_env().default_ttl == ttl
+    assert DEFAULT_TTL <= 300 # Bounds staleness across memory-backend workers / Begrenzt veraltete Antworten über Memory-Worker hinweg
+
+class FailingConnection:
+    """
+    Hüllt eine sqlite3-Verbindung und lässt Anweisungen mit `fail_on` scheitern (z.B. SQLITE_BUSY, Plattenfehler).
+    Wraps a sqlite3 connection and fails statements containing `fail_on` (e.g. SQLITE_BUSY, disk errors).
+    """
+
+    def __init__(self, connection: sqlite3.Connection, fail_on: str):
+        self.connection = connection
+        self.fail_on = fail_on
+
+    def execute(self, sql: str, *args):
+        if self.fail_on in sql:
+            raise sqlite3.OperationalError('disk I/O error')
+        return self.connection.execute(sql, *args)
+
+    def __getattr__(self, name):
+        return getattr(self.connection, name)
+
+@pytest.mark.parametrize('action, fail_on', [
+    (lambda backend: backend.delete('a'), 'DELETE FROM cache_entries WHERE key'),
+    (lambda backend: backend.clear(), 'DELETE FROM cache_entries'),
+    (lambda backend: backend.sweep(), 'WHERE expires_at <='),
+], ids=['delete', 'clear', 'sweep'])
+def test_sqlite_failed_write_rolls_back(tmp_path, action, fail_on):
+    backend = SQLiteCacheBackend(str(tmp_path / 'cache.sqlite'))
+    backend.set('a', entry())
+    connection = backend._connection()
+    backend._local.connection = FailingConnection(connection, fail_on)
+
+    action(backend) # Logged and swallowed / Geloggt und geschluckt
+
+    backend._local.connection = connection
+    assert not connection.in_transaction
+    assert backend.set('b', entry())
+    assert backend.get('a') is not None and backend.get('b') is not None
@@ -0,0 +1,56 @@
+"""
+tests/test_http_client.py
+Wiederholungen des gemeinsamen HTTP-Clients gegen einen lokalen Server: 5xx wird wiederholt, ein Read-Timeout nicht,
+und Retry-After ist auf HTTP_BACKOFF_MAX begrenzt.
+Retries of the shared HTTP client against a local server: 5xx is retried, a read timeout is not, and Retry-After is
+capped at HTTP_BACKOFF_MAX.
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import requests
+from urllib3.response import HTTPResponse
+from api import http_client
+
+class Handler(BaseHTTPRequestHandler):
+    hits = []
+
+    def do_GET(self):
+        self.hits.append(self.path)
+        if self.path == '/slow':
+            time.sleep(1)
+        self.send_response(503 if self.path == '/unavailable' else 200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *_args):
+        pass
+
+@pytest.fixture
+def server():
+    Handler.hits = []
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{httpd.server_port}'
+    httpd.shutdown()
+    httpd.server_close()
+
+def test_server_errors_are_retried(server):
+    response = http_client.get(f'{server}/unavailable', timeout=(1, 1))
+    assert response.status_code == 503
+    assert len(Handler.hits) == 1 + http_client.HTTP_MAX_RETRIES
+
+def test_read_timeout_is_not_retried(server):
+    started = time.monotonic()
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        http_client.get(f'{server}/slow', timeout=(1, 0.2))
+    assert Handler.hits == ['/slow']
+    assert time.monotonic() - started < 1
+
+@pytest.mark.parametrize('header, expected', [('120', http_client.HTTP_BACKOFF_MAX), ('2', 2.0), (None, None)])
+def test_retry_after_is_capped(header, expected):
+    retry = http_client._adapter(http_client.IDEMPOTENT_METHODS).max_retries
+    response = HTTPResponse(headers={'Retry-After': header} if header else {}, status=503)
+    assert retry.get_retry_after(response) == expected
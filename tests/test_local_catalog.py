@@ -0,0 +1,71 @@
+"""
+tests/test_local_catalog.py
+Der lokale IMDb-Katalog beim Hinzufügen und Nachschlagen eines Films: nur per IMDb-ID oder eindeutigem Titel/Jahr-Treffer, und die
+übergebenen Felder haben Vorrang vor denen des Katalogs.
+The local IMDb catalog when adding and looking up a movie: only by IMDb ID or a unique title/year match, and the submitted fields
+win over the catalog's.
+"""
+
+import pytest
+from models import db, User, Movie, ImdbTitle, ImdbName
+from datamanager.sqlite_data_manager import SQLiteDataManager
+from api import movie_lookup
+
+data_manager = SQLiteDataManager()
+
+@pytest.fixture
+def user_id(app):
+    user = User(name='Alice')
+    db.session.add_all([
+        user,
+        ImdbName(nconst='nm0898288', primary_name='Denis Villeneuve'),
+        ImdbTitle(tconst='tt1160419', title_type='movie', primary_title='Dune', start_year=2021, runtime_minutes=155,
+                  num_votes=900000, directors='nm0898288'),
+        ImdbTitle(tconst='tt0087182', title_type='movie', primary_title='Dune', start_year=1984, num_votes=180000),
+        # Two titles with the same name and year / Zwei Titel mit gleichem Namen und Jahr
+        ImdbTitle(tconst='tt0000001', title_type='movie', primary_title='Crash', start_year=2004, num_votes=500000),
+        ImdbTitle(tconst='tt0000002', title_type='movie', primary_title='Crash', start_year=2004, num_votes=100),
+    ])
+    db.session.commit()
+    return user.id
+
+def test_title_without_year_is_not_linked_to_the_most_voted_match(user_id):
+    assert data_manager.add_movie(user_id, 'Dune', 'Some Director', None, 4.0) is None
+    assert Movie.query.count() == 0
+
+def test_ambiguous_title_and_year_is_not_linked(user_id):
+    assert data_manager.add_movie(user_id, 'Crash', None, 2004, 4.0) is None
+    assert Movie.query.count() == 0
+
+def test_unique_title_and_year_fills_only_missing_fields(user_id):
+    movie = data_manager.add_movie(user_id, 'dune', 'Someone Else', 2021, 4.0)
+    assert movie.imdb_id == 'tt1160419'
+    assert movie.director == 'Someone Else' # Submitted field wins / Übergebenes Feld hat Vorrang
+    assert movie.runtime == '155 min' # Filled from the catalog / Aus dem Katalog ergänzt
+
+def test_submitted_omdb_fields_win_over_the_catalog(user_id):
+    movie = data_manager.add_movie(user_id, 'Dune: Part One', 'Someone Else', 2021, 4.0, runtime='156 min',
+                                   imdb_id='tt1160419')
+    assert (movie.title, movie.director, movie.runtime) == ('Dune: Part One', 'Someone Else', '156 min')
+
+def test_merge_ignores_empty_submitted_fields():
+    merged = SQLiteDataManager.merge_local_catalog_entry({'Director': 'Denis Villeneuve', 'Runtime': '155 min'},
+                                                          {'Director': 'N/A', 'Runtime': None, 'Plot': 'Spice.'})
+    assert merged == {'Director': 'Denis Villeneuve', 'Runtime': '155 min', 'Plot': 'Spice.'}
+
+@pytest.mark.parametrize('title, year', [('Dune', None), ('Crash', 2004)], ids=['without-year', 'ambiguous'])
+def test_lookup_falls_through_to_omdb_without_a_unique_match(user_id, monkeypatch, title, year):
+    calls = []
+
+    def fetch_omdb(**kwargs):
+        calls.append(kwargs)
+        return {'Response': 'True', 'Title': title, 'imdbID': 'tt9999999'}
+
+    monkeypatch.setattr(movie_lookup, 'fetch_omdb', fetch_omdb)
+    assert movie_lookup.lookup_movie(title=title, year=year)['imdbID'] == 'tt9999999'
+    assert calls == [{'title': title, 'imdb_id': None, 'year': str(year) if year else None, 'plot': 'short'}]
+
+def test_lookup_uses_a_unique_catalog_match(user_id, monkeypatch):
+    monkeypatch.setattr(movie_lookup, 'fetch_omdb', lambda **kwargs: {'Response': 'True', 'Poster': 'dune.jpg'})
+    movie = movie_lookup.lookup_movie(title='Dune', year=2021)
+    assert (movie['imdbID'], movie['Runtime'], movie['Poster']) == ('tt1160419', '155 min', 'dune.jpg')
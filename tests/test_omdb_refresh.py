@@ -0,0 +1,104 @@
+"""
+tests/test_omdb_refresh.py
+Hintergrund-Aktualisierung: nur "nicht gefunden" wird als solches verbucht, jeder andere OMDb-Fehler beendet den
+Block und lässt den Film unverändert; Tageskontingent und Pause gelten über Neustarts des Prozesses hinweg.
+Background refresh: only "not found" is recorded as such, any other OMDb error stops the batch and leaves the movie
+untouched; the daily quota and the pause hold across process restarts.
+"""
+
+import pytest
+from datetime import datetime
+from models import db, User, Movie, OmdbRefreshQuota
+from datamanager.sqlite_data_manager import SQLiteDataManager
+from api import omdb_refresh
+
+@pytest.fixture
+def movies(app, monkeypatch):
+    restart_process(monkeypatch)
+    db.session.add_all([Movie(title='Heat', year=1995, imdb_id='tt0113277', imdb_rating='8.3'),
+                        Movie(title='Dune', year=2021, imdb_id='tt1160419', imdb_rating='8.0')])
+    db.session.commit()
+
+def restart_process(monkeypatch) -> None:
+    """
+    Frischer, voller Token-Bucket wie nach einem Neustart des Workers. / Fresh, full token bucket as after a worker restart.
+    """
+    monkeypatch.setattr(omdb_refresh, '_quota', omdb_refresh._TokenBucket(500, capacity=50))
+
+def calls_today() -> int:
+    return sum(row.calls for row in OmdbRefreshQuota.query.all())
+
+def answer(payloads: dict):
+    """
+    Ersetzt fetch_omdb durch feste Antworten je IMDb-ID. / Replaces fetch_omdb with fixed answers per IMDb ID.
+    """
+    def fetch_omdb(imdb_id=None, **_kwargs):
+        return payloads[imdb_id]
+    return fetch_omdb
+
+def refreshed_at(imdb_id: str):
+    db.session.expire_all()
+    return Movie.query.filter_by(imdb_id=imdb_id).one().last_refreshed_at
+
+def test_not_found_is_recorded_and_stamped(movies, monkeypatch):
+    monkeypatch.setattr(omdb_refresh, 'fetch_omdb', answer({
+        'tt0113277': {'Response': 'False', 'Error': 'Incorrect IMDb ID.'},
+        'tt1160419': {'Response': 'True', 'imdbRating': '8.1', 'imdbVotes': '900,000', 'Metascore': '74'},
+    }))
+    result = omdb_refresh.refresh_stale_movies()
+    assert (result['checked'], result['updated'], result['not_found'], result['stopped']) == (2, 2, 1, None)
+    assert refreshed_at('tt0113277') is not None
+    assert Movie.query.filter_by(imdb_id='tt0113277').one().imdb_rating == '8.3'
+
+@pytest.mark.parametrize('error', ['Invalid API key!', 'Something went wrong.'])
+def test_other_errors_stop_the_batch_and_leave_the_movie_untouched(movies, monkeypatch, error):
+    monkeypatch.setattr(omdb_refresh, 'fetch_omdb', answer({
+        'tt0113277': {'Response': 'False', 'Error': error},
+        'tt1160419': {'Response': 'True', 'imdbRating': '8.1'},
+    }))
+    result = omdb_refresh.refresh_stale_movies()
+    assert (result['checked'], result['not_found'], result['stopped']) == (0, 0, 'error')
+    assert refreshed_at('tt0113277') is None
+    assert refreshed_at('tt1160419') is None
+
+def test_daily_quota_holds_across_restarts(movies, monkeypatch):
+    monkeypatch.setattr(omdb_refresh, 'OMDB_REFRESH_DAILY_QUOTA', 1)
+    monkeypatch.setattr(omdb_refresh, 'fetch_omdb', lambda **_kwargs: {'Response': 'True', 'imdbRating': '8.1'})
+    assert omdb_refresh.refresh_stale_movies()['checked'] == 1
+    restart_process(monkeypatch)
+    result = omdb_refresh.refresh_stale_movies()
+    assert (result['checked'], result['stopped']) == (0, 'quota')
+    assert calls_today() == 1
+
+def test_limit_reached_pause_holds_across_restarts(movies, monkeypatch):
+    monkeypatch.setattr(omdb_refresh, 'fetch_omdb', answer({
+        'tt0113277': {'Response': 'False', 'Error': 'Request limit reached!'},
+        'tt1160419': {'Response': 'False', 'Error': 'Request limit reached!'},
+    }))
+    assert omdb_refresh.refresh_stale_movies()['stopped'] == 'quota'
+    restart_process(monkeypatch)
+    assert omdb_refresh.refresh_stale_movies()['stopped'] == 'paused'
+    assert omdb_refresh.stats()['paused_for'] > 0
+
+def test_unused_reservation_is_released(movies, monkeypatch):
+    monkeypatch.setattr(omdb_refresh, 'fetch_omdb', answer({
+        'tt0113277': {'Response': 'False', 'Error': 'Invalid API key!'},
+        'tt1160419': {'Response': 'False', 'Error': 'Invalid API key!'},
+    }))
+    omdb_refresh.refresh_stale_movies()
+    assert calls_today() == 1
+
+def test_new_movies_without_a_live_fetch_are_refreshed_first(app):
+    data_manager = SQLiteDataManager()
+    user = User(name='Alice')
+    db.session.add(user)
+    db.session.commit()
+    # Form data (e.g. from an old omdb_cache row) / Formulardaten (z.B. aus einer alten omdb_cache-Zeile)
+    movie = data_manager.add_movie(user.id, 'Heat', 'Michael Mann', 1995, 4.0, imdb_id='tt0113277',
+                                   omdb_rating_for_community=4.1)
+    assert movie.last_refreshed_at is None
+    assert [row.imdb_id for row in data_manager.get_stale_movies(10, datetime.utcnow())] == ['tt0113277']
+
+    fetched_at = datetime(2026, 1, 1, 12, 0)
+    live = data_manager.add_movie_globally({'Title': 'Dune', 'Year': '2021', 'imdbID': 'tt1160419'}, refreshed_at=fetched_at)
+    assert live.last_refreshed_at == fetched_at
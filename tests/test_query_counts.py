@@ -0,0 +1,110 @@
+"""
+tests/test_query_counts.py
+Anzahl der SQL-Anweisungen der Benutzer-Filmlisten: konstant, unabhängig von der Länge der Liste (kein N+1).
+Number of SQL statements of the user movie lists: constant, regardless of the list length (no N+1).
+"""
+
+import pytest
+from sqlalchemy import inspect
+from models import db, User, Movie, UserMovie
+from datamanager.sqlite_data_manager import SQLiteDataManager
+
+# Statements per request: the user, then links and movies in one JOIN / Anweisungen pro Anfrage: der Benutzer, dann Verknüpfungen und Filme in einem JOIN
+MAX_LIST_STATEMENTS = 2
+
+LIST_PATHS = ('/users/{id}', '/api/users/{id}', '/api/users/{id}/movies')
+
+def create_user_with_movies(name: str, count: int) -> int:
+    user = User(name=name)
+    db.session.add(user)
+    db.session.flush()
+    for number in range(count):
+        movie = Movie(title=f'{name} movie {number}', year=2000, director='Director')
+        db.session.add(movie)
+        db.session.flush()
+        db.session.add(UserMovie(user_id=user.id, movie_id=movie.id, user_rating=3.0))
+    db.session.commit()
+    return user.id
+
+@pytest.mark.parametrize('path', LIST_PATHS)
+def test_list_statement_count_does_not_grow_with_list_size(client, count_statements, path):
+    small_user = create_user_with_movies('small', 3)
+    large_user = create_user_with_movies('large', 50)
+    db.session.expunge_all() # Nothing from seeding in the identity map / Nichts aus dem Seeding in der Identity Map
+
+    counts = []
+    for user_id in (small_user, large_user):
+        with count_statements() as statements:
+            response = client.get(path.format(id=user_id))
+        assert response.status_code == 200
+        counts.append(len(statements))
+
+    assert counts[0] == counts[1]
+    assert counts[1] <= MAX_LIST_STATEMENTS
+
+@pytest.mark.parametrize('loading, expected', [
+    (SQLiteDataManager.LOADING_PROFILE_JOINED, 2),   # user + JOIN
+    (SQLiteDataManager.LOADING_PROFILE_SELECTIN, 3), # user + links + one IN query for the movies
+])
+def test_eager_loading_profiles(app, count_statements, loading, expected):
+    user_id = create_user_with_movies('eager', 20)
+    db.session.expunge_all()
+
+    with count_statements() as statements:
+        relations = SQLiteDataManager().get_user_movie_relations(user_id, loading=loading)
+        titles = [relation.movie.title for relation in relations]
+
+    assert len(titles) == 20
+    assert len(statements) == expected
+
+def test_lazy_loading_profile_issues_one_statement_per_entry(app, count_statements):
+    user_id = create_user_with_movies('lazy', 20)
+    db.session.expunge_all()
+
+    with count_statements() as statements:
+        relations = SQLiteDataManager().get_user_movie_relations(user_id, loading=SQLiteDataManager.LOADING_PROFILE_LAZY)
+        [relation.movie.title for relation in relations]
+
+    assert len(statements) == 2 + 20
+
+def test_unknown_loading_profile_is_rejected(app):
+    user_id = create_user_with_movies('unknown', 1)
+    with pytest.raises(ValueError):
+        SQLiteDataManager().get_user_movie_relations(user_id, loading='eager')
+
+def log_in(client, user_id: int) -> None:
+    with client.session_transaction() as session:
+        session['user_id'] = user_id
+
+def test_static_files_do_not_query(client, count_statements):
+    create_user_with_movies('static', 1)
+    with count_statements() as statements:
+        response = client.get('/static/css/style.css')
+    assert response.status_code == 200
+    assert statements == []
+
+def test_action_reuses_request_cache_after_commit(client, count_statements):
+    user_id = create_user_with_movies('owner', 0)
+    movie = Movie(title='Reused', year=2001)
+    db.session.add(movie)
+    db.session.commit()
+    movie_id = movie.id
+    db.session.expunge_all()
+    log_in(client, user_id)
+
+    with count_statements() as statements:
+        response = client.post(f'/user/add_movie_to_list/{movie_id}')
+
+    assert response.status_code == 302
+    assert UserMovie.query.filter_by(user_id=user_id, movie_id=movie_id).count() == 1
+    # g.user, movie and link are looked up once; neither g.user nor the movie are re-SELECTed after the commit
+    # g.user, Film und Verknüpfung werden einmal gesucht; g.user und Film werden nach dem Commit nicht erneut geladen
+    assert len([statement for statement in statements if statement.lstrip().startswith('SELECT')]) <= 3
+
+def test_commit_outside_a_request_expires_objects(app):
+    user_id = create_user_with_movies('cli', 1)
+    movie = Movie.query.filter_by(title='cli movie 0').one()
+
+    assert SQLiteDataManager().update_user_rating_for_movie(user_id, movie.id, 5.0)
+
+    assert inspect(movie).expired_attributes # CLI commands and background jobs see fresh state / CLI-Befehle und Hintergrund-Jobs sehen frischen Zustand
@@ -0,0 +1,96 @@
+"""
+tests/test_query_plans.py
+EXPLAIN QUERY PLAN für die häufigen DataManager-Abfragen: Jede muss ihren Index nutzen statt die Tabelle zu durchsuchen.
+EXPLAIN QUERY PLAN for the hot DataManager queries: each must use its index instead of scanning the table.
+"""
+
+import re
+from datetime import datetime
+import pytest
+from sqlalchemy import event
+from models import db, User, Movie, UserMovie, Comment, ImdbTitle
+from datamanager.sqlite_data_manager import SQLiteDataManager
+
+data_manager = SQLiteDataManager()
+
+# A plan line like "SCAN movies" (no index at all) / Eine Planzeile wie "SCAN movies" (ganz ohne Index)
+FULL_SCAN = re.compile(r'^SCAN \w+$')
+
+@pytest.fixture
+def seeded(app):
+    user = User(name='Alice')
+    movie = Movie(title='Dune', year=2021, imdb_id='tt1160419')
+    db.session.add_all([user, movie, ImdbTitle(tconst='tt1160419', title_type='movie', primary_title='Dune',
+                                               start_year=2021, num_votes=900000)])
+    db.session.flush()
+    db.session.add_all([UserMovie(user_id=user.id, movie_id=movie.id, user_rating=4.0),
+                        Comment(user_id=user.id, movie_id=movie.id, text='Great')])
+    db.session.commit()
+    return user.id, movie.id
+
+def query_plans(action) -> dict:
+    """
+    Führt `action` aus und liefert für jede SELECT-, UPDATE- und DELETE-Anweisung die Zeilen ihres Abfrageplans.
+    Runs `action` and returns the lines of the query plan of every SELECT, UPDATE and DELETE statement.
+    """
+    executed = []
+
+    def record(_connection, _cursor, statement, parameters, _context, executemany):
+        if not executemany and statement.lstrip().split(None, 1)[0].upper() in ('SELECT', 'UPDATE', 'DELETE'):
+            executed.append((statement, parameters))
+
+    event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        action()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record)
+
+    cursor = db.session.connection().connection.cursor()
+    return {statement: [row[3] for row in cursor.execute(f'EXPLAIN QUERY PLAN {statement}', parameters)]
+            for statement, parameters in executed}
+
+def assert_uses_index(plans: dict, index_name: str, allowed_scans: tuple = ()) -> None:
+    lines = [line for plan in plans.values() for line in plan]
+    assert any(f'USING INDEX {index_name}' in line or f'USING COVERING INDEX {index_name}' in line for line in lines), plans
+    full_scans = [line for line in lines if FULL_SCAN.match(line) and line.split()[1] not in allowed_scans]
+    assert not full_scans, plans
+
+def test_user_by_name_uses_lowercase_index(seeded):
+    assert_uses_index(query_plans(lambda: data_manager.get_user_by_name('ALICE')), 'ix_users_name_lower')
+
+def test_user_movie_link_uses_unique_index(seeded):
+    user_id, movie_id = seeded
+    assert_uses_index(query_plans(lambda: data_manager.get_user_movie_link(user_id, movie_id)),
+                      'uq_user_movies_user_id_movie_id')
+
+def test_user_movie_relations_use_unique_index(seeded):
+    user_id, _movie_id = seeded
+    assert_uses_index(query_plans(lambda: data_manager.get_user_movie_relations(user_id)),
+                      'uq_user_movies_user_id_movie_id')
+
+def test_comments_for_movie_use_movie_created_at_index(seeded):
+    _user_id, movie_id = seeded
+    assert_uses_index(query_plans(lambda: data_manager.get_comments_for_movie(movie_id)),
+                      'ix_comments_movie_id_created_at')
+
+def test_movie_by_title_and_year_uses_lowercase_index(seeded):
+    user_id, _movie_id = seeded
+    # Found by title and year, nothing is created / Über Titel und Jahr gefunden, nichts wird angelegt
+    assert_uses_index(query_plans(lambda: data_manager.add_movie(user_id, 'DUNE', None, 2021, 5.0)),
+                      'ix_movies_title_lower_year')
+
+def test_community_rating_reconciliation_uses_movie_index(seeded):
+    # Every movie is updated, so scanning movies is expected / Jeder Film wird aktualisiert, der Scan von movies ist gewollt
+    assert_uses_index(query_plans(data_manager.reconcile_community_ratings), 'ix_user_movies_movie_id',
+                      allowed_scans=('movies',))
+
+def test_catalog_page_uses_title_index(seeded):
+    assert_uses_index(query_plans(lambda: data_manager.get_movie_summaries_page(limit=10)), 'ix_movies_title')
+
+def test_local_catalog_title_lookup_uses_lowercase_index(seeded):
+    assert_uses_index(query_plans(lambda: data_manager.get_local_catalog_entry(title='dune', year=2021)),
+                      'ix_imdb_titles_title_lower_year')
+
+def test_stale_movies_use_last_refreshed_index(seeded):
+    assert_uses_index(query_plans(lambda: data_manager.get_stale_movies(10, datetime.utcnow())),
+                      'ix_movies_last_refreshed_at')